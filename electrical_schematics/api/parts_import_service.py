@@ -7,6 +7,7 @@ This service coordinates:
 """
 
 import logging
+import re
 from pathlib import Path
 from typing import Optional, List, Callable, Tuple
 from dataclasses import dataclass, field
@@ -586,8 +587,6 @@ class PartsImportService:
 
     def _extract_voltage(self, technical_data: str) -> Optional[str]:
         """Extract voltage rating from technical data string."""
-        import re
-
         # Common voltage patterns
         patterns = [
             r'(\d+)\s*VDC',
@@ -1278,7 +1278,7 @@ class MainWindow(QMainWindow):
             )
 
             # Add to diagram
-            self.diagram.components.append(component)
+            self.diagram.add_component(component)
 
             # Update PDF overlays immediately
             self.pdf_viewer.set_component_overlays(self.diagram.components, [])
@@ -1346,6 +1346,9 @@ class MainWindow(QMainWindow):
             component.state = dialog.state_combo.currentData()
             component.normally_open = dialog.normally_open_check.isChecked()
 
+            # Designation may have changed
+            self.diagram.reindex()
+
             # Update PDF overlays
             self.pdf_viewer.set_component_overlays(self.diagram.components, [])
 
@@ -1528,7 +1531,7 @@ class MainWindow(QMainWindow):
             )
 
         # Add wire to diagram
-        self.diagram.wires.append(wire)
+        self.diagram.add_wire(wire)
 
         # Mark as modified and enable save
         self.project_modified = True
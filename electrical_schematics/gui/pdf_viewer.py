@@ -1,11 +1,13 @@
 """Interactive PDF viewer widget with annotation support."""
 
 from typing import Optional, List, Dict, Tuple
+import numpy as np
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QScrollArea, QMenu
-from PySide6.QtCore import Qt, Signal, QPoint, QRect, QRectF, QPointF
+from PySide6.QtCore import Qt, Signal, QPoint, QRect, QRectF, QPointF, QTimer
 from PySide6.QtGui import (
     QPainter, QPen, QColor, QPixmap, QMouseEvent, QBrush,
-    QDragEnterEvent, QDragMoveEvent, QDropEvent, QKeyEvent, QFont, QAction
+    QDragEnterEvent, QDragMoveEvent, QDropEvent, QKeyEvent, QFont, QAction,
+    QPolygonF
 )
 from electrical_schematics.pdf import PDFRenderer
 from electrical_schematics.models import IndustrialComponent, Wire
@@ -13,9 +15,25 @@ from electrical_schematics.gui.wire_tool import WireDrawingTool, WireType
 import json
 
 
+# Overlay colors by component state
+_SELECTED_FILL = QColor(255, 255, 0, 100)  # Semi-transparent yellow
+_SELECTED_BORDER = QColor(255, 200, 0, 255)
+_SELECTED_TEXT_BG = QColor(255, 200, 0, 220)  # Yellow background for text
+_HOVERED_FILL = QColor(52, 152, 219, 60)  # Semi-transparent blue
+_HOVERED_BORDER = QColor(52, 152, 219, 255)
+_ENERGIZED_FILL = QColor(0, 255, 0, 60)  # Semi-transparent green
+_ENERGIZED_BORDER = QColor(0, 200, 0, 200)
+_ENERGIZED_TEXT_BG = QColor(39, 174, 96, 220)  # Green background
+_DE_ENERGIZED_FILL = QColor(255, 0, 0, 40)  # Semi-transparent red
+_DE_ENERGIZED_BORDER = QColor(200, 0, 0, 150)
+_DE_ENERGIZED_TEXT_BG = QColor(231, 76, 60, 220)  # Red background
+
+
 class ComponentOverlay:
     """Represents a visual overlay for a component on a specific page."""
 
+    __slots__ = ('component', 'is_energized', 'page', 'rect')
+
     def __init__(
         self,
         component: IndustrialComponent,
@@ -65,11 +83,24 @@ class PDFViewer(QWidget):
         self.zoom_level = 1.0
         self.pixmap: Optional[QPixmap] = None
 
+        # Repaint coalescing (see _schedule_update)
+        self._update_pending = False
+
         # Annotation state (removed - components are drag-drop only)
         self.annotations: List[QRect] = []
 
         # Component overlays for simulation visualization
         self.component_overlays: List[ComponentOverlay] = []
+        self._overlays_by_id: Dict[str, ComponentOverlay] = {}
+        # Per-page overlays plus a lazily built (N, 4) array of their
+        # x0, y0, x1, y1 bounds for vectorized hit testing
+        self._page_overlays: Dict[int, List[ComponentOverlay]] = {}
+        self._page_rects: Dict[int, np.ndarray] = {}
+        # (page, component_id -> terminal positions) for the wire tool
+        self._terminal_positions_cache: Optional[Tuple[int, Dict[str, List[QPointF]]]] = None
+        # Per-page overlays split by energization state for batched painting
+        self._energized_overlays_by_page: Dict[int, List[ComponentOverlay]] = {}
+        self._de_energized_overlays_by_page: Dict[int, List[ComponentOverlay]] = {}
         self.show_overlays = True
 
         # Component selection
@@ -194,10 +225,9 @@ class PDFViewer(QWidget):
 
             # Check energization state for display
             energized_status = "Unknown"
-            for overlay in self.component_overlays:
-                if overlay.component.id == component.id:
-                    energized_status = "Energized" if overlay.is_energized else "De-energized"
-                    break
+            overlay = self._overlays_by_id.get(component.id)
+            if overlay:
+                energized_status = "Energized" if overlay.is_energized else "De-energized"
 
             status_action = QAction(f"Status: {energized_status}", self)
             status_action.setEnabled(False)
@@ -276,6 +306,22 @@ class PDFViewer(QWidget):
         if self.pixmap:
             self._update_display()
 
+    def _schedule_update(self) -> None:
+        """Schedule a repaint on the next event-loop iteration.
+
+        Several setters called back to back (overlays, wires, selection)
+        collapse into a single _update_display call.
+        """
+        if self._update_pending:
+            return
+        self._update_pending = True
+        QTimer.singleShot(0, self._do_scheduled_update)
+
+    def _do_scheduled_update(self) -> None:
+        """Run a repaint previously requested by _schedule_update."""
+        self._update_pending = False
+        self._update_display()
+
     def _update_display(self) -> None:
         """Update the displayed image with annotations."""
         if not self.pixmap:
@@ -289,9 +335,7 @@ class PDFViewer(QWidget):
 
         # Draw component overlays (simulation state)
         if self.show_overlays:
-            for overlay in self.component_overlays:
-                if overlay.page == self.current_page:
-                    self._draw_component_overlay(painter, overlay)
+            self._draw_component_overlays(painter)
 
         # Draw wires
         if self.show_wires:
@@ -305,119 +349,128 @@ class PDFViewer(QWidget):
 
         self.pdf_label.setPixmap(display_pixmap)
 
-    def _draw_component_overlay(self, painter: QPainter, overlay: ComponentOverlay) -> None:
-        """Draw a component overlay on the PDF.
+    def _draw_component_overlays(self, painter: QPainter) -> None:
+        """Draw all component overlays for the current page.
+
+        Overlays are drawn in passes (rectangles, label backgrounds, label
+        text, terminals) over the energized/de-energized buckets built in
+        set_component_overlays, so pen and brush change once per bucket
+        rather than once per overlay. Selected and hovered overlays are
+        drawn after their bucket so they stay on top.
 
         Args:
             painter: Qt painter
-            overlay: Component overlay to draw
         """
-        # Convert PDF coordinates to screen coordinates
-        rect = QRectF(
-            overlay.rect.x() * self.zoom_level * 2,
-            overlay.rect.y() * self.zoom_level * 2,
-            overlay.rect.width() * self.zoom_level * 2,
-            overlay.rect.height() * self.zoom_level * 2
+        energized = self._energized_overlays_by_page.get(self.current_page, [])
+        de_energized = self._de_energized_overlays_by_page.get(self.current_page, [])
+        if not energized and not de_energized:
+            return
+
+        scale = self.zoom_level * 2
+        selected_id = self.selected_component_id
+        hovered_id = self.hovered_component_id
+        buckets = (
+            (de_energized, _DE_ENERGIZED_FILL, _DE_ENERGIZED_BORDER, _DE_ENERGIZED_TEXT_BG),
+            (energized, _ENERGIZED_FILL, _ENERGIZED_BORDER, _ENERGIZED_TEXT_BG),
         )
 
-        # Check if this component is selected or hovered
-        is_selected = (overlay.component.id == self.selected_component_id)
-        is_hovered = (overlay.component.id == self.hovered_component_id)
-
-        # Choose color based on selection, hover, and energization state
-        if is_selected:
-            # Yellow highlight for selected components
-            fill_color = QColor(255, 255, 0, 100)  # Semi-transparent yellow
-            border_color = QColor(255, 200, 0, 255)
-            border_style = Qt.DashLine
-            border_width = 4
-            text_bg_color = QColor(255, 200, 0, 220)  # Yellow background for text
-            text_color = QColor(0, 0, 0)  # Black text
-        elif is_hovered:
-            # Blue highlight for hovered components
-            fill_color = QColor(52, 152, 219, 60)  # Semi-transparent blue
-            border_color = QColor(52, 152, 219, 255)
-            border_style = Qt.SolidLine
-            border_width = 3
-            if overlay.is_energized:
-                text_bg_color = QColor(39, 174, 96, 220)
-                text_color = QColor(255, 255, 255)
+        # Convert PDF coordinates to screen coordinates once per overlay
+        screen_rects: Dict[int, QRectF] = {}
+        for overlays, _, _, _ in buckets:
+            for overlay in overlays:
+                screen_rects[id(overlay)] = QRectF(
+                    overlay.rect.x() * scale,
+                    overlay.rect.y() * scale,
+                    overlay.rect.width() * scale,
+                    overlay.rect.height() * scale
+                )
+
+        # Pass 1: filled rectangles
+        highlighted: List[ComponentOverlay] = []
+        for overlays, fill_color, border_color, _ in buckets:
+            painter.setBrush(QBrush(fill_color))
+            painter.setPen(QPen(border_color, 3, Qt.SolidLine))
+            for overlay in overlays:
+                if overlay.component.id in (selected_id, hovered_id):
+                    highlighted.append(overlay)
+                else:
+                    painter.drawRect(screen_rects[id(overlay)])
+
+        for overlay in highlighted:
+            if overlay.component.id == selected_id:
+                # Yellow highlight for selected components
+                painter.setBrush(QBrush(_SELECTED_FILL))
+                painter.setPen(QPen(_SELECTED_BORDER, 4, Qt.DashLine))
             else:
-                text_bg_color = QColor(231, 76, 60, 220)
-                text_color = QColor(255, 255, 255)
-        elif overlay.is_energized:
-            # Green overlay for energized components
-            fill_color = QColor(0, 255, 0, 60)  # Semi-transparent green
-            border_color = QColor(0, 200, 0, 200)
-            border_style = Qt.SolidLine
-            border_width = 3
-            text_bg_color = QColor(39, 174, 96, 220)  # Green background
-            text_color = QColor(255, 255, 255)  # White text
-        else:
-            # Red overlay for de-energized components
-            fill_color = QColor(255, 0, 0, 40)  # Semi-transparent red
-            border_color = QColor(200, 0, 0, 150)
-            border_style = Qt.SolidLine
-            border_width = 3
-            text_bg_color = QColor(231, 76, 60, 220)  # Red background
-            text_color = QColor(255, 255, 255)  # White text
-
-        # Draw filled rectangle
-        painter.setBrush(QBrush(fill_color))
-        painter.setPen(QPen(border_color, border_width, border_style))
-        painter.drawRect(rect)
-
-        # Draw component designation label with background for contrast
-        designation = overlay.component.designation
-
-        # Set up font
+                # Blue highlight for hovered components
+                painter.setBrush(QBrush(_HOVERED_FILL))
+                painter.setPen(QPen(_HOVERED_BORDER, 3, Qt.SolidLine))
+            painter.drawRect(screen_rects[id(overlay)])
+
+        # Component designation labels with background for contrast
         font = QFont("Arial", max(8, int(10 * self.zoom_level)))
         font.setBold(True)
         painter.setFont(font)
-
-        # Calculate text size
         font_metrics = painter.fontMetrics()
-        text_width = font_metrics.horizontalAdvance(designation) + 8
         text_height = font_metrics.height() + 4
 
-        # Draw text background
-        text_rect = QRectF(
-            rect.x() + 3,
-            rect.y() + 3,
-            text_width,
-            text_height
-        )
-        painter.setBrush(QBrush(text_bg_color))
+        text_rects: Dict[int, QRectF] = {}
+        for overlays, _, _, _ in buckets:
+            for overlay in overlays:
+                rect = screen_rects[id(overlay)]
+                text_width = font_metrics.horizontalAdvance(overlay.component.designation) + 8
+                text_rects[id(overlay)] = QRectF(
+                    rect.x() + 3, rect.y() + 3, text_width, text_height
+                )
+
+        # Pass 2: label backgrounds
+        selected: List[ComponentOverlay] = []
         painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(text_rect, 3, 3)
-
-        # Draw text
-        painter.setPen(QPen(text_color))
-        painter.drawText(
-            text_rect,
-            Qt.AlignCenter,
-            designation
-        )
+        for overlays, _, _, text_bg_color in buckets:
+            painter.setBrush(QBrush(text_bg_color))
+            for overlay in overlays:
+                if overlay.component.id == selected_id:
+                    selected.append(overlay)
+                else:
+                    painter.drawRoundedRect(text_rects[id(overlay)], 3, 3)
+
+        painter.setBrush(QBrush(_SELECTED_TEXT_BG))
+        for overlay in selected:
+            painter.drawRoundedRect(text_rects[id(overlay)], 3, 3)
+
+        # Pass 3: label text (white, black on the yellow selection)
+        painter.setPen(QPen(QColor(255, 255, 255)))
+        for overlays, _, _, _ in buckets:
+            for overlay in overlays:
+                if overlay.component.id != selected_id:
+                    painter.drawText(
+                        text_rects[id(overlay)], Qt.AlignCenter, overlay.component.designation
+                    )
 
-        # Draw terminal points
-        self._draw_terminals(painter, overlay.component)
+        painter.setPen(QPen(QColor(0, 0, 0)))
+        for overlay in selected:
+            painter.drawText(text_rects[id(overlay)], Qt.AlignCenter, overlay.component.designation)
 
-    def _draw_terminals(self, painter: QPainter, component: IndustrialComponent) -> None:
-        """Draw terminal points for a component.
+        # Pass 4: terminal points
+        self._draw_terminals(
+            painter,
+            [overlay.component for overlays, _, _, _ in buckets for overlay in overlays]
+        )
+
+    def _draw_terminals(self, painter: QPainter, components: List[IndustrialComponent]) -> None:
+        """Draw terminal points for components.
 
         Args:
             painter: Qt painter
-            component: Component to draw terminals for
+            components: Components to draw terminals for
         """
         # BUGFIX: Get PDF coordinates for terminals, then convert to screen
-        pdf_terminals = self._get_terminal_positions_pdf(component)
-
-        # Convert to screen coordinates
-        screen_terminals = []
-        for pdf_term in pdf_terminals:
-            screen_x = pdf_term.x() * self.zoom_level * 2
-            screen_y = pdf_term.y() * self.zoom_level * 2
-            screen_terminals.append(QPointF(screen_x, screen_y))
+        scale = self.zoom_level * 2
+        screen_terminals = [
+            QPointF(pdf_term.x() * scale, pdf_term.y() * scale)
+            for component in components
+            for pdf_term in self._get_terminal_positions_pdf(component)
+        ]
 
         # Draw terminal circles with better visibility
         terminal_radius = max(3, 4 * self.zoom_level)  # Scale with zoom, minimum 3
@@ -529,15 +582,13 @@ class PDFViewer(QWidget):
             painter.setPen(pen)
 
             # Convert path points to screen coordinates
-            screen_points = []
-            for point in wire.path:
-                screen_x = point.x * self.zoom_level * 2
-                screen_y = point.y * self.zoom_level * 2
-                screen_points.append(QPointF(screen_x, screen_y))
+            scale = self.zoom_level * 2
+            screen_points = [
+                QPointF(point.x * scale, point.y * scale) for point in wire.path
+            ]
 
-            # Draw connected line segments
-            for i in range(len(screen_points) - 1):
-                painter.drawLine(screen_points[i], screen_points[i + 1])
+            # Draw connected line segments in one call
+            painter.drawPolyline(QPolygonF(screen_points))
 
             # Draw terminal connection circles at start and end
             painter.setBrush(QBrush(color))
@@ -551,35 +602,9 @@ class PDFViewer(QWidget):
         Args:
             painter: Qt painter
         """
-        terminal_positions = self._get_all_terminal_positions()
-        preview_path = self.wire_tool.get_preview_path(terminal_positions)
-        if not preview_path or len(preview_path) < 2:
-            return
-
-        wire_type = self.wire_tool.get_wire_type()
-        wire_color = wire_type.value[1]
-
-        pen = QPen(wire_color, 3, Qt.DashLine)
-        painter.setPen(pen)
-
-        for i in range(len(preview_path) - 1):
-            screen_start = QPointF(
-                preview_path[i].x() * self.zoom_level * 2,
-                preview_path[i].y() * self.zoom_level * 2
-            )
-            screen_end = QPointF(
-                preview_path[i + 1].x() * self.zoom_level * 2,
-                preview_path[i + 1].y() * self.zoom_level * 2
-            )
-            painter.drawLine(screen_start, screen_end)
-
-        painter.setBrush(QBrush(wire_color))
-        for i in range(1, len(preview_path) - 1):
-            screen_pos = QPointF(
-                preview_path[i].x() * self.zoom_level * 2,
-                preview_path[i].y() * self.zoom_level * 2
-            )
-            painter.drawEllipse(screen_pos, 4, 4)
+        self.wire_tool.render_preview(
+            painter, self.zoom_level, self._get_all_terminal_positions()
+        )
 
     def _get_all_terminal_positions(self) -> Dict[str, List[QPointF]]:
         """Get terminal positions for all components in PDF coordinates.
@@ -587,17 +612,25 @@ class PDFViewer(QWidget):
         BUGFIX: Completely rewritten to calculate terminals directly in PDF coordinates
         instead of converting from screen coordinates.
 
+        The result is cached per page and rebuilt (as a new dict) whenever
+        overlays are replaced or moved, so the wire tool can key its terminal
+        index on the dict's identity.
+
         Returns:
             Dict mapping component_id to list of terminal positions (PDF coords)
         """
+        if (self._terminal_positions_cache is not None
+                and self._terminal_positions_cache[0] == self.current_page):
+            return self._terminal_positions_cache[1]
+
         terminal_positions = {}
 
-        for overlay in self.component_overlays:
-            if overlay.page == self.current_page:
-                # Calculate terminals based on component's PDF position directly
-                pdf_terminals = self._get_terminal_positions_pdf(overlay.component)
-                terminal_positions[overlay.component.id] = pdf_terminals
+        for overlay in self._page_overlays.get(self.current_page, []):
+            # Calculate terminals based on component's PDF position directly
+            pdf_terminals = self._get_terminal_positions_pdf(overlay.component)
+            terminal_positions[overlay.component.id] = pdf_terminals
 
+        self._terminal_positions_cache = (self.current_page, terminal_positions)
         return terminal_positions
 
     def _on_wire_completed(self, wire: Wire) -> None:
@@ -607,7 +640,7 @@ class PDFViewer(QWidget):
             wire: Completed wire
         """
         self.wires.append(wire)
-        self._update_display()
+        self._schedule_update()
         self.wire_completed.emit(wire)
 
     def _find_component_at(self, pdf_x: float, pdf_y: float) -> Optional[IndustrialComponent]:
@@ -620,14 +653,47 @@ class PDFViewer(QWidget):
         Returns:
             Component at position or None
         """
-        for overlay in self.component_overlays:
-            if overlay.page == self.current_page:
-                rect = overlay.rect
-                if (rect.x() <= pdf_x <= rect.x() + rect.width() and
-                    rect.y() <= pdf_y <= rect.y() + rect.height()):
-                    return overlay.component
+        rects = self._get_page_rects(self.current_page)
+        if rects is None:
+            return None
+
+        hit = (
+            (rects[:, 0] <= pdf_x) & (pdf_x <= rects[:, 2]) &
+            (rects[:, 1] <= pdf_y) & (pdf_y <= rects[:, 3])
+        )
+        idx = int(np.argmax(hit))
+        if hit[idx]:
+            return self._page_overlays[self.current_page][idx].component
         return None
 
+    def _get_page_rects(self, page: int) -> Optional[np.ndarray]:
+        """Get overlay bounds for a page as an (N, 4) array of x0, y0, x1, y1.
+
+        Row order matches self._page_overlays[page]. Built on first use and
+        discarded whenever overlays are rebuilt or moved.
+
+        Args:
+            page: PDF page number (0-indexed)
+
+        Returns:
+            Bounds array, or None if the page has no overlays
+        """
+        rects = self._page_rects.get(page)
+        if rects is None:
+            page_overlays = self._page_overlays.get(page)
+            if not page_overlays:
+                return None
+            rects = np.array(
+                [
+                    (o.rect.x(), o.rect.y(),
+                     o.rect.x() + o.rect.width(), o.rect.y() + o.rect.height())
+                    for o in page_overlays
+                ],
+                dtype=np.float64
+            )
+            self._page_rects[page] = rects
+        return rects
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Handle mouse press for wire drawing, component selection, or area selection."""
         if event.button() == Qt.LeftButton and self.pixmap:
@@ -692,6 +758,8 @@ class PDFViewer(QWidget):
                         self.dragging_component.width,
                         self.dragging_component.height
                     )
+            self._page_rects.clear()
+            self._terminal_positions_cache = None
 
             self._update_display()
             return
@@ -809,6 +877,12 @@ class PDFViewer(QWidget):
             energized_ids: List of component IDs that are energized
         """
         self.component_overlays.clear()
+        self._overlays_by_id.clear()
+        self._page_overlays.clear()
+        self._page_rects.clear()
+        self._terminal_positions_cache = None
+        self._energized_overlays_by_page.clear()
+        self._de_energized_overlays_by_page.clear()
         energized_set = set(energized_ids)
 
         for comp in components:
@@ -817,6 +891,10 @@ class PDFViewer(QWidget):
                 continue
 
             is_energized = comp.id in energized_set
+            state_buckets = (
+                self._energized_overlays_by_page if is_energized
+                else self._de_energized_overlays_by_page
+            )
 
             # Handle multi-page components
             if comp.page_positions:
@@ -830,6 +908,9 @@ class PDFViewer(QWidget):
                         rect=rect
                     )
                     self.component_overlays.append(overlay)
+                    self._overlays_by_id[comp.id] = overlay
+                    self._page_overlays.setdefault(page, []).append(overlay)
+                    state_buckets.setdefault(page, []).append(overlay)
             else:
                 # Single position - use component's primary page
                 overlay = ComponentOverlay(
@@ -838,8 +919,11 @@ class PDFViewer(QWidget):
                     page=comp.page
                 )
                 self.component_overlays.append(overlay)
+                self._overlays_by_id[comp.id] = overlay
+                self._page_overlays.setdefault(comp.page, []).append(overlay)
+                state_buckets.setdefault(comp.page, []).append(overlay)
 
-        self._update_display()
+        self._schedule_update()
 
     def toggle_overlays(self, show: bool) -> None:
         """Toggle visibility of component overlays.
@@ -847,13 +931,23 @@ class PDFViewer(QWidget):
         Args:
             show: True to show overlays, False to hide
         """
+        if show == self.show_overlays:
+            return
         self.show_overlays = show
-        self._update_display()
+        self._schedule_update()
 
     def clear_overlays(self) -> None:
         """Clear all component overlays."""
+        if not self.component_overlays:
+            return
         self.component_overlays.clear()
-        self._update_display()
+        self._overlays_by_id.clear()
+        self._page_overlays.clear()
+        self._page_rects.clear()
+        self._terminal_positions_cache = None
+        self._energized_overlays_by_page.clear()
+        self._de_energized_overlays_by_page.clear()
+        self._schedule_update()
 
     def select_component(self, component_id: str) -> None:
         """Select a component by ID.
@@ -861,13 +955,17 @@ class PDFViewer(QWidget):
         Args:
             component_id: ID of component to select
         """
+        if component_id == self.selected_component_id:
+            return
         self.selected_component_id = component_id
-        self._update_display()
+        self._schedule_update()
 
     def clear_selection(self) -> None:
         """Clear component selection."""
+        if self.selected_component_id is None:
+            return
         self.selected_component_id = None
-        self._update_display()
+        self._schedule_update()
 
     def get_selected_component(self) -> Optional[IndustrialComponent]:
         """Get the currently selected component.
@@ -878,10 +976,8 @@ class PDFViewer(QWidget):
         if not self.selected_component_id:
             return None
 
-        for overlay in self.component_overlays:
-            if overlay.component.id == self.selected_component_id:
-                return overlay.component
-        return None
+        overlay = self._overlays_by_id.get(self.selected_component_id)
+        return overlay.component if overlay else None
 
     def set_wire_type(self, wire_type: WireType) -> None:
         """Set the wire type for drawing.
@@ -897,18 +993,20 @@ class PDFViewer(QWidget):
         Args:
             enabled: True to enable wire drawing mode
         """
+        if enabled == self.wire_drawing_mode:
+            return
         self.wire_drawing_mode = enabled
         if enabled:
             self.setCursor(Qt.CrossCursor)
         else:
             self.setCursor(Qt.ArrowCursor)
             self.wire_tool.cancel_drawing()
-            self._update_display()
+            self._schedule_update()
 
     def cancel_wire_drawing(self) -> None:
         """Cancel current wire drawing."""
         self.wire_tool.cancel_drawing()
-        self._update_display()
+        self._schedule_update()
 
     def is_drawing_wire(self) -> bool:
         """Check if currently drawing a wire.
@@ -924,13 +1022,20 @@ class PDFViewer(QWidget):
         Args:
             wires: List of wires
         """
+        # Callers often pass the diagram's own (mutated) wire list back in,
+        # so only an empty -> empty update is known to be a no-op.
+        nothing_to_draw = not wires and not self.wires
         self.wires = wires
-        self._update_display()
+        if nothing_to_draw:
+            return
+        self._schedule_update()
 
     def clear_wires(self) -> None:
         """Clear all wires."""
+        if not self.wires:
+            return
         self.wires.clear()
-        self._update_display()
+        self._schedule_update()
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """Handle key press events.
@@ -1020,12 +1125,9 @@ class PDFViewer(QWidget):
             pdf_x = label_pos.x() / (self.zoom_level * 2)
             pdf_y = label_pos.y() / (self.zoom_level * 2)
 
-            for overlay in self.component_overlays:
-                if overlay.page == self.current_page:
-                    rect = overlay.rect
-                    if (rect.x() <= pdf_x <= rect.x() + rect.width() and
-                        rect.y() <= pdf_y <= rect.y() + rect.height()):
-                        self.component_double_clicked.emit(overlay.component)
-                        return
+            component = self._find_component_at(pdf_x, pdf_y)
+            if component:
+                self.component_double_clicked.emit(component)
+                return
 
         super().mouseDoubleClickEvent(event)
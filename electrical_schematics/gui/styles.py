@@ -54,6 +54,31 @@ COLORS = {
     'current_page_border': '#FFC107',     # Yellow border
 }
 
+# Hot colors as plain module constants so paint/lookup code can skip the
+# COLORS dict. COLORS stays the source of truth for the stylesheets.
+PRIMARY = COLORS['primary']
+ACCENT = COLORS['accent']
+BACKGROUND = COLORS['background']
+SURFACE = COLORS['surface']
+SURFACE_DARK = COLORS['surface_dark']
+BORDER = COLORS['border']
+TEXT = COLORS['text']
+TEXT_SECONDARY = COLORS['text_secondary']
+TEXT_MUTED = COLORS['text_muted']
+SUCCESS_BG = COLORS['success_bg']
+DANGER_BG = COLORS['danger_bg']
+VOLTAGE_24VDC = COLORS['voltage_24vdc']
+VOLTAGE_0V = COLORS['voltage_0v']
+VOLTAGE_400VAC = COLORS['voltage_400vac']
+VOLTAGE_230VAC = COLORS['voltage_230vac']
+ENERGIZED = COLORS['energized']
+ENERGIZED_TEXT = COLORS['energized_text']
+DE_ENERGIZED = COLORS['de_energized']
+DE_ENERGIZED_TEXT = COLORS['de_energized_text']
+UNKNOWN = COLORS['unknown']
+CURRENT_PAGE_HIGHLIGHT = COLORS['current_page_highlight']
+CURRENT_PAGE_BORDER = COLORS['current_page_border']
+
 
 def get_main_stylesheet() -> str:
     """Get the main application stylesheet.
@@ -829,12 +854,12 @@ def get_wire_colors() -> dict:
         Dict mapping wire types to colors
     """
     return {
-        '24VDC': COLORS['voltage_24vdc'],
-        '0V': COLORS['voltage_0v'],
-        '400VAC': COLORS['voltage_400vac'],
-        '230VAC': COLORS['voltage_230vac'],
+        '24VDC': VOLTAGE_24VDC,
+        '0V': VOLTAGE_0V,
+        '400VAC': VOLTAGE_400VAC,
+        '230VAC': VOLTAGE_230VAC,
         'PE': '#27AE60',  # Green for protective earth
-        'UNKNOWN': COLORS['text_muted'],
+        'UNKNOWN': TEXT_MUTED,
     }
 
 
@@ -846,23 +871,23 @@ def get_component_state_colors() -> dict:
     """
     return {
         'energized': {
-            'background': COLORS['success_bg'],
-            'text': COLORS['energized_text'],
-            'border': COLORS['energized'],
+            'background': SUCCESS_BG,
+            'text': ENERGIZED_TEXT,
+            'border': ENERGIZED,
         },
         'de_energized': {
-            'background': COLORS['danger_bg'],
-            'text': COLORS['de_energized_text'],
-            'border': COLORS['de_energized'],
+            'background': DANGER_BG,
+            'text': DE_ENERGIZED_TEXT,
+            'border': DE_ENERGIZED,
         },
         'unknown': {
-            'background': COLORS['surface_dark'],
-            'text': COLORS['text_secondary'],
-            'border': COLORS['unknown'],
+            'background': SURFACE_DARK,
+            'text': TEXT_SECONDARY,
+            'border': UNKNOWN,
         },
         'current_page': {
-            'background': COLORS['current_page_highlight'],
-            'border': COLORS['current_page_border'],
+            'background': CURRENT_PAGE_HIGHLIGHT,
+            'border': CURRENT_PAGE_BORDER,
         },
     }
 
@@ -4,7 +4,8 @@ Generates scalable SVG icons for DIN rail terminal blocks that
 expand based on the number of terminal positions.
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 from electrical_schematics.models.terminal_strip import (
     TerminalStrip,
     TerminalStripType,
@@ -12,6 +13,110 @@ from electrical_schematics.models.terminal_strip import (
 )
 
 
+# SVG fragments are single-line with no indentation to keep the emitted
+# markup compact for QSvgRenderer.
+_DIN_RAIL_TMPL = (
+    '<g id="din-rail">'
+    '<rect x="0" y="%g" width="%g" height="%g" fill="#C0C0C0" stroke="#808080" '
+    'stroke-width="0.5"/>'
+    '<line x1="0" y1="%g" x2="%g" y2="%g" stroke="#E0E0E0" stroke-width="1"/>'
+    '</g>'
+)
+_BODY_TMPL = (
+    '<g id="terminal-body">'
+    '<rect x="0" y="%g" width="%g" height="%g" fill="%s" stroke="#404040" stroke-width="1"/>'
+    '</g>'
+)
+_BODY_LEVEL_TMPL = (
+    '<rect x="0" y="%g" width="%g" height="%g" fill="%s" opacity="%g" '
+    'stroke="#404040" stroke-width="0.5"/>'
+)
+_DESIGNATION_TMPL = (
+    '<g id="designation-label">'
+    '<text x="%g" y="%g" font-family="Arial, sans-serif" font-size="8" font-weight="bold" '
+    'text-anchor="middle" fill="#000000">%s</text>'
+    '</g>'
+)
+
+# Connection points for every position/level are merged into one <path> per
+# style; each circle is written as two arcs.
+_CIRCLE_PATH_TMPL = 'M%g,%ga%g,%g 0 1,0 %g,0a%g,%g 0 1,0 %g,0'
+_SLOT_PATH_TMPL = 'M%g,%gH%g'
+_PADS_TMPL = '<path d="%s" fill="#FFD700" stroke="#B8860B" stroke-width="0.5"/>'
+_SCREWS_TMPL = '<path d="%s" fill="#606060" stroke="#404040" stroke-width="0.5"/>'
+_SLOTS_TMPL = '<path d="%s" fill="none" stroke="#808080" stroke-width="0.5"/>'
+
+# Per-position SVG fragments, formatted with % once per position/level.
+# %g drops trailing zeros from coordinates (10.0 -> 10).
+_POSITION_OPEN_TMPL = '<g id="position-%d">'
+_LABEL_TMPL = (
+    '<text x="%g" y="%g" font-family="Arial, sans-serif" font-size="6" '
+    'text-anchor="middle" fill="#000000">%s</text>'
+)
+_DISCONNECT_TMPL = (
+    '<line x1="%g" y1="%g" x2="%g" y2="%g" '
+    'stroke="#FF0000" stroke-width="1.5" stroke-dasharray="2,1"/>'
+)
+_LED_TMPL = (
+    '<circle cx="%g" cy="%g" r="2.5" fill="%s" stroke="#404040" stroke-width="0.3" '
+    'opacity="0.7"/>'
+)
+_FUSE_TMPL = (
+    '<rect x="%g" y="%g" width="6" height="16" fill="none" stroke="#FF6600" '
+    'stroke-width="1" stroke-dasharray="1,1" rx="1"/>'
+    '<text x="%g" y="%g" font-family="Arial, sans-serif" font-size="4" '
+    'text-anchor="middle" fill="#FF6600">F</text>'
+)
+
+# Whole position groups, with and without the disconnect marker
+_POSITION_TMPL = _POSITION_OPEN_TMPL + _LABEL_TMPL + '</g>'
+_POSITION_DISCONNECT_TMPL = _POSITION_OPEN_TMPL + _LABEL_TMPL + _DISCONNECT_TMPL + '</g>'
+
+# Full icon: envelope, DIN rail, body/positions/indicators (one %s) and the
+# designation label, filled by a single % format per icon.
+_SVG_TMPL = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 %s %s" width="%s" height="%s">'
+    + _DIN_RAIL_TMPL
+    + '%s'
+    + _DESIGNATION_TMPL
+    + '</svg>'
+)
+
+
+class _IconKey:
+    """Hashable cache key for a terminal strip's rendered icon.
+
+    Equality and hashing use only the signature, so strips that would render
+    identically share one cache entry; the strip itself is carried along so
+    the cached function can render it on a miss.
+    """
+
+    __slots__ = ('signature', 'strip')
+
+    def __init__(self, strip: TerminalStrip):
+        self.strip = strip
+        self.signature: Tuple[Any, ...] = (
+            strip.terminal_type,
+            strip.position_count,
+            strip.level_count,
+            strip.color,
+            strip.has_led,
+            strip.has_fuse,
+            strip.has_disconnect,
+            strip.designation,
+            tuple(
+                (t.position, t.level, t.terminal_number, t.has_led, t.led_color)
+                for t in strip.terminals
+            ),
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.signature)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IconKey) and self.signature == other.signature
+
+
 class TerminalStripIconGenerator:
     """Generates SVG icons for terminal strips."""
 
@@ -34,6 +139,12 @@ class TerminalStripIconGenerator:
         TerminalColor.BLACK: "#000000"
     }
 
+    # COLOR_MAP keyed by enum value, so lookups hash a plain str
+    _COLOR_HEX = {color.value: hex_color for color, hex_color in COLOR_MAP.items()}
+
+    # Opacity per stacked level (darker for each level below the first)
+    _LEVEL_SHADES = tuple(1.0 - (level * 0.15) for level in range(6))
+
     @classmethod
     def generate_svg(cls, terminal_strip: TerminalStrip, width: int = 200, height: int = 80) -> str:
         """Generate SVG icon for a terminal strip.
@@ -59,77 +170,53 @@ class TerminalStripIconGenerator:
         viewbox_height = cls.TERMINAL_HEIGHT
 
         # Get body color
-        body_color = cls.COLOR_MAP.get(terminal_strip.color, "#808080")
+        body_color = cls._COLOR_HEX.get(terminal_strip.color.value, "#808080")
 
-        # Build SVG
-        svg_parts = [
-            f'<svg xmlns="http://www.w3.org/2000/svg" '
-            f'viewBox="0 0 {viewbox_width} {viewbox_height}" '
-            f'width="{width}" height="{height}">',
+        # X centers of each position, shared by all per-position helpers
+        position_width = cls.POSITION_WIDTH
+        half_width = position_width / 2
+        x_centers = [
+            i * position_width + half_width for i in range(terminal_strip.position_count)
         ]
 
-        # Add DIN rail
-        svg_parts.append(cls._draw_din_rail(viewbox_width))
+        # Build the variable middle section
+        svg_parts: List[str] = []
 
         # Add terminal body
-        svg_parts.append(cls._draw_terminal_body(
-            terminal_strip, viewbox_width, body_color
-        ))
+        cls._draw_terminal_body(svg_parts, terminal_strip, viewbox_width, body_color)
+
+        # Add connection pads and screws for all positions
+        cls._draw_connection_points(svg_parts, terminal_strip, x_centers)
 
         # Add terminal positions
-        for i in range(terminal_strip.position_count):
-            x_pos = i * cls.POSITION_WIDTH + cls.POSITION_WIDTH / 2
-            svg_parts.append(cls._draw_terminal_position(
-                x_pos, i + 1, terminal_strip
-            ))
+        cls._draw_terminal_positions(svg_parts, terminal_strip, x_centers)
 
         # Add special features
         if terminal_strip.has_led:
-            svg_parts.append(cls._draw_led_indicators(terminal_strip))
+            cls._draw_led_indicators(svg_parts, terminal_strip, x_centers)
 
         if terminal_strip.has_fuse:
-            svg_parts.append(cls._draw_fuse_indicators(terminal_strip))
-
-        # Add designation label
-        svg_parts.append(cls._draw_designation_label(
-            terminal_strip.designation, viewbox_width
-        ))
-
-        svg_parts.append('</svg>')
-
-        return '\n'.join(svg_parts)
-
-    @classmethod
-    def _draw_din_rail(cls, width: float) -> str:
-        """Draw DIN rail mounting at top.
-
-        Args:
-            width: Total width of the terminal strip
+            cls._draw_fuse_indicators(svg_parts, x_centers)
 
-        Returns:
-            SVG markup for DIN rail
-        """
+        # DIN rail at the top and designation label at the bottom
         rail_y = 0
-        return f'''
-        <g id="din-rail">
-            <rect x="0" y="{rail_y}" width="{width}" height="{cls.DIN_RAIL_HEIGHT}"
-                  fill="#C0C0C0" stroke="#808080" stroke-width="0.5"/>
-            <line x1="0" y1="{rail_y + 2}" x2="{width}" y2="{rail_y + 2}"
-                  stroke="#E0E0E0" stroke-width="1"/>
-        </g>
-        '''
+        return _SVG_TMPL % (
+            viewbox_width, viewbox_height, width, height,
+            rail_y, viewbox_width, cls.DIN_RAIL_HEIGHT, rail_y + 2, viewbox_width, rail_y + 2,
+            ''.join(svg_parts),
+            viewbox_width / 2, cls.TERMINAL_HEIGHT - 5, terminal_strip.designation,
+        )
 
     @classmethod
-    def _draw_terminal_body(cls, terminal_strip: TerminalStrip, width: float, color: str) -> str:
+    def _draw_terminal_body(cls, out: List[str], terminal_strip: TerminalStrip,
+                            width: float, color: str) -> None:
         """Draw main terminal body.
 
         Args:
+            out: SVG fragment list to append to
             terminal_strip: Terminal strip instance
             width: Total width
             color: Body color
-
-        Returns:
-            SVG markup for terminal body
         """
         body_y = cls.DIN_RAIL_HEIGHT
         body_height = cls.TERMINAL_BODY_HEIGHT
@@ -137,181 +224,178 @@ class TerminalStripIconGenerator:
         # Multi-level terminals have stacked appearance
         if terminal_strip.level_count > 1:
             level_height = body_height / terminal_strip.level_count
-            levels = []
+            out.append('<g id="terminal-body">')
+            level_shades = cls._LEVEL_SHADES
             for level in range(terminal_strip.level_count):
                 level_y = body_y + (level * level_height)
-                level_shade = 1.0 - (level * 0.15)  # Darker for each level
-                levels.append(f'''
-                <rect x="0" y="{level_y}" width="{width}" height="{level_height}"
-                      fill="{color}" opacity="{level_shade}"
-                      stroke="#404040" stroke-width="0.5"/>
-                ''')
-            return '<g id="terminal-body">' + ''.join(levels) + '</g>'
+                if level < len(level_shades):
+                    level_shade = level_shades[level]
+                else:
+                    level_shade = 1.0 - (level * 0.15)
+                out.append(_BODY_LEVEL_TMPL % (level_y, width, level_height, color, level_shade))
+            out.append('</g>')
         else:
-            return f'''
-            <g id="terminal-body">
-                <rect x="0" y="{body_y}" width="{width}" height="{body_height}"
-                      fill="{color}" stroke="#404040" stroke-width="1"/>
-            </g>
-            '''
+            out.append(_BODY_TMPL % (body_y, width, body_height, color))
 
     @classmethod
-    def _draw_terminal_position(cls, x_center: float, position: int,
-                                terminal_strip: TerminalStrip) -> str:
-        """Draw a single terminal position with connection points.
+    def _draw_connection_points(cls, out: List[str], terminal_strip: TerminalStrip,
+                                x_centers: List[float]) -> None:
+        """Draw connection pads and screws for every position and level.
+
+        Like-styled shapes share one <path> (top pads, screws, screw slots,
+        bottom pads), so the element count stays constant as the strip grows.
 
         Args:
-            x_center: X center position
-            position: Terminal position number (1-indexed)
-            terminal_strip: Parent terminal strip
+            out: SVG fragment list to append to
+            terminal_strip: Terminal strip instance
+            x_centers: X center of each position
+        """
+        if not x_centers:
+            return
 
-        Returns:
-            SVG markup for terminal position
+        body_y = cls.DIN_RAIL_HEIGHT
+        level_height = cls.TERMINAL_BODY_HEIGHT / terminal_strip.level_count
+        pad_r = cls.TERMINAL_PAD_SIZE
+        screw_r = cls.SCREW_SIZE
+        level_ys = [
+            body_y + (level * level_height) + level_height / 2
+            for level in range(terminal_strip.level_count)
+        ]
+
+        top_pads = []
+        screws = []
+        slots = []
+        bottom_pads = []
+        for x_center in x_centers:
+            pad_x = x_center - pad_r
+            screw_x = x_center - screw_r
+            for level_y in level_ys:
+                top_pads.append(_CIRCLE_PATH_TMPL % (
+                    pad_x, level_y - 8, pad_r, pad_r, 2 * pad_r, pad_r, pad_r, -2 * pad_r
+                ))
+                screws.append(_CIRCLE_PATH_TMPL % (
+                    screw_x, level_y, screw_r, screw_r, 2 * screw_r,
+                    screw_r, screw_r, -2 * screw_r
+                ))
+                slots.append(_SLOT_PATH_TMPL % (x_center - 2, level_y, x_center + 2))
+                bottom_pads.append(_CIRCLE_PATH_TMPL % (
+                    pad_x, level_y + 8, pad_r, pad_r, 2 * pad_r, pad_r, pad_r, -2 * pad_r
+                ))
+
+        out.append(_PADS_TMPL % ''.join(top_pads))
+        out.append(_SCREWS_TMPL % ''.join(screws))
+        out.append(_SLOTS_TMPL % ''.join(slots))
+        out.append(_PADS_TMPL % ''.join(bottom_pads))
+
+    @classmethod
+    def _draw_terminal_positions(cls, out: List[str], terminal_strip: TerminalStrip,
+                                 x_centers: List[float]) -> None:
+        """Draw every terminal position's label and disconnect marker.
+
+        Connection pads and screws are drawn for all positions at once by
+        _draw_connection_points.
+
+        Args:
+            out: SVG fragment list to append to
+            terminal_strip: Parent terminal strip
+            x_centers: X center of each position (index = position - 1)
         """
         body_y = cls.DIN_RAIL_HEIGHT
         body_height = cls.TERMINAL_BODY_HEIGHT
-
-        parts = [f'<g id="position-{position}">']
-
-        # Draw connection points for each level
-        level_height = body_height / terminal_strip.level_count
-        for level in range(terminal_strip.level_count):
-            level_y = body_y + (level * level_height) + level_height / 2
-
-            # Top connection pad
-            top_y = level_y - 8
-            parts.append(f'''
-            <circle cx="{x_center}" cy="{top_y}" r="{cls.TERMINAL_PAD_SIZE}"
-                    fill="#FFD700" stroke="#B8860B" stroke-width="0.5"/>
-            ''')
-
-            # Terminal screw (decorative)
-            parts.append(f'''
-            <circle cx="{x_center}" cy="{level_y}" r="{cls.SCREW_SIZE}"
-                    fill="#606060" stroke="#404040" stroke-width="0.5"/>
-            <line x1="{x_center - 2}" y1="{level_y}" x2="{x_center + 2}" y2="{level_y}"
-                  stroke="#808080" stroke-width="0.5"/>
-            ''')
-
-            # Bottom connection pad
-            bottom_y = level_y + 8
-            parts.append(f'''
-            <circle cx="{x_center}" cy="{bottom_y}" r="{cls.TERMINAL_PAD_SIZE}"
-                    fill="#FFD700" stroke="#B8860B" stroke-width="0.5"/>
-            ''')
-
-        # Terminal number label
         label_y = body_y + body_height + 8
-        terminal = terminal_strip.get_terminal(position)
-        label_text = terminal.terminal_number if terminal else str(position)
 
-        parts.append(f'''
-        <text x="{x_center}" y="{label_y}"
-              font-family="Arial, sans-serif" font-size="6"
-              text-anchor="middle" fill="#000000">{label_text}</text>
-        ''')
+        # Level-1 terminal number per position (first match wins, as in
+        # TerminalStrip.get_terminal)
+        numbers = {
+            t.position: t.terminal_number
+            for t in reversed(terminal_strip.terminals) if t.level == 1
+        }
 
-        # Disconnect indicator (knife symbol)
         if terminal_strip.has_disconnect:
+            # Disconnect indicator (knife symbol)
             disconnect_y = body_y + body_height / 2
-            parts.append(f'''
-            <line x1="{x_center - 3}" y1="{disconnect_y}"
-                  x2="{x_center + 3}" y2="{disconnect_y}"
-                  stroke="#FF0000" stroke-width="1.5" stroke-dasharray="2,1"/>
-            ''')
-
-        parts.append('</g>')
-        return '\n'.join(parts)
+            out.extend(
+                _POSITION_DISCONNECT_TMPL % (
+                    position, x_center, label_y, numbers.get(position, str(position)),
+                    x_center - 3, disconnect_y, x_center + 3, disconnect_y
+                )
+                for position, x_center in enumerate(x_centers, start=1)
+            )
+        else:
+            out.extend(
+                _POSITION_TMPL % (
+                    position, x_center, label_y, numbers.get(position, str(position))
+                )
+                for position, x_center in enumerate(x_centers, start=1)
+            )
 
     @classmethod
-    def _draw_led_indicators(cls, terminal_strip: TerminalStrip) -> str:
+    def _draw_led_indicators(cls, out: List[str], terminal_strip: TerminalStrip,
+                             x_centers: List[float]) -> None:
         """Draw LED indicators if present.
 
         Args:
+            out: SVG fragment list to append to
             terminal_strip: Terminal strip instance
-
-        Returns:
-            SVG markup for LED indicators
+            x_centers: X center of each position (index = position - 1)
         """
-        parts = ['<g id="led-indicators">']
-
-        for i, terminal in enumerate(terminal_strip.terminals):
-            if terminal.has_led:
-                x_pos = i * cls.POSITION_WIDTH + cls.POSITION_WIDTH / 2
-                led_y = cls.DIN_RAIL_HEIGHT + 5
+        out.append('<g id="led-indicators">')
 
+        led_y = cls.DIN_RAIL_HEIGHT + 5
+        for terminal in terminal_strip.terminals:
+            if terminal.has_led and 0 < terminal.position <= len(x_centers):
+                x_pos = x_centers[terminal.position - 1]
                 led_color = terminal.led_color or "red"
-                parts.append(f'''
-                <circle cx="{x_pos + 5}" cy="{led_y}" r="2.5"
-                        fill="{led_color}" stroke="#404040" stroke-width="0.3"
-                        opacity="0.7"/>
-                ''')
+                out.append(_LED_TMPL % (x_pos + 5, led_y, led_color))
 
-        parts.append('</g>')
-        return '\n'.join(parts)
+        out.append('</g>')
 
     @classmethod
-    def _draw_fuse_indicators(cls, terminal_strip: TerminalStrip) -> str:
+    def _draw_fuse_indicators(cls, out: List[str], x_centers: List[float]) -> None:
         """Draw fuse holder indicators.
 
         Args:
-            terminal_strip: Terminal strip instance
-
-        Returns:
-            SVG markup for fuse indicators
+            out: SVG fragment list to append to
+            x_centers: X center of each position
         """
-        parts = ['<g id="fuse-indicators">']
+        out.append('<g id="fuse-indicators">')
 
-        body_y = cls.DIN_RAIL_HEIGHT
-        body_height = cls.TERMINAL_BODY_HEIGHT
-
-        for i in range(terminal_strip.position_count):
-            x_pos = i * cls.POSITION_WIDTH + cls.POSITION_WIDTH / 2
-            fuse_y = body_y + body_height / 2
+        fuse_y = cls.DIN_RAIL_HEIGHT + cls.TERMINAL_BODY_HEIGHT / 2
 
+        for x_pos in x_centers:
             # Draw fuse outline
-            parts.append(f'''
-            <rect x="{x_pos - 3}" y="{fuse_y - 8}" width="6" height="16"
-                  fill="none" stroke="#FF6600" stroke-width="1"
-                  stroke-dasharray="1,1" rx="1"/>
-            <text x="{x_pos}" y="{fuse_y + 2}"
-                  font-family="Arial, sans-serif" font-size="4"
-                  text-anchor="middle" fill="#FF6600">F</text>
-            ''')
-
-        parts.append('</g>')
-        return '\n'.join(parts)
+            out.append(_FUSE_TMPL % (x_pos - 3, fuse_y - 8, x_pos, fuse_y + 2))
+
+        out.append('</g>')
 
     @classmethod
-    def _draw_designation_label(cls, designation: str, width: float) -> str:
-        """Draw designation label.
+    def generate_for_library(cls, terminal_strip: TerminalStrip) -> str:
+        """Generate library preview icon (standard size).
+
+        Icons are cached by strip signature, so library panels that re-render
+        the same parts reuse the SVG string.
 
         Args:
-            designation: Terminal strip designation
-            width: Total width
+            terminal_strip: Terminal strip to render
 
         Returns:
-            SVG markup for designation label
+            SVG markup optimized for library display
         """
-        label_y = cls.TERMINAL_HEIGHT - 5
-        return f'''
-        <g id="designation-label">
-            <text x="{width / 2}" y="{label_y}"
-                  font-family="Arial, sans-serif" font-size="8" font-weight="bold"
-                  text-anchor="middle" fill="#000000">{designation}</text>
-        </g>
-        '''
+        return cls._generate_library_svg(_IconKey(terminal_strip))
 
-    @classmethod
-    def generate_for_library(cls, terminal_strip: TerminalStrip) -> str:
-        """Generate library preview icon (standard size).
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _generate_library_svg(key: _IconKey) -> str:
+        """Render a library preview icon (cached by strip signature).
 
         Args:
-            terminal_strip: Terminal strip to render
+            key: Icon key wrapping the terminal strip
 
         Returns:
             SVG markup optimized for library display
         """
+        terminal_strip = key.strip
+
         # Calculate optimal width based on position count
         if terminal_strip.position_count <= 2:
             width = 60
@@ -322,7 +406,7 @@ class TerminalStripIconGenerator:
         else:
             width = 200
 
-        return cls.generate_svg(terminal_strip, width=width, height=60)
+        return TerminalStripIconGenerator.generate_svg(terminal_strip, width=width, height=60)
 
     @classmethod
     def generate_for_schematic(cls, terminal_strip: TerminalStrip,
@@ -366,15 +450,13 @@ def generate_preview_grid(terminal_strips: list) -> str:
         '<div class="grid">'
     ]
 
-    for ts in terminal_strips:
-        svg = TerminalStripIconGenerator.generate_for_library(ts)
-        html_parts.append(f'''
-        <div class="item">
-            <h3>{ts.get_display_name()}</h3>
-            <div class="specs">{ts.get_specification_summary()}</div>
-            {svg}
-        </div>
-        ''')
+    generate_icon = TerminalStripIconGenerator.generate_for_library
+    html_parts.extend([
+        f'<div class="item"><h3>{ts.get_display_name()}</h3>'
+        f'<div class="specs">{ts.get_specification_summary()}</div>'
+        f'{generate_icon(ts)}</div>'
+        for ts in terminal_strips
+    ])
 
     html_parts.append('</div></body></html>')
     return '\n'.join(html_parts)
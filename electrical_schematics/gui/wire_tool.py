@@ -1,11 +1,57 @@
 """Wire drawing tool with multi-point routing."""
 
+import itertools
 from enum import Enum
-from typing import Optional, List, Tuple
-from PySide6.QtCore import QPointF, Signal, QObject
-from PySide6.QtGui import QPainter, QPen, QColor, QBrush
+from typing import Any, Optional, List, Tuple, Dict
+import numpy as np
+from PySide6.QtCore import Qt, QPointF, Signal, QObject, QTimer
+from PySide6.QtGui import QPainter, QPen, QColor, QBrush, QPolygonF, QTransform
 from electrical_schematics.models import Wire, WirePoint, IndustrialComponent
 
+# Candidate count above which the compiled nearest-terminal kernel is used;
+# below it the JIT dispatch overhead outweighs the NumPy temporaries it saves.
+NUMBA_MIN_CANDIDATES = 64
+
+# Zoom level below which waypoint markers are drawn as round points in one
+# call rather than as individual ellipses.
+POINT_MARKER_MAX_ZOOM = 0.5
+
+# Compiled _nearest_terminal: None until first needed, False without numba.
+# numba is imported on first use, since loading it dominates startup time.
+_nearest_terminal_kernel: Any = None
+
+
+def _nearest_terminal(xs, ys, rows, px, py, radius_sq):
+    """Return the row of the nearest terminal within range, or -1."""
+    hit = -1
+    best = radius_sq
+    for k in range(rows.size):
+        row = rows[k]
+        dx = xs[row] - px
+        dy = ys[row] - py
+        d2 = dx * dx + dy * dy
+        if d2 <= radius_sq and (hit < 0 or d2 < best):
+            best = d2
+            hit = row
+    return hit
+
+
+def _get_nearest_terminal_kernel() -> Any:
+    """Compile _nearest_terminal with numba on first call.
+
+    Returns:
+        The compiled kernel, or False if numba is not installed
+    """
+    global _nearest_terminal_kernel
+    if _nearest_terminal_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _nearest_terminal_kernel = False
+        else:
+            _nearest_terminal_kernel = njit(cache=True)(_nearest_terminal)
+    return _nearest_terminal_kernel
+
 
 class WireType(Enum):
     """Types of wires with associated colors."""
@@ -28,6 +74,9 @@ class WireDrawingTool(QObject):
     drawing_cancelled = Signal()
     state_changed = Signal(str)  # State name for UI updates
 
+    # Shared across tool instances so drawn wire IDs never repeat in a session
+    _next_wire_id = itertools.count(1)
+
     def __init__(self):
         """Initialize wire drawing tool."""
         super().__init__()
@@ -45,6 +94,36 @@ class WireDrawingTool(QObject):
         # BUGFIX: Increased from 10.0 to 20.0 for easier clicking
         self.terminal_radius = 20.0
 
+        # Latest status message waiting to be emitted (see _queue_status)
+        self._pending_status: Optional[str] = None
+
+        # Preview polyline buffer, refilled in place on each repaint so its
+        # storage is reused rather than reallocated
+        self._preview_poly = QPolygonF()
+
+        # Terminal index for hit testing: parallel arrays of terminal x, y,
+        # owning component id and terminal index, plus a uniform grid mapping
+        # each cell to its rows. Rebuilt only when a different
+        # terminal_positions dict (or radius) is passed in.
+        self._term_xs = np.empty(0, dtype=np.float64)
+        self._term_ys = np.empty(0, dtype=np.float64)
+        self._term_owner = np.empty(0, dtype=object)
+        self._term_idx = np.empty(0, dtype=np.int32)
+        self._terminal_grid: Dict[Tuple[int, int], np.ndarray] = {}
+        self._terminal_grid_cell = 0.0
+        self._terminal_grid_source: Optional[dict] = None
+
+    @property
+    def terminal_radius(self) -> float:
+        """Terminal detection radius in PDF coordinates."""
+        return self._terminal_radius
+
+    @terminal_radius.setter
+    def terminal_radius(self, radius: float) -> None:
+        """Set the detection radius and its cached square."""
+        self._terminal_radius = radius
+        self._radius_sq = radius * radius
+
     def set_wire_type(self, wire_type: WireType) -> None:
         """Set the current wire type.
 
@@ -87,22 +166,28 @@ class WireDrawingTool(QObject):
         """
         if self.state == DrawingState.IDLE:
             # Try to start wire from a terminal
-            component, terminal_idx = self._find_terminal_at(pdf_pos, components, terminal_positions)
+            component, terminal_idx = self._find_terminal_at(
+                pdf_pos, components, terminal_positions
+            )
 
             if component and terminal_idx is not None:
                 # Start drawing wire
                 self.start_component = component
                 self.start_terminal = terminal_idx
-                self.waypoints = []
+                self.waypoints.clear()
                 self.state = DrawingState.DRAWING
-                self.state_changed.emit("Drawing wire - click to add waypoints, click terminal to complete")
+                self._queue_status(
+                    "Drawing wire - click to add waypoints, click terminal to complete"
+                )
                 return True
 
             return False
 
         elif self.state == DrawingState.DRAWING:
             # Check if clicking on a terminal (to complete wire)
-            component, terminal_idx = self._find_terminal_at(pdf_pos, components, terminal_positions)
+            component, terminal_idx = self._find_terminal_at(
+                pdf_pos, components, terminal_positions
+            )
 
             if component and terminal_idx is not None and component.id != self.start_component.id:
                 # Complete the wire
@@ -146,13 +231,38 @@ class WireDrawingTool(QObject):
     def cancel_drawing(self) -> None:
         """Cancel the current wire drawing."""
         if self.state == DrawingState.DRAWING:
-            self.state = DrawingState.IDLE
-            self.start_component = None
-            self.start_terminal = None
-            self.waypoints = []
-            self.current_cursor_pos = None
+            self._reset_state()
             self.drawing_cancelled.emit()
-            self.state_changed.emit("Wire drawing cancelled")
+            self._queue_status("Wire drawing cancelled")
+
+    def _queue_status(self, message: str) -> None:
+        """Queue a state_changed message for the next event-loop iteration.
+
+        Rapid clicks (e.g. a burst of waypoints) collapse into a single
+        emission carrying the latest message.
+
+        Args:
+            message: Status message for the UI
+        """
+        already_queued = self._pending_status is not None
+        self._pending_status = message
+        if not already_queued:
+            QTimer.singleShot(0, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Emit the queued status message, if any."""
+        message = self._pending_status
+        self._pending_status = None
+        if message is not None:
+            self.state_changed.emit(message)
+
+    def _reset_state(self) -> None:
+        """Return to the idle state, dropping the in-progress wire."""
+        self.state = DrawingState.IDLE
+        self.start_component = None
+        self.start_terminal = None
+        self.waypoints.clear()
+        self.current_cursor_pos = None
 
     def _find_terminal_at(
         self,
@@ -162,6 +272,9 @@ class WireDrawingTool(QObject):
     ) -> Tuple[Optional[IndustrialComponent], Optional[int]]:
         """Find terminal at the given position.
 
+        Only the 3x3 grid cells around the position are searched. When several
+        terminals are within range, the nearest one wins.
+
         Args:
             pos: Position in PDF coordinates
             components: List of all components
@@ -170,21 +283,104 @@ class WireDrawingTool(QObject):
         Returns:
             Tuple of (component, terminal_index) or (None, None)
         """
-        for component in components:
-            if component.id not in terminal_positions:
-                continue
+        grid = self._get_terminal_grid(terminal_positions)
+        if not grid:
+            return None, None
+
+        cell = self._terminal_grid_cell
+        px = pos.x()
+        py = pos.y()
+        cx = int(px // cell)
+        cy = int(py // cell)
+
+        cell_rows = [
+            grid[key]
+            for key in (
+                (cx - 1, cy - 1), (cx, cy - 1), (cx + 1, cy - 1),
+                (cx - 1, cy), (cx, cy), (cx + 1, cy),
+                (cx - 1, cy + 1), (cx, cy + 1), (cx + 1, cy + 1),
+            )
+            if key in grid
+        ]
+        if not cell_rows:
+            return None, None
+        rows = cell_rows[0] if len(cell_rows) == 1 else np.concatenate(cell_rows)
+        components_by_id = {component.id: component for component in components}
+
+        # Dense neighbourhoods: single compiled pass with no temporary arrays
+        kernel = _get_nearest_terminal_kernel() if rows.size > NUMBA_MIN_CANDIDATES else False
+        if kernel:
+            row = kernel(self._term_xs, self._term_ys, rows, px, py, self._radius_sq)
+            if row < 0:
+                return None, None
+            component = components_by_id.get(self._term_owner[row])
+            if component is not None:
+                return component, int(self._term_idx[row])
+            # Nearest terminal belongs to an unlisted component; rank them all below
+
+        # Squared distance from the cursor to every candidate terminal at once
+        dx = self._term_xs[rows] - px
+        dy = self._term_ys[rows] - py
+        d2 = dx * dx + dy * dy
+        in_range = d2 <= self._radius_sq
+        if not in_range.any():
+            return None, None
+
+        hit_rows = rows[in_range]
+        for row in hit_rows[np.argsort(d2[in_range], kind="stable")]:
+            component = components_by_id.get(self._term_owner[row])
+            if component is not None:
+                return component, int(self._term_idx[row])
 
-            terminals = terminal_positions[component.id]
-            for idx, terminal_pos in enumerate(terminals):
-                # Check distance to terminal
-                dx = pos.x() - terminal_pos.x()
-                dy = pos.y() - terminal_pos.y()
-                distance = (dx * dx + dy * dy) ** 0.5
+        return None, None
 
-                if distance <= self.terminal_radius:
-                    return component, idx
+    def _get_terminal_grid(self, terminal_positions: dict) -> Dict[Tuple[int, int], np.ndarray]:
+        """Get the spatial grid for a terminal positions dict.
 
-        return None, None
+        Terminal data is stored as parallel arrays (_term_xs, _term_ys,
+        _term_owner, _term_idx); each grid cell maps to the row indices of
+        the terminals inside it. The index is cached against the dict object,
+        so callers should pass a new dict whenever terminal positions change.
+
+        Args:
+            terminal_positions: Dict mapping component_id -> list of terminal positions
+
+        Returns:
+            Dict mapping (cell_x, cell_y) to row indices of terminals in that cell
+        """
+        # Cells at least one radius wide keep every hit inside the 3x3 block
+        cell = max(self.terminal_radius, 1.0)
+        if terminal_positions is self._terminal_grid_source and cell == self._terminal_grid_cell:
+            return self._terminal_grid
+
+        xs = []
+        ys = []
+        owners = []
+        indices = []
+        for comp_id, terminals in terminal_positions.items():
+            for idx, terminal_pos in enumerate(terminals):
+                xs.append(terminal_pos.x())
+                ys.append(terminal_pos.y())
+                owners.append(comp_id)
+                indices.append(idx)
+
+        self._term_xs = np.asarray(xs, dtype=np.float64)
+        self._term_ys = np.asarray(ys, dtype=np.float64)
+        self._term_owner = np.asarray(owners, dtype=object)
+        self._term_idx = np.asarray(indices, dtype=np.int32)
+
+        cell_lists: Dict[Tuple[int, int], List[int]] = {}
+        cell_xs = np.floor_divide(self._term_xs, cell).astype(np.int64)
+        cell_ys = np.floor_divide(self._term_ys, cell).astype(np.int64)
+        for row, key in enumerate(zip(cell_xs.tolist(), cell_ys.tolist(), strict=True)):
+            cell_lists.setdefault(key, []).append(row)
+
+        self._terminal_grid = {
+            key: np.asarray(rows, dtype=np.intp) for key, rows in cell_lists.items()
+        }
+        self._terminal_grid_cell = cell
+        self._terminal_grid_source = terminal_positions
+        return self._terminal_grid
 
     def _add_waypoint(self, pos: QPointF) -> None:
         """Add a waypoint to the current wire.
@@ -193,7 +389,10 @@ class WireDrawingTool(QObject):
             pos: Waypoint position in PDF coordinates
         """
         self.waypoints.append(pos)
-        self.state_changed.emit(f"Added waypoint {len(self.waypoints)} - click terminal to complete or add more waypoints")
+        self._queue_status(
+            f"Added waypoint {len(self.waypoints)} - "
+            "click terminal to complete or add more waypoints"
+        )
 
     def _complete_wire(
         self,
@@ -213,78 +412,85 @@ class WireDrawingTool(QObject):
         end_pos = terminal_positions[end_component.id][end_terminal]
 
         # Build path: start -> waypoints -> end
-        path_points = []
-        path_points.append(WirePoint(start_pos.x(), start_pos.y()))
-
-        for waypoint in self.waypoints:
-            path_points.append(WirePoint(waypoint.x(), waypoint.y()))
-
-        path_points.append(WirePoint(end_pos.x(), end_pos.y()))
+        path_points = [
+            WirePoint(point.x(), point.y())
+            for point in (start_pos, *self.waypoints, end_pos)
+        ]
 
         # Create wire object
         wire = Wire(
-            id=f"wire_{id(self)}_{len(path_points)}",
+            id=f"wire_{next(self._next_wire_id)}",
             voltage_level=self.current_wire_type.value[2],  # "24VDC", "0V", or "AC"
             path=path_points,
             from_component_id=self.start_component.id,
             to_component_id=end_component.id
         )
 
-        # Reset state
-        self.state = DrawingState.IDLE
-        self.start_component = None
-        self.start_terminal = None
-        self.waypoints = []
-        self.current_cursor_pos = None
+        self._reset_state()
 
         # Emit completion signal
         self.wire_completed.emit(wire)
-        self.state_changed.emit("Wire completed")
+        self._queue_status("Wire completed")
 
-    def render_preview(self, painter: QPainter, zoom_level: float) -> None:
+    def render_preview(
+        self,
+        painter: QPainter,
+        zoom_level: float,
+        terminal_positions: Optional[dict] = None
+    ) -> None:
         """Render wire preview while drawing.
 
+        The path runs from the start terminal (when its position is known)
+        through the waypoints to the cursor and is drawn as a single polyline.
+
         Args:
             painter: Qt painter
             zoom_level: Current zoom level
+            terminal_positions: Optional dict mapping component_id -> list of
+                terminal positions, used to start the path at the terminal
         """
         if self.state != DrawingState.DRAWING or not self.start_component:
             return
 
+        # Start terminal -> waypoints -> cursor, in PDF coordinates
+        poly = self._preview_poly
+        poly.clear()
+        if terminal_positions and self.start_component.id in terminal_positions:
+            poly.append(terminal_positions[self.start_component.id][self.start_terminal])
+        for waypoint in self.waypoints:
+            poly.append(waypoint)
+        if self.current_cursor_pos:
+            poly.append(self.current_cursor_pos)
+        if poly.size() < 2:
+            return
+
         # Get wire color
         wire_color = self.current_wire_type.value[1]
-        pen = QPen(wire_color, 3, )
+        pen = QPen(wire_color, 3, Qt.PenStyle.DashLine)
+        # Keep the stroke width in screen pixels under the scaling transform
+        pen.setCosmetic(True)
+
+        # Draw in PDF coordinates and let Qt scale to screen space
+        scale = zoom_level * 2
+        painter.save()
+        painter.setTransform(QTransform.fromScale(scale, scale), True)
         painter.setPen(pen)
+        painter.drawPolyline(poly)
+
+        # Draw waypoint markers (sizes given in screen pixels)
+        if self.waypoints:
+            if zoom_level < POINT_MARKER_MAX_ZOOM:
+                dot_pen = QPen(wire_color, 8, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+                dot_pen.setCosmetic(True)
+                painter.setPen(dot_pen)
+                painter.drawPoints(QPolygonF(self.waypoints))
+            else:
+                painter.setBrush(QBrush(wire_color))
+                marker_radius = 4 / scale
+                for waypoint in self.waypoints:
+                    painter.drawEllipse(waypoint, marker_radius, marker_radius)
 
-        # We need the start position - this would come from the terminal positions
-        # For preview, we'll draw from waypoints if any exist, or just show cursor line
-        if len(self.waypoints) > 0 and self.current_cursor_pos:
-            # Draw line from last waypoint to cursor
-            last_waypoint = self.waypoints[-1]
-            screen_start = self._to_screen_coords(last_waypoint, zoom_level)
-            screen_end = self._to_screen_coords(self.current_cursor_pos, zoom_level)
-            painter.drawLine(screen_start, screen_end)
-
-        # Draw waypoint markers
-        painter.setBrush(QBrush(wire_color))
-        for waypoint in self.waypoints:
-            screen_pos = self._to_screen_coords(waypoint, zoom_level)
-            painter.drawEllipse(screen_pos, 4, 4)
-
-    def _to_screen_coords(self, pdf_pos: QPointF, zoom_level: float) -> QPointF:
-        """Convert PDF coordinates to screen coordinates.
-
-        Args:
-            pdf_pos: Position in PDF coordinates
-            zoom_level: Current zoom level
-
-        Returns:
-            Position in screen coordinates
-        """
-        return QPointF(
-            pdf_pos.x() * zoom_level * 2,
-            pdf_pos.y() * zoom_level * 2
-        )
+        painter.restore()
 
     def get_preview_path(self, terminal_positions: dict) -> Optional[List[QPointF]]:
         """Get the current preview path including cursor position.
@@ -1,33 +1,67 @@
-"""Data models for electrical schematics."""
-
-from electrical_schematics.models.industrial_component import (
-    IndustrialComponent,
-    IndustrialComponentType,
-    SensorState,
-    ContactType,
-    ContactBlock,
-    CoilTerminals,
-    PagePosition
-)
-from electrical_schematics.models.wire import Wire, WirePoint
-from electrical_schematics.models.diagram import WiringDiagram
-
-# New data model for library separation
-from electrical_schematics.models.library_part import LibraryPart
-from electrical_schematics.models.project_component import ProjectComponent
-
-# Terminal strips/blocks
-from electrical_schematics.models.terminal_strip import (
-    TerminalStrip,
-    TerminalStripType,
-    TerminalColor,
-    TerminalPosition
-)
-
-# Legacy imports for backwards compatibility
-from electrical_schematics.models.component import Component, ComponentType
-from electrical_schematics.models.connection import Connection, Pin
-from electrical_schematics.models.schematic import Schematic
+"""Data models for electrical schematics.
+
+Model classes are imported lazily on first attribute access (PEP 562), so
+importing a single model does not load every model module.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from electrical_schematics.models.industrial_component import (
+        IndustrialComponent,
+        IndustrialComponentType,
+        SensorState,
+        ContactType,
+        ContactBlock,
+        CoilTerminals,
+        PagePosition
+    )
+    from electrical_schematics.models.wire import Wire, WirePoint
+    from electrical_schematics.models.diagram import WiringDiagram
+    from electrical_schematics.models.library_part import LibraryPart
+    from electrical_schematics.models.project_component import ProjectComponent
+    from electrical_schematics.models.terminal_strip import (
+        TerminalStrip,
+        TerminalStripType,
+        TerminalColor,
+        TerminalPosition
+    )
+    from electrical_schematics.models.component import Component, ComponentType
+    from electrical_schematics.models.connection import Connection, Pin
+    from electrical_schematics.models.schematic import Schematic
+
+_INDUSTRIAL = "electrical_schematics.models.industrial_component"
+_TERMINAL_STRIP = "electrical_schematics.models.terminal_strip"
+
+# Exported name -> module that defines it
+_LAZY = {
+    # Industrial components (current)
+    "IndustrialComponent": _INDUSTRIAL,
+    "IndustrialComponentType": _INDUSTRIAL,
+    "SensorState": _INDUSTRIAL,
+    "ContactType": _INDUSTRIAL,
+    "ContactBlock": _INDUSTRIAL,
+    "CoilTerminals": _INDUSTRIAL,
+    "PagePosition": _INDUSTRIAL,
+    "Wire": "electrical_schematics.models.wire",
+    "WirePoint": "electrical_schematics.models.wire",
+    "WiringDiagram": "electrical_schematics.models.diagram",
+    # Library separation (new)
+    "LibraryPart": "electrical_schematics.models.library_part",
+    "ProjectComponent": "electrical_schematics.models.project_component",
+    # Terminal strips
+    "TerminalStrip": _TERMINAL_STRIP,
+    "TerminalStripType": _TERMINAL_STRIP,
+    "TerminalColor": _TERMINAL_STRIP,
+    "TerminalPosition": _TERMINAL_STRIP,
+    # Legacy
+    "Component": "electrical_schematics.models.component",
+    "ComponentType": "electrical_schematics.models.component",
+    "Connection": "electrical_schematics.models.connection",
+    "Pin": "electrical_schematics.models.connection",
+    "Schematic": "electrical_schematics.models.schematic",
+}
 
 __all__ = [
     # Industrial components (current)
@@ -56,3 +90,29 @@ __all__ = [
     "Pin",
     "Schematic",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported model on first access and cache it on the package.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The requested model class or enum
+
+    Raises:
+        AttributeError: If the name is not an exported model
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including the not yet imported models."""
+    return sorted(set(globals()) | set(__all__))
@@ -22,7 +22,7 @@ class ComponentType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     """Represents an electrical component in a schematic."""
 
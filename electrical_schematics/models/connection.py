@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Pin:
     """Represents a pin on a component."""
 
@@ -15,7 +15,7 @@ class Pin:
     y: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     """Represents a connection (wire/net) between pins."""
 
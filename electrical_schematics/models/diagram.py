@@ -2,12 +2,16 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Sequence, Tuple
 from electrical_schematics.models.industrial_component import IndustrialComponent, SensorState
 from electrical_schematics.models.wire import Wire
 
 
-@dataclass
+# Shared result for components with no incident wires
+_EMPTY_TUPLE: Tuple[Wire, ...] = ()
+
+
+@dataclass(slots=True)
 class WiringDiagram:
     """Represents a complete industrial wiring diagram."""
 
@@ -20,31 +24,168 @@ class WiringDiagram:
 
     metadata: Dict[str, str] = field(default_factory=dict)
 
+    # Lookup indexes over components and wires. Each is rebuilt lazily when
+    # its list is replaced or changes length; component lookups that miss
+    # fall back to a scan, so in-place edits are still found.
+    _by_id: Dict[str, IndustrialComponent] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_designation: Dict[str, IndustrialComponent] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Components by role, in components order
+    _power_sources: List[IndustrialComponent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _sensors: List[IndustrialComponent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _indexed: Optional[Tuple[List[IndustrialComponent], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Component id -> incident wires (adjacency list); unconnected ends key on None
+    _incidence: Dict[Optional[str], List[Wire]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _incidence_stamp: Optional[Tuple[List[Wire], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build lookup indexes for the initial components and wires."""
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the component and wire lookup indexes.
+
+        Needed only after editing component types or wire endpoints in
+        place; list appends, removals and reassignment are picked up
+        automatically, and id/designation lookups rescan on a miss.
+        """
+        by_id: Dict[str, IndustrialComponent] = {}
+        by_designation: Dict[str, IndustrialComponent] = {}
+        power_sources: List[IndustrialComponent] = []
+        sensors: List[IndustrialComponent] = []
+        # setdefault keeps the first match, as the old linear scans did
+        for comp in self.components:
+            by_id.setdefault(comp.id, comp)
+            by_designation.setdefault(comp.designation, comp)
+            if comp.is_power_source():
+                power_sources.append(comp)
+            if comp.is_sensor():
+                sensors.append(comp)
+
+        self._by_id = by_id
+        self._by_designation = by_designation
+        self._power_sources = power_sources
+        self._sensors = sensors
+        self._indexed = (self.components, len(self.components))
+        self._rebuild_incidence()
+
+    def _rebuild_incidence(self) -> None:
+        """Rebuild the component id -> incident wires index from self.wires."""
+        incidence: Dict[Optional[str], List[Wire]] = {}
+        for wire in self.wires:
+            self._index_wire(incidence, wire)
+        self._incidence = incidence
+        self._incidence_stamp = (self.wires, len(self.wires))
+
+    @staticmethod
+    def _index_wire(incidence: Dict[Optional[str], List[Wire]], wire: Wire) -> None:
+        """Add a wire to the lists of both of its endpoint components."""
+        incidence.setdefault(wire.from_component_id, []).append(wire)
+        if wire.to_component_id != wire.from_component_id:
+            incidence.setdefault(wire.to_component_id, []).append(wire)
+
+    def _ensure_index(self) -> None:
+        """Rebuild the component indexes if the components list changed."""
+        indexed = self._indexed
+        if (indexed is None
+                or indexed[0] is not self.components
+                or indexed[1] != len(self.components)):
+            self.reindex()
+
+    def _ensure_incidence(self) -> None:
+        """Rebuild the incidence index if the wires list changed."""
+        stamp = self._incidence_stamp
+        if stamp is None or stamp[0] is not self.wires or stamp[1] != len(self.wires):
+            self._rebuild_incidence()
+
+    def add_component(self, component: IndustrialComponent) -> None:
+        """Add a component and update the lookup indexes."""
+        self._ensure_index()
+        self.components.append(component)
+        self._by_id.setdefault(component.id, component)
+        self._by_designation.setdefault(component.designation, component)
+        if component.is_power_source():
+            self._power_sources.append(component)
+        if component.is_sensor():
+            self._sensors.append(component)
+        self._indexed = (self.components, len(self.components))
+
+    def add_wire(self, wire: Wire) -> None:
+        """Add a wire and update the incidence index."""
+        self._ensure_incidence()
+        self.wires.append(wire)
+        self._index_wire(self._incidence, wire)
+        self._incidence_stamp = (self.wires, len(self.wires))
+
     def get_component(self, component_id: str) -> Optional[IndustrialComponent]:
         """Get a component by ID."""
-        for comp in self.components:
-            if comp.id == component_id:
-                return comp
-        return None
+        self._ensure_index()
+        comp = self._by_id.get(component_id)
+        if comp is not None and comp.id == component_id:
+            return comp
+        return self._rescan_components(lambda c: c.id == component_id)
 
     def get_component_by_designation(self, designation: str) -> Optional[IndustrialComponent]:
         """Get a component by its designation (e.g., 'S1', 'K1')."""
+        self._ensure_index()
+        comp = self._by_designation.get(designation)
+        if comp is not None and comp.designation == designation:
+            return comp
+        return self._rescan_components(lambda c: c.designation == designation)
+
+    def _rescan_components(
+        self, matches: Callable[[IndustrialComponent], bool]
+    ) -> Optional[IndustrialComponent]:
+        """Find a component the lookup dicts missed by scanning components.
+
+        Components can be replaced or edited in place without the diagram
+        noticing. A stale hit or a real miss falls back to the linear scan;
+        if the scan finds a component, the indexes are out of date and are
+        rebuilt on next use.
+        """
         for comp in self.components:
-            if comp.designation == designation:
+            if matches(comp):
+                self._indexed = None
                 return comp
         return None
 
-    def get_wires_for_component(self, component_id: str) -> List[Wire]:
-        """Get all wires connected to a specific component."""
-        return [wire for wire in self.wires if wire.connects_to(component_id)]
+    def get_wires_for_component(self, component_id: str) -> Sequence[Wire]:
+        """Get all wires connected to a specific component.
+
+        The returned sequence is shared with the index and must not be
+        modified; use add_wire() to connect new wires.
+        """
+        self._ensure_incidence()
+        return self._incidence.get(component_id, _EMPTY_TUPLE)
 
     def get_power_sources(self) -> List[IndustrialComponent]:
-        """Get all power source components."""
-        return [comp for comp in self.components if comp.is_power_source()]
+        """Get all power source components.
+
+        The returned list is shared with the index and must not be modified.
+        """
+        self._ensure_index()
+        return self._power_sources
 
     def get_sensors(self) -> List[IndustrialComponent]:
-        """Get all sensor/switch components."""
-        return [comp for comp in self.components if comp.is_sensor()]
+        """Get all sensor/switch components.
+
+        The returned list is shared with the index and must not be modified.
+        """
+        self._ensure_index()
+        return self._sensors
 
     def set_sensor_state(self, designation: str, state: SensorState) -> bool:
         """
@@ -63,6 +204,12 @@ class WiringDiagram:
             return True
         return False
 
+    def update_contact_states(self) -> None:
+        """Update every contact block in the diagram from its owner's coil."""
+        for comp in self.components:
+            if comp.contact_blocks:
+                comp.update_contact_states()
+
     def reset_all_sensor_states(self) -> None:
         """Reset all sensors to UNKNOWN state."""
         for comp in self.get_sensors():
@@ -1,8 +1,10 @@
 """Data models for industrial electrical components."""
 
+import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, FrozenSet, Tuple
 
 
 class IndustrialComponentType(Enum):
@@ -61,7 +63,35 @@ class ContactType(Enum):
     CHANGEOVER = "changeover" # SPDT (has both NO and NC)
 
 
-@dataclass
+# Description patterns
+_PAGE_RE = re.compile(r'Page (\d+)')
+_PAGE_STRIP_RE = re.compile(r'\s*Page\s+\d+\s*')
+_DESIG_DUP_RE = re.compile(r'(-[A-Z]\d+)\s+\1')
+_WS_RE = re.compile(r'\s+')
+
+# Component type groups for the is_* predicates
+_POWER_TYPES = frozenset({
+    IndustrialComponentType.POWER_24VDC,
+    IndustrialComponentType.POWER_400VAC,
+    IndustrialComponentType.POWER_230VAC,
+})
+_SENSOR_TYPES = frozenset({
+    IndustrialComponentType.PROXIMITY_SENSOR,
+    IndustrialComponentType.PHOTOELECTRIC_SENSOR,
+    IndustrialComponentType.LIMIT_SWITCH,
+    IndustrialComponentType.PRESSURE_SWITCH,
+    IndustrialComponentType.TEMPERATURE_SENSOR,
+    IndustrialComponentType.PUSH_BUTTON,
+    IndustrialComponentType.EMERGENCY_STOP,
+    IndustrialComponentType.PLC_INPUT_STATE,  # Toggleable PLC input
+})
+_RELAY_TYPES = frozenset({
+    IndustrialComponentType.RELAY,
+    IndustrialComponentType.CONTACTOR,
+})
+
+
+@dataclass(slots=True)
 class ContactBlock:
     """Represents a contact block on a relay or contactor.
 
@@ -76,6 +106,15 @@ class ContactBlock:
     # State tracking
     is_closed: bool = False      # Current state (closed = conducting)
 
+    # get_designation results by parent designation, valid while the
+    # terminals are the (terminal_from, terminal_to) objects in the stamp
+    _designation_cache: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _designation_stamp: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def get_designation(self, parent_designation: str = "") -> str:
         """Get full contact designation.
 
@@ -87,10 +126,22 @@ class ContactBlock:
         """
         if self.label:
             return self.label
+
+        stamp = self._designation_stamp
+        if (stamp is not None
+                and stamp[0] is self.terminal_from
+                and stamp[1] is self.terminal_to):
+            cached = self._designation_cache.get(parent_designation)
+            if cached is not None:
+                return cached
+        else:
+            self._designation_cache.clear()
+            self._designation_stamp = (self.terminal_from, self.terminal_to)
+
         base = f"{self.terminal_from}-{self.terminal_to}"
-        if parent_designation:
-            return f"{parent_designation}:{base}"
-        return base
+        result = f"{parent_designation}:{base}" if parent_designation else base
+        self._designation_cache[parent_designation] = result
+        return result
 
     def get_state_for_coil(self, coil_energized: bool) -> bool:
         """Determine if contact is closed based on coil state.
@@ -101,23 +152,19 @@ class ContactBlock:
         Returns:
             True if contact is closed (conducting)
         """
-        if self.contact_type == ContactType.NO:
-            return coil_energized
-        elif self.contact_type == ContactType.NC:
-            return not coil_energized
-        else:
-            # Changeover - state depends on which terminal pair is queried
-            return coil_energized
+        # NC contacts invert the coil state; changeover contacts report
+        # their NO side, like NO contacts
+        return bool(coil_energized) ^ (self.contact_type is ContactType.NC)
 
 
-@dataclass
+@dataclass(slots=True)
 class CoilTerminals:
     """Represents coil terminals for a relay/contactor."""
     positive: str = "A1"  # Positive coil terminal
     negative: str = "A2"  # Negative coil terminal
 
 
-@dataclass
+@dataclass(slots=True)
 class PagePosition:
     """Position of a component on a specific PDF page.
 
@@ -131,7 +178,25 @@ class PagePosition:
     confidence: float = 1.0  # Match confidence (0.0 to 1.0)
 
 
-@dataclass
+# Default contact blocks per component type as
+# (terminal_from, terminal_to, contact_type, label) templates
+_RELAY_TEMPLATE = (
+    ("13", "14", ContactType.NO, None),
+)
+_CONTACTOR_TEMPLATE = (
+    # 3 main contacts (power) + 1 auxiliary NO
+    ("1", "2", ContactType.NO, "L1-T1"),
+    ("3", "4", ContactType.NO, "L2-T2"),
+    ("5", "6", ContactType.NO, "L3-T3"),
+    ("13", "14", ContactType.NO, None),
+)
+_DEFAULT_CONTACT_TEMPLATES = {
+    IndustrialComponentType.RELAY: _RELAY_TEMPLATE,
+    IndustrialComponentType.CONTACTOR: _CONTACTOR_TEMPLATE,
+}
+
+
+@dataclass(slots=True)
 class IndustrialComponent:
     """Represents an industrial electrical component.
 
@@ -185,49 +250,55 @@ class IndustrialComponent:
     # Light color (for indicator lights)
     light_color: Optional[str] = None  # e.g., "green", "red", "yellow"
 
+    # Highest confidence among page_positions (-1.0 when there are none)
+    _best_confidence: float = field(default=-1.0, init=False, repr=False, compare=False)
+
+    # Bit p set for every page p in page_positions
+    _page_bitmask: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Last get_display_description result as (description, max_length, text)
+    _display_cache: Optional[Tuple[str, int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Initialize mutable defaults and set up default configurations."""
+        # Intern lookup keys so repeated comparisons hit the identity fast path
+        self.id = sys.intern(self.id)
+        self.designation = sys.intern(self.designation)
+
         # Initialize coil terminals for relays/contactors if not set
-        if self.coil_terminals is None and self.type in [
-            IndustrialComponentType.RELAY,
-            IndustrialComponentType.CONTACTOR
-        ]:
+        if self.coil_terminals is None and self.type in _RELAY_TYPES:
             self.coil_terminals = CoilTerminals()
 
         # Set up default contact blocks for relays/contactors if none specified
-        if not self.contact_blocks and self.type in [
-            IndustrialComponentType.RELAY,
-            IndustrialComponentType.CONTACTOR
-        ]:
+        if not self.contact_blocks and self.type in _RELAY_TYPES:
             self._setup_default_contacts()
 
+        if self.page_positions:
+            self._best_confidence = max(
+                pos.confidence for pos in self.page_positions.values()
+            )
+            for page in self.page_positions:
+                if page >= 0:
+                    self._page_bitmask |= 1 << page
+
         # Try to extract page number from description if not set
         if self.page == 0 and self.description:
             self._extract_page_from_description()
 
     def _extract_page_from_description(self) -> None:
         """Extract page number from description if present."""
-        import re
         if self.description:
-            match = re.search(r'Page (\d+)', self.description)
+            match = _PAGE_RE.search(self.description)
             if match:
                 self.page = int(match.group(1)) - 1  # Convert to 0-indexed
 
     def _setup_default_contacts(self) -> None:
         """Set up default contact configuration based on component type."""
-        if self.type == IndustrialComponentType.RELAY:
-            # Default relay: 1 NO contact (13-14)
-            self.contact_blocks = [
-                ContactBlock("13", "14", ContactType.NO)
-            ]
-        elif self.type == IndustrialComponentType.CONTACTOR:
-            # Default contactor: 3 main contacts (power) + 1 auxiliary NO
-            self.contact_blocks = [
-                ContactBlock("1", "2", ContactType.NO, label="L1-T1"),
-                ContactBlock("3", "4", ContactType.NO, label="L2-T2"),
-                ContactBlock("5", "6", ContactType.NO, label="L3-T3"),
-                ContactBlock("13", "14", ContactType.NO),  # Auxiliary NO
-            ]
+        template = _DEFAULT_CONTACT_TEMPLATES.get(self.type)
+        if template is not None:
+            self.contact_blocks = [ContactBlock(*t) for t in template]
 
     def add_page_position(
         self,
@@ -250,6 +321,7 @@ class IndustrialComponent:
             height: Height in PDF points
             confidence: Match confidence (0.0 to 1.0)
         """
+        replaced = self.page_positions.get(page)
         self.page_positions[page] = PagePosition(
             page=page,
             x=x,
@@ -258,11 +330,18 @@ class IndustrialComponent:
             height=height,
             confidence=confidence
         )
+        if page >= 0:
+            self._page_bitmask |= 1 << page
+
+        if replaced is not None and replaced.confidence >= self._best_confidence:
+            # Overwrote the best position: recompute from what remains
+            self._best_confidence = max(
+                pos.confidence for pos in self.page_positions.values()
+            )
 
         # If this is the first position or has higher confidence, make it primary
-        if len(self.page_positions) == 1 or confidence >= max(
-            pos.confidence for pos in self.page_positions.values()
-        ):
+        if len(self.page_positions) == 1 or confidence >= self._best_confidence:
+            self._best_confidence = confidence
             self.page = page
             self.x = x
             self.y = y
@@ -276,7 +355,16 @@ class IndustrialComponent:
             List of page numbers (0-indexed), sorted
         """
         if self.page_positions:
-            return sorted(self.page_positions.keys())
+            bits = self._page_bitmask
+            if bits.bit_count() != len(self.page_positions):
+                # Page dict edited directly or holds negative pages
+                return sorted(self.page_positions.keys())
+            pages = []
+            while bits:
+                low = bits & -bits
+                pages.append(low.bit_length() - 1)
+                bits ^= low
+            return pages
         elif self.x != 0.0 or self.y != 0.0:
             return [self.page]
         return []
@@ -312,7 +400,11 @@ class IndustrialComponent:
         Returns:
             True if component is on this page
         """
-        if page in self.page_positions:
+        bits = self._page_bitmask
+        if page >= 0 and bits >> page & 1:
+            return True
+        if bits.bit_count() != len(self.page_positions) and page in self.page_positions:
+            # Page dict edited directly or holds negative pages
             return True
         if page == self.page and (self.x != 0.0 or self.y != 0.0):
             return True
@@ -349,7 +441,7 @@ class IndustrialComponent:
         Returns:
             List of matching ContactBlock objects
         """
-        return [c for c in self.contact_blocks if c.contact_type == contact_type]
+        return [c for c in self.contact_blocks if c.contact_type is contact_type]
 
     def get_no_contacts(self) -> List[ContactBlock]:
         """Get all normally-open contacts."""
@@ -361,8 +453,9 @@ class IndustrialComponent:
 
     def update_contact_states(self) -> None:
         """Update all contact states based on coil energization."""
+        coil_energized = bool(self.coil_energized)
         for contact in self.contact_blocks:
-            contact.is_closed = contact.get_state_for_coil(self.coil_energized)
+            contact.is_closed = coil_energized ^ (contact.contact_type is ContactType.NC)
 
     def energize_coil(self) -> None:
         """Energize the coil (for relays/contactors)."""
@@ -388,31 +481,15 @@ class IndustrialComponent:
 
     def is_power_source(self) -> bool:
         """Check if component is a power source."""
-        return self.type in [
-            IndustrialComponentType.POWER_24VDC,
-            IndustrialComponentType.POWER_400VAC,
-            IndustrialComponentType.POWER_230VAC,
-        ]
+        return self.type in _POWER_TYPES
 
     def is_sensor(self) -> bool:
         """Check if component is a sensor or switch."""
-        return self.type in [
-            IndustrialComponentType.PROXIMITY_SENSOR,
-            IndustrialComponentType.PHOTOELECTRIC_SENSOR,
-            IndustrialComponentType.LIMIT_SWITCH,
-            IndustrialComponentType.PRESSURE_SWITCH,
-            IndustrialComponentType.TEMPERATURE_SENSOR,
-            IndustrialComponentType.PUSH_BUTTON,
-            IndustrialComponentType.EMERGENCY_STOP,
-            IndustrialComponentType.PLC_INPUT_STATE,  # Toggleable PLC input
-        ]
+        return self.type in _SENSOR_TYPES
 
     def is_relay_or_contactor(self) -> bool:
         """Check if component is a relay or contactor."""
-        return self.type in [
-            IndustrialComponentType.RELAY,
-            IndustrialComponentType.CONTACTOR,
-        ]
+        return self.type in _RELAY_TYPES
 
     def is_energized(self) -> bool:
         """Check if component allows current flow based on its state.
@@ -440,8 +517,13 @@ class IndustrialComponent:
         Returns:
             String like "3NO + 1NC" or "1NO"
         """
-        no_count = len(self.get_no_contacts())
-        nc_count = len(self.get_nc_contacts())
+        # Count both types in one pass over the blocks
+        no_count = nc_count = 0
+        for contact in self.contact_blocks:
+            if contact.contact_type is ContactType.NO:
+                no_count += 1
+            elif contact.contact_type is ContactType.NC:
+                nc_count += 1
 
         parts = []
         if no_count > 0:
@@ -451,23 +533,24 @@ class IndustrialComponent:
 
         return " + ".join(parts) if parts else "No contacts"
 
-    def get_terminal_labels(self) -> List[str]:
-        """Get list of all terminal labels for this component.
+    def get_terminal_labels(self) -> FrozenSet[str]:
+        """Get the set of all terminal labels for this component.
 
         Returns:
-            List of terminal labels
+            Frozen set of contact and coil terminal labels
         """
-        terminals = []
+        # Contact terminals, deduplicated as they are collected
+        terminals = {
+            terminal
+            for contact in self.contact_blocks
+            for terminal in (contact.terminal_from, contact.terminal_to)
+        }
 
         # Add coil terminals for relays/contactors
         if self.coil_terminals:
-            terminals.extend([self.coil_terminals.positive, self.coil_terminals.negative])
-
-        # Add contact terminals
-        for contact in self.contact_blocks:
-            terminals.extend([contact.terminal_from, contact.terminal_to])
+            terminals.update((self.coil_terminals.positive, self.coil_terminals.negative))
 
-        return list(set(terminals))  # Remove duplicates
+        return frozenset(terminals)
 
     def get_display_description(self, max_length: int = 40) -> str:
         """Get a cleaned-up description suitable for display.
@@ -484,20 +567,26 @@ class IndustrialComponent:
         if not self.description:
             return self.type.value.replace('_', ' ').title()
 
+        cached = self._display_cache
+        if (cached is not None and cached[0] == self.description
+                and cached[1] == max_length):
+            return cached[2]
+
         desc = self.description
 
         # Remove common German patterns that duplicate info
-        import re
         # Remove "Page XX" from display (it's shown separately)
-        desc = re.sub(r'\s*Page\s+\d+\s*', ' ', desc)
+        desc = _PAGE_STRIP_RE.sub(' ', desc)
         # Remove duplicate designation patterns like "-K1 -K1"
-        desc = re.sub(r'(-[A-Z]\d+)\s+\1', r'\1', desc)
+        desc = _DESIG_DUP_RE.sub(r'\1', desc)
         # Clean up multiple spaces
-        desc = re.sub(r'\s+', ' ', desc).strip()
+        desc = _WS_RE.sub(' ', desc).strip()
 
         # Truncate with ellipsis if too long
         if len(desc) > max_length:
-            return desc[:max_length - 3] + '...'
+            desc = desc[:max_length - 3] + '...'
+
+        self._display_cache = (self.description, max_length, desc)
         return desc
 
     def __str__(self) -> str:
@@ -1,12 +1,16 @@
 """Data model for library parts (master catalog)."""
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from pathlib import Path
 
+# Bound once; mutators stamp updated_at in batch loops
+_now = datetime.now
 
-@dataclass
+
+@dataclass(slots=True)
 class LibraryPart:
     """A unique part in the master component library.
 
@@ -60,8 +64,8 @@ class LibraryPart:
     icon_svg: Optional[str] = None  # Generated IEC 60617 symbol
 
     # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
     digikey_lookup_attempted: bool = False
     digikey_lookup_success: bool = False
 
@@ -74,7 +78,9 @@ class LibraryPart:
         if not self.manufacturer_part_number:
             raise ValueError("manufacturer_part_number is required")
         # Normalize part number: strip whitespace, uppercase
-        self.manufacturer_part_number = self.manufacturer_part_number.strip().upper()
+        self.manufacturer_part_number = sys.intern(
+            self.manufacturer_part_number.strip().upper()
+        )
 
     def update_from_digikey(self, digikey_data: Dict[str, Any]) -> None:
         """Update part with data from DigiKey API response.
@@ -125,7 +131,7 @@ class LibraryPart:
             else:
                 self.manufacturer = str(manufacturer)
 
-        self.updated_at = datetime.now()
+        self.updated_at = _now()
 
     def has_complete_digikey_data(self) -> bool:
         """Check if part has complete DigiKey data.
@@ -200,49 +206,52 @@ class LibraryPart:
         Returns:
             LibraryPart instance
         """
-        # Parse datetime fields
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-
-        updated_at = data.get("updated_at")
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
-        elif updated_at is None:
-            updated_at = datetime.now()
-
-        return cls(
-            manufacturer_part_number=data["manufacturer_part_number"],
-            manufacturer=data.get("manufacturer", ""),
-            description=data.get("description", ""),
-            category=data.get("category", ""),
-            subcategory=data.get("subcategory", ""),
-            technical_data=data.get("technical_data", ""),
-            voltage_rating=data.get("voltage_rating", ""),
-            current_rating=data.get("current_rating", ""),
-            power_rating=data.get("power_rating", ""),
-            component_type=data.get("component_type", ""),
-            digikey_part_number=data.get("digikey_part_number"),
-            digikey_description=data.get("digikey_description"),
-            digikey_url=data.get("digikey_url"),
-            datasheet_url=data.get("datasheet_url"),
-            image_url=data.get("image_url"),
-            photo_path=data.get("photo_path"),
-            datasheet_path=data.get("datasheet_path"),
-            unit_price=data.get("unit_price"),
-            stock_quantity=data.get("stock_quantity"),
-            parameters=data.get("parameters", {}),
-            contact_config=data.get("contact_config"),
-            icon_svg=data.get("icon_svg"),
-            created_at=created_at,
-            updated_at=updated_at,
-            digikey_lookup_attempted=data.get("digikey_lookup_attempted", False),
-            digikey_lookup_success=data.get("digikey_lookup_success", False),
-            tags=data.get("tags", []),
-            notes=data.get("notes", ""),
-        )
+        # Fields absent from data fall back to the dataclass defaults
+        kwargs = {name: data[name] for name in _INIT_FIELDS if name in data}
+        # Required field: raise KeyError when missing
+        kwargs["manufacturer_part_number"] = data["manufacturer_part_number"]
+
+        # Parse datetime fields; missing ones share one timestamp
+        now = _now()
+        for name in ("created_at", "updated_at"):
+            value = kwargs.get(name)
+            if isinstance(value, str):
+                kwargs[name] = datetime.fromisoformat(value)
+            elif value is None:
+                kwargs[name] = now
+
+        return cls(**kwargs)
+
+    @classmethod
+    def bulk_load(cls, items: Iterable[Dict[str, Any]]) -> List["LibraryPart"]:
+        """Create LibraryParts from many dictionaries.
+
+        Parts without stored timestamps share a single datetime.now() taken
+        once for the whole batch, and identical ISO timestamp strings (common
+        after bulk imports) are parsed once and share one datetime.
+
+        Args:
+            items: Dictionaries with part data
+
+        Returns:
+            LibraryPart instances in input order
+        """
+        now = _now()
+        parsed: Dict[str, datetime] = {}
+        parts = []
+        for data in items:
+            data = dict(data)
+            for name in ("created_at", "updated_at"):
+                value = data.get(name)
+                if value is None:
+                    data[name] = now
+                elif isinstance(value, str):
+                    stamp = parsed.get(value)
+                    if stamp is None:
+                        stamp = parsed[value] = datetime.fromisoformat(value)
+                    data[name] = stamp
+            parts.append(cls.from_dict(data))
+        return parts
 
     def get_display_name(self) -> str:
         """Get a human-readable display name for the part.
@@ -265,6 +274,8 @@ class LibraryPart:
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on manufacturer part number."""
+        if self is other:
+            return True
         if not isinstance(other, LibraryPart):
             return False
         return self.manufacturer_part_number == other.manufacturer_part_number
@@ -272,3 +283,7 @@ class LibraryPart:
     def __hash__(self) -> int:
         """Hash based on manufacturer part number."""
         return hash(self.manufacturer_part_number)
+
+
+# Constructor field names, used by LibraryPart.from_dict
+_INIT_FIELDS = tuple(f.name for f in fields(LibraryPart) if f.init)
@@ -1,8 +1,24 @@
 """Data model for project components (schematic instances)."""
 
+import json
+import sys
+from bisect import insort
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Bound once; mutators stamp updated_at in batch loops
+_now = datetime.now
+
+
+# String fields shared by many components, stored interned
+_INTERNED_FIELDS = ("project_id", "manufacturer_part_number")
 
 
 @dataclass
@@ -62,10 +78,20 @@ class ProjectComponent:
     initial_state: str = "unknown"  # Default state when simulation starts
 
     # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
     notes: str = ""
 
+    # Page -> first additional_positions entry on that page, valid while the
+    # list is the stamped object at the stamped length; add_position keeps
+    # it current
+    _positions_by_page: Dict[int, Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _pages_stamp: Optional[Tuple[List[Dict[str, Any]], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Validate required fields."""
         if not self.project_id:
@@ -81,6 +107,10 @@ class ProjectComponent:
         # Normalize part number
         self.manufacturer_part_number = self.manufacturer_part_number.strip().upper()
 
+        # Part numbers and project ids repeat across many components
+        for name in _INTERNED_FIELDS:
+            setattr(self, name, sys.intern(getattr(self, name)))
+
     def add_position(
         self,
         page: int,
@@ -110,8 +140,25 @@ class ProjectComponent:
             "height": height,
             "confidence": confidence,
         }
-        self.additional_positions.append(position)
-        self.updated_at = datetime.now()
+        positions = self.additional_positions
+        stamp = self._pages_stamp
+        positions.append(position)
+        if stamp is not None and stamp[0] is positions and stamp[1] == len(positions) - 1:
+            self._positions_by_page.setdefault(page, position)
+            self._pages_stamp = (positions, len(positions))
+        self.updated_at = _now()
+
+    def _get_positions_by_page(self) -> Dict[int, Dict[str, Any]]:
+        """Return the page index of additional_positions, rebuilding it if stale."""
+        positions = self.additional_positions
+        stamp = self._pages_stamp
+        if stamp is None or stamp[0] is not positions or stamp[1] != len(positions):
+            by_page: Dict[int, Dict[str, Any]] = {}
+            for pos in positions:
+                by_page.setdefault(pos["page"], pos)
+            self._positions_by_page = by_page
+            self._pages_stamp = (positions, len(positions))
+        return self._positions_by_page
 
     def get_all_pages(self) -> List[int]:
         """Get all pages where this component appears.
@@ -119,10 +166,11 @@ class ProjectComponent:
         Returns:
             List of page numbers (0-indexed), sorted
         """
-        pages = {self.page} if self.x != 0.0 or self.y != 0.0 else set()
-        for pos in self.additional_positions:
-            pages.add(pos["page"])
-        return sorted(pages)
+        by_page = self._get_positions_by_page()
+        pages = sorted(by_page)
+        if (self.x != 0.0 or self.y != 0.0) and self.page not in by_page:
+            insort(pages, self.page)
+        return pages
 
     def get_position_for_page(self, page: int) -> Optional[Dict[str, Any]]:
         """Get the position of this component on a specific page.
@@ -145,11 +193,7 @@ class ProjectComponent:
             }
 
         # Check additional positions
-        for pos in self.additional_positions:
-            if pos["page"] == page:
-                return pos
-
-        return None
+        return self._get_positions_by_page().get(page)
 
     def assign_terminal(self, terminal: str, connection: str) -> None:
         """Assign a connection to a terminal.
@@ -159,7 +203,7 @@ class ProjectComponent:
             connection: What's connected (e.g., "+24V", "K2 coil")
         """
         self.terminal_assignments[terminal] = connection
-        self.updated_at = datetime.now()
+        self.updated_at = _now()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization.
@@ -200,18 +244,20 @@ class ProjectComponent:
         Returns:
             ProjectComponent instance
         """
-        # Parse datetime fields
+        # Parse datetime fields; missing ones share one timestamp
+        now = _now()
+
         created_at = data.get("created_at")
         if isinstance(created_at, str):
             created_at = datetime.fromisoformat(created_at)
         elif created_at is None:
-            created_at = datetime.now()
+            created_at = now
 
         updated_at = data.get("updated_at")
         if isinstance(updated_at, str):
             updated_at = datetime.fromisoformat(updated_at)
         elif updated_at is None:
-            updated_at = datetime.now()
+            updated_at = now
 
         return cls(
             project_id=data["project_id"],
@@ -236,6 +282,64 @@ class ProjectComponent:
             notes=data.get("notes", ""),
         )
 
+    def to_msgspec(self) -> Any:
+        """Convert to the msgspec wire struct for bulk encoding.
+
+        Returns:
+            ProjectComponentMsg with the same field values
+
+        Raises:
+            ImportError: If msgspec is not installed
+        """
+        from electrical_schematics.models import structs
+
+        structs._require_msgspec()
+        values = {
+            name: getattr(self, name) for name in structs.ProjectComponentMsg.__struct_fields__
+        }
+        return structs.ProjectComponentMsg(**values)
+
+    @classmethod
+    def from_msgspec(cls, msg: Any) -> "ProjectComponent":
+        """Create a ProjectComponent from its msgspec wire struct.
+
+        Args:
+            msg: ProjectComponentMsg instance
+
+        Returns:
+            ProjectComponent instance
+        """
+        import msgspec
+
+        return cls.from_dict(msgspec.structs.asdict(msg))
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON with the same layout as to_dict.
+
+        With orjson installed the dataclass is encoded directly (private
+        cache fields are skipped), without building the to_dict dict first.
+
+        Returns:
+            UTF-8 JSON bytes
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def from_json(cls, data: bytes) -> "ProjectComponent":
+        """Create a ProjectComponent from JSON written by to_json.
+
+        Args:
+            data: UTF-8 JSON bytes
+
+        Returns:
+            ProjectComponent instance
+        """
+        if ORJSON_AVAILABLE:
+            return cls.from_dict(orjson.loads(data))
+        return cls.from_dict(json.loads(data))
+
     def get_unique_id(self) -> str:
         """Get a unique identifier for this component within the library.
 
@@ -256,6 +360,8 @@ class ProjectComponent:
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on project_id and device_tag."""
+        if self is other:
+            return True
         if not isinstance(other, ProjectComponent):
             return False
         return (
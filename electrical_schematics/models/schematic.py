@@ -1,7 +1,7 @@
 """Data model for complete schematics."""
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from electrical_schematics.models.component import Component
 from electrical_schematics.models.connection import Connection
 
@@ -15,10 +15,55 @@ class Schematic:
     connections: List[Connection] = field(default_factory=list)
     metadata: Dict[str, str] = field(default_factory=dict)
 
+    # id -> component index, rebuilt lazily when the components list is
+    # replaced or changes length; lookups that miss fall back to a scan, so
+    # in-place edits are still found
+    _components_by_id: Dict[str, Component] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed: Optional[Tuple[List[Component], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def reindex(self) -> None:
+        """Rebuild the component lookup index."""
+        by_id: Dict[str, Component] = {}
+        for comp in self.components:
+            # Keep the first match, as the old linear scan did
+            by_id.setdefault(comp.id, comp)
+        self._components_by_id = by_id
+        self._indexed = (self.components, len(self.components))
+
+    def _ensure_index(self) -> None:
+        """Rebuild the index if the components list changed."""
+        indexed = self._indexed
+        if (indexed is None
+                or indexed[0] is not self.components
+                or indexed[1] != len(self.components)):
+            self.reindex()
+
+    def add_component(self, component: Component) -> None:
+        """Add a component and update the lookup index."""
+        self._ensure_index()
+        self.components.append(component)
+        self._components_by_id.setdefault(component.id, component)
+        self._indexed = (self.components, len(self.components))
+
+    def add_connection(self, connection: Connection) -> None:
+        """Add a connection."""
+        self.connections.append(connection)
+
     def get_component(self, component_id: str) -> Optional[Component]:
         """Get a component by ID."""
+        self._ensure_index()
+        comp = self._components_by_id.get(component_id)
+        if comp is not None and comp.id == component_id:
+            return comp
+        # Stale hit or miss: the component may have been replaced or renamed
+        # in place, so scan and reindex on next use if that finds it
         for comp in self.components:
             if comp.id == component_id:
+                self._indexed = None
                 return comp
         return None
 
@@ -30,6 +75,30 @@ class Schematic:
             or conn.to_pin.component_id == component_id
         ]
 
+    def get_all_connections_by_component(self) -> Dict[str, List[Connection]]:
+        """Get the connections of every component in one call.
+
+        Groups all connections in a single pass; prefer this over calling
+        get_connections_for_component() for each component when the whole
+        schematic is being analyzed.
+
+        Returns:
+            Component ID -> connections involving it; components without
+            connections are absent
+        """
+        by_component: Dict[str, List[Connection]] = {}
+        bucket = by_component.setdefault
+        for conn in self.connections:
+            from_id = conn.from_pin.component_id
+            to_id = conn.to_pin.component_id
+            bucket(from_id, []).append(conn)
+            if to_id != from_id:
+                bucket(to_id, []).append(conn)
+        return by_component
+
     def __str__(self) -> str:
         """String representation of the schematic."""
-        return f"Schematic '{self.name}': {len(self.components)} components, {len(self.connections)} connections"
+        return (
+            f"Schematic '{self.name}': {len(self.components)} components, "
+            f"{len(self.connections)} connections"
+        )
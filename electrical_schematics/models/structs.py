@@ -0,0 +1,172 @@
+"""msgspec mirrors of the project component and terminal strip models.
+
+The dataclasses stay the in-memory models; these structs are only used at
+the serialization boundary, where msgspec encodes straight from struct
+attributes instead of building intermediate dicts for json.dumps.
+Requires the optional msgspec package (``pip install .[perf]``).
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+from electrical_schematics.models.terminal_strip import TerminalColor, TerminalStripType
+
+if MSGSPEC_AVAILABLE:
+    class ProjectComponentMsg(msgspec.Struct):
+        """Wire format of ProjectComponent (same field layout)."""
+        project_id: str
+        device_tag: str
+        manufacturer_part_number: str
+        page: int = 0
+        x: float = 0.0
+        y: float = 0.0
+        width: float = 40.0
+        height: float = 30.0
+        additional_positions: List[Dict[str, Any]] = []
+        designation: str = ""
+        technical_data: str = ""
+        function_description: str = ""
+        circuit_type: str = ""
+        voltage_level: str = ""
+        terminal_assignments: Dict[str, str] = {}
+        connected_wires: List[str] = []
+        initial_state: str = "unknown"
+        created_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None
+        notes: str = ""
+
+    class TerminalPositionMsg(msgspec.Struct):
+        """Wire format of TerminalPosition."""
+        position: int
+        level: int = 1
+        terminal_number: str = ""
+        has_test_point: bool = False
+        has_led: bool = False
+        led_color: Optional[str] = None
+
+    class TerminalStripMsg(msgspec.Struct):
+        """Wire format of TerminalStrip (same field layout)."""
+        designation: str
+        terminal_type: TerminalStripType
+        position_count: int
+        level_count: int = 1
+        wire_gauge_min: str = "24 AWG"
+        wire_gauge_max: str = "12 AWG"
+        wire_size_min_mm2: float = 0.5
+        wire_size_max_mm2: float = 2.5
+        voltage_rating: str = "300V"
+        current_rating: str = "24A"
+        color: TerminalColor = TerminalColor.GRAY
+        has_fuse: bool = False
+        fuse_type: Optional[str] = None
+        has_disconnect: bool = False
+        has_led: bool = False
+        led_voltage: Optional[str] = None
+        terminals: List[TerminalPositionMsg] = []
+        manufacturer: str = ""
+        part_number: str = ""
+        series: str = ""
+        description: str = ""
+        digikey_part_number: Optional[str] = None
+        digikey_url: Optional[str] = None
+        datasheet_url: Optional[str] = None
+        image_url: Optional[str] = None
+        unit_price: Optional[float] = None
+        stock_quantity: Optional[int] = None
+        din_rail_width_mm: float = 5.2
+        height_mm: float = 41.0
+        depth_mm: float = 32.0
+        x: float = 0.0
+        y: float = 0.0
+        width: float = 80.0
+        height: float = 30.0
+        page: int = 0
+        created_at: Optional[datetime] = None
+        notes: str = ""
+        tags: List[str] = []
+
+    _ENCODER = msgspec.json.Encoder()
+    _COMPONENTS_DECODER = msgspec.json.Decoder(List[ProjectComponentMsg])
+    _STRIPS_DECODER = msgspec.json.Decoder(List[TerminalStripMsg])
+
+
+def _require_msgspec() -> None:
+    """Raise ImportError when msgspec is not installed."""
+    if not MSGSPEC_AVAILABLE:
+        raise ImportError("msgspec not installed. Run: pip install msgspec")
+
+
+def encode_project_components(components: List[Any]) -> bytes:
+    """Encode ProjectComponents as a JSON array.
+
+    Args:
+        components: ProjectComponent instances
+
+    Returns:
+        UTF-8 JSON bytes
+
+    Raises:
+        ImportError: If msgspec is not installed
+    """
+    _require_msgspec()
+    return _ENCODER.encode([component.to_msgspec() for component in components])
+
+
+def decode_project_components(data: bytes) -> List[Any]:
+    """Decode a JSON array written by encode_project_components.
+
+    Args:
+        data: UTF-8 JSON bytes
+
+    Returns:
+        ProjectComponent instances
+
+    Raises:
+        ImportError: If msgspec is not installed
+        msgspec.ValidationError: If the data does not match the schema
+    """
+    _require_msgspec()
+    from electrical_schematics.models.project_component import ProjectComponent
+
+    return [ProjectComponent.from_msgspec(msg) for msg in _COMPONENTS_DECODER.decode(data)]
+
+
+def encode_terminal_strips(strips: List[Any]) -> bytes:
+    """Encode TerminalStrips as a JSON array.
+
+    Args:
+        strips: TerminalStrip instances
+
+    Returns:
+        UTF-8 JSON bytes
+
+    Raises:
+        ImportError: If msgspec is not installed
+    """
+    _require_msgspec()
+    return _ENCODER.encode([strip.to_msgspec() for strip in strips])
+
+
+def decode_terminal_strips(data: bytes) -> List[Any]:
+    """Decode a JSON array written by encode_terminal_strips.
+
+    Args:
+        data: UTF-8 JSON bytes
+
+    Returns:
+        TerminalStrip instances
+
+    Raises:
+        ImportError: If msgspec is not installed
+        msgspec.ValidationError: If the data does not match the schema
+    """
+    _require_msgspec()
+    from electrical_schematics.models.terminal_strip import TerminalStrip
+
+    return [TerminalStrip.from_msgspec(msg) for msg in _STRIPS_DECODER.decode(data)]
@@ -1,10 +1,18 @@
 """Data model for terminal strips and terminal blocks."""
 
+import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class TerminalStripType(Enum):
     """Types of terminal strips/blocks."""
@@ -29,7 +37,13 @@ class TerminalColor(Enum):
     BLACK = "black"                 # General
 
 
-@dataclass
+# Value -> member tables for from_dict; unknown values fall back to the Enum
+# constructor so they raise ValueError as before
+_STRIP_TYPE_BY_VALUE = {member.value: member for member in TerminalStripType}
+_COLOR_BY_VALUE = {member.value: member for member in TerminalColor}
+
+
+@dataclass(slots=True)
 class TerminalPosition:
     """Represents a single terminal position on a strip.
 
@@ -66,6 +80,35 @@ class TerminalPosition:
         return self.terminal_number
 
 
+@lru_cache(maxsize=4096)
+def _terminal_number(position: int, level: int, multi_level: bool) -> str:
+    """Return the shared display number string for a generated terminal."""
+    return f"{position}.{level}" if multi_level else str(position)
+
+
+def _new_terminal_position(
+    position: int,
+    level: int,
+    terminal_number: str,
+    has_test_point: bool,
+    has_led: bool,
+    led_color: Optional[str] = None
+) -> TerminalPosition:
+    """Create a TerminalPosition without running __init__/__post_init__.
+
+    The caller supplies the terminal number, so the numbering fallback in
+    __post_init__ is not needed.
+    """
+    terminal = object.__new__(TerminalPosition)
+    terminal.position = position
+    terminal.level = level
+    terminal.terminal_number = terminal_number
+    terminal.has_test_point = has_test_point
+    terminal.has_led = has_led
+    terminal.led_color = led_color
+    return terminal
+
+
 @dataclass
 class TerminalStrip:
     """Represents a DIN rail mounted terminal strip/block.
@@ -135,6 +178,23 @@ class TerminalStrip:
     notes: str = ""
     tags: List[str] = field(default_factory=list)
 
+    # (position, level) and terminal_number -> terminal, first match wins.
+    # Rebuilt when terminals is replaced or resized; a hit whose terminal was
+    # renumbered in place since, or a miss found by a scan, also rebuilds it
+    _by_pos_level: Dict[Tuple[int, int], TerminalPosition] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_number: Dict[str, TerminalPosition] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _terminal_index_stamp: Optional[Tuple[List[TerminalPosition], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # created_at.isoformat(), valid while created_at is the stamped object
+    _created_at_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Initialize terminal positions if not provided."""
         if not self.terminals:
@@ -156,24 +216,40 @@ class TerminalStrip:
 
     def _generate_terminal_positions(self):
         """Generate terminal positions based on configuration."""
-        self.terminals = []
-
-        for pos in range(1, self.position_count + 1):
-            for level in range(1, self.level_count + 1):
-                # For multi-level terminals, use explicit numbering format
-                if self.level_count > 1:
-                    terminal_number = f"{pos}.{level}"
-                else:
-                    terminal_number = str(pos)
-
-                terminal = TerminalPosition(
-                    position=pos,
-                    level=level,
-                    terminal_number=terminal_number,  # Explicitly set number
-                    has_test_point=self.has_disconnect,
-                    has_led=self.has_led and level == 1,  # LED only on level 1
-                )
-                self.terminals.append(terminal)
+        multi_level = self.level_count > 1
+        has_disconnect = self.has_disconnect
+        has_led = self.has_led
+        levels = range(1, self.level_count + 1)
+        # Local names: the comprehension calls both once per terminal
+        new_terminal = _new_terminal_position
+        terminal_number = _terminal_number
+        self.terminals = [
+            new_terminal(
+                pos,
+                level,
+                # Multi-level terminals use explicit "pos.level" numbering
+                terminal_number(pos, level, multi_level),
+                has_disconnect,
+                has_led and level == 1,  # LED only on level 1
+            )
+            for pos in range(1, self.position_count + 1)
+            for level in levels
+        ]
+
+    def _ensure_terminal_index(self) -> None:
+        """Rebuild the terminal lookup dicts if terminals changed."""
+        stamp = self._terminal_index_stamp
+        if stamp is not None and stamp[0] is self.terminals and stamp[1] == len(self.terminals):
+            return
+
+        by_pos_level: Dict[Tuple[int, int], TerminalPosition] = {}
+        by_number: Dict[str, TerminalPosition] = {}
+        for terminal in self.terminals:
+            by_pos_level.setdefault((terminal.position, terminal.level), terminal)
+            by_number.setdefault(terminal.terminal_number, terminal)
+        self._by_pos_level = by_pos_level
+        self._by_number = by_number
+        self._terminal_index_stamp = (self.terminals, len(self.terminals))
 
     def get_terminal(self, position: int, level: int = 1) -> Optional[TerminalPosition]:
         """Get a specific terminal by position and level.
@@ -185,10 +261,13 @@ class TerminalStrip:
         Returns:
             TerminalPosition if found, None otherwise
         """
-        for terminal in self.terminals:
-            if terminal.position == position and terminal.level == level:
-                return terminal
-        return None
+        self._ensure_terminal_index()
+        terminal = self._by_pos_level.get((position, level))
+        if terminal is not None and terminal.position == position and terminal.level == level:
+            return terminal
+        return self._rescan_terminals(
+            lambda t: t.position == position and t.level == level
+        )
 
     def get_terminal_by_number(self, terminal_number: str) -> Optional[TerminalPosition]:
         """Get terminal by its number string.
@@ -199,8 +278,24 @@ class TerminalStrip:
         Returns:
             TerminalPosition if found, None otherwise
         """
+        self._ensure_terminal_index()
+        terminal = self._by_number.get(terminal_number)
+        if terminal is not None and terminal.terminal_number == terminal_number:
+            return terminal
+        return self._rescan_terminals(lambda t: t.terminal_number == terminal_number)
+
+    def _rescan_terminals(
+        self, matches: Callable[[TerminalPosition], bool]
+    ) -> Optional[TerminalPosition]:
+        """Find a terminal the lookup dicts missed by scanning terminals.
+
+        Terminals can be edited in place without the strip noticing. A stale
+        hit or a real miss falls back to the linear scan; if the scan finds a
+        terminal, the dicts are out of date and are rebuilt on next use.
+        """
         for terminal in self.terminals:
-            if terminal.terminal_number == terminal_number:
+            if matches(terminal):
+                self._terminal_index_stamp = None
                 return terminal
         return None
 
@@ -251,6 +346,10 @@ class TerminalStrip:
         Returns:
             Dictionary representation
         """
+        created_iso = self._created_at_iso
+        if created_iso is None or created_iso[0] is not self.created_at:
+            created_iso = self._created_at_iso = (self.created_at, self.created_at.isoformat())
+
         return {
             "designation": self.designation,
             "terminal_type": self.terminal_type.value,
@@ -297,7 +396,7 @@ class TerminalStrip:
             "width": self.width,
             "height": self.height,
             "page": self.page,
-            "created_at": self.created_at.isoformat(),
+            "created_at": created_iso[1],
             "notes": self.notes,
             "tags": self.tags
         }
@@ -306,76 +405,169 @@ class TerminalStrip:
     def from_dict(cls, data: Dict[str, Any]) -> "TerminalStrip":
         """Create TerminalStrip from dictionary.
 
+        Instances are allocated directly rather than through __init__;
+        __post_init__ still runs on the strip so missing terminals are
+        generated and type-implied features are applied.
+
         Args:
             data: Dictionary with terminal strip data
 
         Returns:
             TerminalStrip instance
         """
+        get = data.get
+
         # Parse datetime
-        created_at = data.get("created_at")
+        created_at = get("created_at")
         if isinstance(created_at, str):
             created_at = datetime.fromisoformat(created_at)
         elif created_at is None:
             created_at = datetime.now()
 
         # Parse enums
-        terminal_type = TerminalStripType(data["terminal_type"])
-        color = TerminalColor(data.get("color", "gray"))
+        terminal_type = _STRIP_TYPE_BY_VALUE.get(data["terminal_type"])
+        if terminal_type is None:
+            terminal_type = TerminalStripType(data["terminal_type"])
+        color = _COLOR_BY_VALUE.get(get("color", "gray"))
+        if color is None:
+            color = TerminalColor(data["color"])
 
         # Parse terminals
         terminals = []
-        for t_data in data.get("terminals", []):
-            terminal = TerminalPosition(
-                position=t_data["position"],
-                level=t_data.get("level", 1),
-                terminal_number=t_data.get("terminal_number", ""),
-                has_test_point=t_data.get("has_test_point", False),
-                has_led=t_data.get("has_led", False),
-                led_color=t_data.get("led_color")
+        for t_data in get("terminals", []):
+            t_get = t_data.get
+            terminal = _new_terminal_position(
+                t_data["position"],
+                t_get("level", 1),
+                t_get("terminal_number", ""),
+                t_get("has_test_point", False),
+                t_get("has_led", False),
+                t_get("led_color"),
             )
+            if not terminal.terminal_number:
+                terminal.__post_init__()
             terminals.append(terminal)
 
-        return cls(
-            designation=data["designation"],
-            terminal_type=terminal_type,
-            position_count=data["position_count"],
-            level_count=data.get("level_count", 1),
-            wire_gauge_min=data.get("wire_gauge_min", "24 AWG"),
-            wire_gauge_max=data.get("wire_gauge_max", "12 AWG"),
-            wire_size_min_mm2=data.get("wire_size_min_mm2", 0.5),
-            wire_size_max_mm2=data.get("wire_size_max_mm2", 2.5),
-            voltage_rating=data.get("voltage_rating", "300V"),
-            current_rating=data.get("current_rating", "24A"),
-            color=color,
-            has_fuse=data.get("has_fuse", False),
-            fuse_type=data.get("fuse_type"),
-            has_disconnect=data.get("has_disconnect", False),
-            has_led=data.get("has_led", False),
-            led_voltage=data.get("led_voltage"),
-            terminals=terminals,
-            manufacturer=data.get("manufacturer", ""),
-            part_number=data.get("part_number", ""),
-            series=data.get("series", ""),
-            description=data.get("description", ""),
-            digikey_part_number=data.get("digikey_part_number"),
-            digikey_url=data.get("digikey_url"),
-            datasheet_url=data.get("datasheet_url"),
-            image_url=data.get("image_url"),
-            unit_price=data.get("unit_price"),
-            stock_quantity=data.get("stock_quantity"),
-            din_rail_width_mm=data.get("din_rail_width_mm", 5.2),
-            height_mm=data.get("height_mm", 41.0),
-            depth_mm=data.get("depth_mm", 32.0),
-            x=data.get("x", 0.0),
-            y=data.get("y", 0.0),
-            width=data.get("width", 80.0),
-            height=data.get("height", 30.0),
-            page=data.get("page", 0),
-            created_at=created_at,
-            notes=data.get("notes", ""),
-            tags=data.get("tags", [])
-        )
+        strip = object.__new__(cls)
+        strip.__dict__.update({
+            "designation": data["designation"],
+            "terminal_type": terminal_type,
+            "position_count": data["position_count"],
+            "level_count": get("level_count", 1),
+            "wire_gauge_min": get("wire_gauge_min", "24 AWG"),
+            "wire_gauge_max": get("wire_gauge_max", "12 AWG"),
+            "wire_size_min_mm2": get("wire_size_min_mm2", 0.5),
+            "wire_size_max_mm2": get("wire_size_max_mm2", 2.5),
+            "voltage_rating": get("voltage_rating", "300V"),
+            "current_rating": get("current_rating", "24A"),
+            "color": color,
+            "has_fuse": get("has_fuse", False),
+            "fuse_type": get("fuse_type"),
+            "has_disconnect": get("has_disconnect", False),
+            "has_led": get("has_led", False),
+            "led_voltage": get("led_voltage"),
+            "terminals": terminals,
+            "manufacturer": get("manufacturer", ""),
+            "part_number": get("part_number", ""),
+            "series": get("series", ""),
+            "description": get("description", ""),
+            "digikey_part_number": get("digikey_part_number"),
+            "digikey_url": get("digikey_url"),
+            "datasheet_url": get("datasheet_url"),
+            "image_url": get("image_url"),
+            "unit_price": get("unit_price"),
+            "stock_quantity": get("stock_quantity"),
+            "din_rail_width_mm": get("din_rail_width_mm", 5.2),
+            "height_mm": get("height_mm", 41.0),
+            "depth_mm": get("depth_mm", 32.0),
+            "x": get("x", 0.0),
+            "y": get("y", 0.0),
+            "width": get("width", 80.0),
+            "height": get("height", 30.0),
+            "page": get("page", 0),
+            "created_at": created_at,
+            "notes": get("notes", ""),
+            "tags": get("tags", []),
+            "_by_pos_level": {},
+            "_by_number": {},
+            "_terminal_index_stamp": None,
+            "_created_at_iso": None,
+        })
+        strip.__post_init__()
+        return strip
+
+    def to_msgspec(self) -> Any:
+        """Convert to the msgspec wire struct for bulk encoding.
+
+        Returns:
+            TerminalStripMsg with the same field values
+
+        Raises:
+            ImportError: If msgspec is not installed
+        """
+        from electrical_schematics.models import structs
+
+        structs._require_msgspec()
+        values = {
+            name: getattr(self, name)
+            for name in structs.TerminalStripMsg.__struct_fields__
+            if name != "terminals"
+        }
+        values["terminals"] = [
+            structs.TerminalPositionMsg(
+                position=t.position,
+                level=t.level,
+                terminal_number=t.terminal_number,
+                has_test_point=t.has_test_point,
+                has_led=t.has_led,
+                led_color=t.led_color
+            )
+            for t in self.terminals
+        ]
+        return structs.TerminalStripMsg(**values)
+
+    @classmethod
+    def from_msgspec(cls, msg: Any) -> "TerminalStrip":
+        """Create a TerminalStrip from its msgspec wire struct.
+
+        Args:
+            msg: TerminalStripMsg instance
+
+        Returns:
+            TerminalStrip instance
+        """
+        import msgspec
+
+        data = msgspec.structs.asdict(msg)
+        data["terminals"] = [msgspec.structs.asdict(t) for t in msg.terminals]
+        return cls.from_dict(data)
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON with the same layout as to_dict.
+
+        With orjson installed the dataclass is encoded directly (private
+        cache fields are skipped), without building the to_dict dict first.
+
+        Returns:
+            UTF-8 JSON bytes
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def from_json(cls, data: bytes) -> "TerminalStrip":
+        """Create a TerminalStrip from JSON written by to_json.
+
+        Args:
+            data: UTF-8 JSON bytes
+
+        Returns:
+            TerminalStrip instance
+        """
+        if ORJSON_AVAILABLE:
+            return cls.from_dict(orjson.loads(data))
+        return cls.from_dict(json.loads(data))
 
     def __str__(self) -> str:
         """String representation."""
@@ -4,14 +4,14 @@ from dataclasses import dataclass
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class WirePoint:
     """A point in a wire path."""
     x: float
     y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Wire:
     """Represents a wire connection between components or terminals."""
 
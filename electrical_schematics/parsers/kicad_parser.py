@@ -1,24 +1,221 @@
 """Parser for KiCad schematic files (.kicad_sch)."""
 
+import mmap
+import os
+import re
 from pathlib import Path
-from electrical_schematics.models import Schematic
+from typing import Dict, List, Optional, Set, Union, cast
+from electrical_schematics.models import Component, ComponentType, Schematic
 from electrical_schematics.parsers.base import SchematicParser
 
 
+# One pass over the file: "(", ")", quoted strings (with escapes) or atoms.
+# Bytes patterns so the file can be scanned straight from an mmap.
+_TOKEN_RE = re.compile(rb'\(|\)|"(?:[^"\\]|\\.)*"|[^\s()]+')
+_ESCAPE_RE = re.compile(rb'\\(.)')
+
+# Parsed S-expression: nested lists of atoms/strings
+SExpr = Union[str, List["SExpr"]]
+
+# Reference designator prefix (the letters before the number) -> component type
+_REFERENCE_TYPES = {
+    "R": ComponentType.RESISTOR,
+    "RN": ComponentType.RESISTOR,
+    "RV": ComponentType.RESISTOR,
+    "C": ComponentType.CAPACITOR,
+    "L": ComponentType.INDUCTOR,
+    "FB": ComponentType.INDUCTOR,
+    "D": ComponentType.DIODE,
+    "LED": ComponentType.DIODE,
+    "Q": ComponentType.TRANSISTOR,
+    "U": ComponentType.IC,
+    "IC": ComponentType.IC,
+    "J": ComponentType.CONNECTOR,
+    "P": ComponentType.CONNECTOR,
+    "CN": ComponentType.CONNECTOR,
+    "TP": ComponentType.CONNECTOR,
+    "S": ComponentType.SWITCH,
+    "SW": ComponentType.SWITCH,
+    "K": ComponentType.RELAY,
+    "F": ComponentType.FUSE,
+    "BT": ComponentType.POWER_SOURCE,
+}
+_REFERENCE_PREFIX_RE = re.compile(r"[A-Za-z]+")
+
+def parse_sexpr(data: Union[str, bytes, mmap.mmap]) -> SExpr:
+    """Parse S-expression source into nested lists.
+
+    Quoted strings are unquoted and unescaped; everything else is kept as
+    the atom text. Only the matched tokens are decoded, never the
+    whitespace between them, and repeated tokens share one str. Built with
+    an explicit stack, so deeply nested files do not hit the recursion
+    limit.
+
+    Args:
+        data: S-expression source as text, UTF-8 bytes or an mmap
+
+    Returns:
+        The single top-level expression
+
+    Raises:
+        ValueError: If parentheses are unbalanced or there is no expression
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    decoded: Dict[bytes, str] = {}
+    stack: List[List[SExpr]] = [[]]
+    for match in _TOKEN_RE.finditer(data):
+        token = match.group()
+        if token == b"(":
+            stack.append([])
+        elif token == b")":
+            if len(stack) == 1:
+                raise ValueError("Unbalanced ')' in S-expression")
+            node = stack.pop()
+            stack[-1].append(node)
+        else:
+            value = decoded.get(token)
+            if value is None:
+                if token[0] == 0x22:  # '"'
+                    value = _ESCAPE_RE.sub(rb'\1', token[1:-1]).decode("utf-8")
+                else:
+                    value = token.decode("utf-8")
+                decoded[token] = value
+            stack[-1].append(value)
+
+    if len(stack) != 1:
+        raise ValueError("Unbalanced '(' in S-expression")
+    if not stack[0]:
+        raise ValueError("Empty S-expression")
+    return stack[0][0]
+
+
+def _child(node: List[SExpr], name: str) -> Optional[List[SExpr]]:
+    """Return the first child list of node whose head is name."""
+    for item in node:
+        if isinstance(item, list) and item and item[0] == name:
+            return item
+    return None
+
+
+def _component_type(lib_id: str, reference: str) -> ComponentType:
+    """Classify a symbol from its library id and reference designator."""
+    if lib_id.startswith("power:"):
+        name = lib_id[6:].upper()
+        return ComponentType.GROUND if "GND" in name else ComponentType.POWER_SOURCE
+    match = _REFERENCE_PREFIX_RE.match(reference)
+    if match is None:
+        return ComponentType.OTHER
+    return _REFERENCE_TYPES.get(match.group().upper(), ComponentType.OTHER)
+
+
+def _properties(node: List[SExpr]) -> Dict[str, str]:
+    """Return the string-valued (property name value ...) entries of a node."""
+    properties: Dict[str, str] = {}
+    for item in node:
+        if (isinstance(item, list) and len(item) >= 3 and item[0] == "property"
+                and isinstance(item[1], str) and isinstance(item[2], str)):
+            properties[item[1]] = item[2]
+    return properties
+
+
+def _unit(node: List[SExpr]) -> int:
+    """Return the (unit N) number of a placed symbol, defaulting to 1."""
+    unit = _child(node, "unit")
+    if unit is not None and len(unit) > 1 and isinstance(unit[1], str) and unit[1].isdigit():
+        return int(unit[1])
+    return 1
+
+
 class KiCadParser(SchematicParser):
     """Parser for KiCad 6+ schematic files."""
 
     def parse(self, file_path: Path) -> Schematic:
-        """Parse a KiCad schematic file."""
+        """Parse a KiCad schematic file.
+
+        Only placed symbols are read; wires and labels are not turned into
+        connections.
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # TODO: Implement KiCad S-expression parsing
-        # KiCad files use S-expressions (similar to Lisp)
+        # KiCad files use S-expressions (similar to Lisp). Scan them from an
+        # mmap so large files are never copied into a bytes/str pair.
+        with file_path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"Empty schematic file: {file_path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tree = parse_sexpr(mm)
+        if not isinstance(tree, list) or not tree or tree[0] != "kicad_sch":
+            raise ValueError(f"Not a KiCad schematic: {file_path}")
+
         schematic = Schematic(name=file_path.stem)
 
+        # Placed symbols are top-level (symbol (lib_id ...) ...) nodes; the
+        # library definitions live under lib_symbols and have no lib_id
+        placed = []
+        units: Dict[str, Set[int]] = {}
+        for node in tree:
+            if not isinstance(node, list) or not node or node[0] != "symbol":
+                continue
+            lib_id_node = _child(node, "lib_id")
+            if lib_id_node is None or len(lib_id_node) < 2 or not isinstance(lib_id_node[1], str):
+                continue
+            properties = _properties(node)
+            reference = properties.get("Reference", "")
+            unit = _unit(node)
+            placed.append((node, lib_id_node[1], properties, reference, unit))
+            units.setdefault(reference, set()).add(unit)
+
+        used_ids: Set[str] = set()
+        for index, (node, lib_id, properties, reference, unit) in enumerate(placed):
+            if not reference or reference.startswith("#"):
+                # Power symbols share "#PWR?" style references
+                component_id = f"{lib_id}#{index}"
+            elif len(units[reference]) > 1:
+                # Units of one multi-unit part: U1A, U1B, ... as KiCad shows them
+                suffix = chr(ord("A") + unit - 1) if 1 <= unit <= 26 else f".{unit}"
+                component_id = f"{reference}{suffix}"
+            else:
+                component_id = reference
+            if component_id in used_ids:
+                # Duplicate annotation; keep ids unique
+                component_id = f"{lib_id}#{index}"
+            used_ids.add(component_id)
+            schematic.add_component(
+                self._build_component(node, lib_id, component_id, properties, reference)
+            )
+
         return schematic
 
+    @staticmethod
+    def _build_component(
+        node: List[SExpr],
+        lib_id: str,
+        component_id: str,
+        properties: Dict[str, str],
+        reference: str,
+    ) -> Component:
+        """Create a Component from a placed symbol node."""
+        x = y = rotation = 0.0
+        at = _child(node, "at")
+        if at is not None:
+            x, y = float(cast(str, at[1])), float(cast(str, at[2]))
+            if len(at) > 3:
+                rotation = float(cast(str, at[3]))
+
+        return Component(
+            id=component_id,
+            type=_component_type(lib_id, reference),
+            value=properties.get("Value"),
+            reference=reference or None,
+            description=properties.get("Description") or lib_id,
+            x=x,
+            y=y,
+            rotation=rotation
+        )
+
     def can_parse(self, file_path: Path) -> bool:
         """Check if file is a KiCad schematic."""
         return file_path.suffix.lower() in ['.kicad_sch', '.sch']
@@ -1,14 +1,22 @@
 """Automatic loading and analysis of electrical diagrams."""
 
+import logging
 import re
+from collections import defaultdict, deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Deque, Dict, List, Optional, Tuple, Union
 
 import fitz
 
 from electrical_schematics.models import IndustrialComponent, IndustrialComponentType, WiringDiagram
 from electrical_schematics.models.wire import Wire
 from electrical_schematics.models.wire import WirePoint as ModelWirePoint
+from electrical_schematics.pdf.component_position_finder import (
+    classify_page,
+    should_skip_page_by_title,
+)
 from electrical_schematics.pdf.drawer_parser import CableConnection, DrawerParser
 from electrical_schematics.pdf.drawer_to_model import DrawerToModelConverter
 from electrical_schematics.pdf.exact_parts_parser import parse_parts_list
@@ -19,42 +27,158 @@ from electrical_schematics.pdf.visual_wire_detector import (
     generate_wire_paths_from_connections,
 )
 
+logger = logging.getLogger(__name__)
+
+
+# detect_format only looks at the first pages of a document
+_FORMAT_SCAN_PAGES = 30
+
+# Visual wire analysis covers the schematic pages, which come before the
+# cable diagrams
+_WIRE_SCAN_PAGES = 25
+
+# DRAWER indicators. Until either is seen both are searched in one
+# alternation; device tag headings start with "D"/"B", cable diagram
+# headings with "C"/"K". Once one is seen only the other is searched for.
+_FORMAT_DEVICE_TAG_RE = re.compile(r"Device tag|Betriebsmittelkennzeichen")
+_FORMAT_CABLE_DIAGRAM_RE = re.compile(r"Cable diagram|Kabelplan")
+_FORMAT_RE = re.compile(f"{_FORMAT_DEVICE_TAG_RE.pattern}|{_FORMAT_CABLE_DIAGRAM_RE.pattern}")
+_DEVICE_TAG_INITIALS = frozenset("DB")
+
+# Voltage ratings in parts list technical data. A rating with an AC/DC
+# suffix anywhere in the text wins over a bare one ("230V ... 24VDC" gives
+# "24VDC"); "DC 24V" / "AC 230V" forms are covered by the bare pattern.
+_VOLTAGE_PATTERNS = (
+    re.compile(r'(\d+\s*V\s*(?:DC|AC))', re.IGNORECASE),  # 24VDC, 230VAC, 24 V DC
+    re.compile(r'(\d+\s*V)', re.IGNORECASE),  # 24V
+)
+
+# Device tag at the start of a terminal reference, e.g. "-A1" in "-A1-X5:3".
+# A second segment is only part of the tag if it is not a terminal block.
+_DEVICE_TAG_RE = re.compile(r'[+-][A-Z0-9]+(?:-(?!X)[A-Z0-9]+)?')
+
+# Single-letter designation prefix -> component type
+_TYPE_BY_PREFIX = {
+    'K': IndustrialComponentType.CONTACTOR,
+    'Q': IndustrialComponentType.CIRCUIT_BREAKER,
+    'F': IndustrialComponentType.FUSE,
+    'S': IndustrialComponentType.PHOTOELECTRIC_SENSOR,
+    'B': IndustrialComponentType.PROXIMITY_SENSOR,  # Often used for proximity sensors
+    'M': IndustrialComponentType.MOTOR,
+    'A': IndustrialComponentType.PLC_INPUT,  # Often used for PLCs/controllers
+    'P': IndustrialComponentType.POWER_24VDC,
+    'T': IndustrialComponentType.OTHER,  # Transformer - no specific type available
+    'R': IndustrialComponentType.RELAY,
+    'L': IndustrialComponentType.INDICATOR_LIGHT,  # Light curtain - closest match
+    'E': IndustrialComponentType.EMERGENCY_STOP,
+    'X': IndustrialComponentType.TERMINAL_BLOCK,
+}
+
+# Visual wire color (WireColor value) -> voltage, extended mapping
+_VISUAL_COLOR_TO_VOLTAGE = MappingProxyType({
+    "red": "24VDC",
+    "brown": "24VDC",
+    "orange": "24VDC",
+    "blue": "0V",
+    "green": "PE",
+    "yellow_green": "PE",
+    "black": "400VAC",
+})
+
+# Industrial wire color codes -> voltage level
+_WIRE_COLOR_MAP = MappingProxyType({
+    'RD': '24VDC',    # Red
+    'BN': '24VDC',    # Brown
+    'OG': '24VDC',    # Orange
+    'BU': '0V',       # Blue
+    'BK': '400VAC',   # Black
+    'GN': 'PE',       # Green
+    'GNYE': 'PE',     # Green-Yellow
+    'YE': 'PE',       # Yellow
+    'WH': 'SIGNAL',   # White
+    'GY': 'SIGNAL',   # Gray
+})
+
+# Plain text extraction without the default ligature/whitespace
+# preservation; detection only needs substring presence
+_FORMAT_TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP
+
+
+@lru_cache(maxsize=4096)
+def _device_from_terminal(terminal_ref: str) -> str:
+    """Return the device tag of a terminal reference, or the reference itself."""
+    match = _DEVICE_TAG_RE.match(terminal_ref)
+    if match is None:
+        return terminal_ref
+    if terminal_ref.startswith("-X"):
+        # The tag itself is a terminal block: nothing precedes "-X"
+        return ""
+    return match.group()
+
+
+def _scan_format_pages(doc: "fitz.Document", start: int, stop: int) -> Tuple[bool, bool]:
+    """Scan pages [start, stop) for DRAWER format indicators.
+
+    Args:
+        doc: Open PDF document
+        start: First page index
+        stop: Page index to stop before
+
+    Returns:
+        (has_device_tag, has_cable_diagram)
+    """
+    has_device_tag = False
+    has_cable_diagram = False
+
+    for page_num in range(start, stop):
+        text = doc[page_num].get_text("text", flags=_FORMAT_TEXT_FLAGS)
+        if has_device_tag:
+            if _FORMAT_CABLE_DIAGRAM_RE.search(text):
+                return True, True
+            continue
+        if has_cable_diagram:
+            if _FORMAT_DEVICE_TAG_RE.search(text):
+                return True, True
+            continue
+        for match in _FORMAT_RE.finditer(text):
+            if match.group()[0] in _DEVICE_TAG_INITIALS:
+                has_device_tag = True
+            else:
+                has_cable_diagram = True
+            if has_device_tag and has_cable_diagram:
+                return True, True
+
+    return has_device_tag, has_cable_diagram
+
 
 class DiagramAutoLoader:
     """Automatically loads and analyzes electrical diagrams."""
 
     @staticmethod
-    def detect_format(pdf_path: Path) -> str:
+    def detect_format(source: Union[Path, "fitz.Document"]) -> str:
         """Detect the format of a PDF diagram.
 
         Args:
-            pdf_path: Path to PDF file
+            source: Path to PDF file, or an open document (left open)
 
         Returns:
             Format identifier: "drawer", "manual", or "unknown"
         """
-        doc = fitz.open(pdf_path)
+        owns_doc = not isinstance(source, fitz.Document)
+        doc = fitz.open(source) if owns_doc else source
 
         # Check for DRAWER format indicators
         # DRAWER diagrams have "Device tag" and "Cable diagram" sections
-        has_device_tag = False
-        has_cable_diagram = False
-
-        for page_num in range(min(30, len(doc))):
-            page = doc[page_num]
-            text = page.get_text()
-
-            if "Device tag" in text or "Betriebsmittelkennzeichen" in text:
-                has_device_tag = True
-
-            if "Cable diagram" in text or "Kabelplan" in text:
-                has_cable_diagram = True
-
-            if has_device_tag and has_cable_diagram:
+        try:
+            has_device_tag, has_cable_diagram = _scan_format_pages(
+                doc, 0, min(_FORMAT_SCAN_PAGES, len(doc))
+            )
+        finally:
+            if owns_doc:
                 doc.close()
-                return "drawer"
 
-        doc.close()
+        if has_device_tag and has_cable_diagram:
+            return "drawer"
 
         # If not DRAWER format, assume manual annotation needed
         return "manual"
@@ -83,17 +207,20 @@ class DiagramAutoLoader:
             Tuple of (WiringDiagram or None, format_type)
             format_type can be: "drawer", "parts_list", or "manual"
         """
-        # Strategy 1: Check for DRAWER format FIRST (highest priority)
-        # DRAWER format provides both components AND wires from cable routing tables
-        format_type = DiagramAutoLoader.detect_format(pdf_path)
-        if format_type == "drawer":
-            return DiagramAutoLoader._load_drawer(pdf_path, auto_position), "drawer"
-
-        # Strategy 2: Try generic parts list extraction
-        # This only provides components, no wiring information
-        parts_diagram = DiagramAutoLoader._load_from_parts_list(pdf_path, auto_position)
-        if parts_diagram and len(parts_diagram.components) > 0:
-            return parts_diagram, "parts_list"
+        # One open document is shared by format detection and the loaders,
+        # so the PDF structure is parsed once per load
+        with fitz.open(pdf_path) as doc:
+            # Strategy 1: Check for DRAWER format FIRST (highest priority)
+            # DRAWER format provides both components AND wires from cable routing tables
+            format_type = DiagramAutoLoader.detect_format(doc)
+            if format_type == "drawer":
+                return DiagramAutoLoader._load_drawer(pdf_path, auto_position, doc), "drawer"
+
+            # Strategy 2: Try generic parts list extraction
+            # This only provides components, no wiring information
+            parts_diagram = DiagramAutoLoader._load_from_parts_list(pdf_path, auto_position, doc)
+            if parts_diagram and len(parts_diagram.components) > 0:
+                return parts_diagram, "parts_list"
 
         # Strategy 3: Return empty diagram for manual annotation
         empty_diagram = WiringDiagram(
@@ -105,24 +232,26 @@ class DiagramAutoLoader:
     @staticmethod
     def _load_from_parts_list(
         pdf_path: Path,
-        auto_position: bool = True
+        auto_position: bool = True,
+        doc: Optional["fitz.Document"] = None
     ) -> Optional[WiringDiagram]:
         """Load diagram from parts list using exact column coordinates.
 
         Args:
             pdf_path: Path to PDF file
             auto_position: If True, find component positions in schematic pages
+            doc: Already open document for pdf_path, reused by the exact parser
 
         Returns:
             WiringDiagram with components from parts list, or None if no parts list found
         """
         try:
             # Try exact parser first (with precise column coordinates)
-            parts_data = parse_parts_list(pdf_path)
+            parts_data = parse_parts_list(pdf_path, doc)
 
             if not parts_data:
                 # Fall back to generic parser if exact parser fails
-                parser = PartsListParser(pdf_path)
+                parser = PartsListParser(pdf_path, doc)
                 parts_components = parser.parse_parts_list()
                 parser.close()
 
@@ -189,20 +318,21 @@ class DiagramAutoLoader:
 
             # Auto-populate component positions from PDF schematic pages
             if auto_position and components:
-                DiagramAutoLoader._populate_component_positions(diagram, pdf_path)
+                DiagramAutoLoader._populate_component_positions(diagram, pdf_path, doc)
 
             return diagram
 
         except Exception as e:
             print(f"Failed to load from parts list: {e}")
-            import traceback
-            traceback.print_exc()
+            # Stack formatting only happens when DEBUG logging is enabled
+            logger.debug("Parts list load failed for %s", pdf_path, exc_info=True)
             return None
 
     @staticmethod
     def _populate_component_positions(
         diagram: WiringDiagram,
-        pdf_path: Path
+        pdf_path: Path,
+        doc: Optional["fitz.Document"] = None
     ) -> Dict[str, bool]:
         """Populate component positions by finding device tags in PDF.
 
@@ -213,6 +343,7 @@ class DiagramAutoLoader:
         Args:
             diagram: WiringDiagram with components to position
             pdf_path: Path to PDF file
+            doc: Already open document for pdf_path, reused by the finder
 
         Returns:
             Dictionary mapping component IDs to success status
@@ -226,17 +357,20 @@ class DiagramAutoLoader:
         results: Dict[str, bool] = {}
 
         try:
-            with ComponentPositionFinder(pdf_path) as finder:
+            with ComponentPositionFinder(pdf_path, doc=doc) as finder:
                 # Search ALL pages -- page classification handles skip logic
                 position_result = finder.find_positions(
                     device_tags, search_all_pages=True
                 )
 
+                positions = position_result.positions
+                ambiguous_matches = position_result.ambiguous_matches
+
                 for component in diagram.components:
                     tag = component.designation
 
-                    if tag in position_result.positions:
-                        pos = position_result.positions[tag]
+                    pos = positions.get(tag)
+                    if pos is not None:
                         # Set primary position and page
                         component.x = pos.x
                         component.y = pos.y
@@ -257,31 +391,31 @@ class DiagramAutoLoader:
                     else:
                         results[tag] = False
 
-                    # Handle components that appear on multiple pages
-                    if tag in position_result.ambiguous_matches:
-                        for pos in position_result.ambiguous_matches[tag]:
-                            # Add all positions found for this component
-                            component.add_page_position(
-                                page=pos.page,
-                                x=pos.x,
-                                y=pos.y,
-                                width=max(pos.width, 40.0),
-                                height=max(pos.height, 30.0),
-                                confidence=pos.confidence
-                            )
-                        # If we have positions from ambiguous matches but not
-                        # from primary positions, mark as found
-                        if tag not in position_result.positions:
-                            best = max(
-                                position_result.ambiguous_matches[tag],
-                                key=lambda p: p.confidence
-                            )
-                            component.x = best.x
-                            component.y = best.y
-                            component.width = max(best.width, 40.0)
-                            component.height = max(best.height, 30.0)
-                            component.page = best.page
-                            results[tag] = True
+                    # Handle components that appear on multiple pages: add
+                    # every position found and track the most confident one
+                    # in the same pass
+                    best = None
+                    for match in ambiguous_matches.get(tag, ()):
+                        component.add_page_position(
+                            page=match.page,
+                            x=match.x,
+                            y=match.y,
+                            width=max(match.width, 40.0),
+                            height=max(match.height, 30.0),
+                            confidence=match.confidence
+                        )
+                        if best is None or match.confidence > best.confidence:
+                            best = match
+
+                    # If we have positions from ambiguous matches but not
+                    # from primary positions, mark as found
+                    if best is not None and pos is None:
+                        component.x = best.x
+                        component.y = best.y
+                        component.width = max(best.width, 40.0)
+                        component.height = max(best.height, 30.0)
+                        component.page = best.page
+                        results[tag] = True
 
         except Exception as e:
             print(f"Warning: Failed to find component positions: {e}")
@@ -303,16 +437,8 @@ class DiagramAutoLoader:
         if not technical_data:
             return ""
 
-        # Common voltage patterns
-        voltage_patterns = [
-            r'(\d+\s*V\s*(?:DC|AC))',  # 24VDC, 230VAC, 24 V DC
-            r'(\d+\s*V)',  # 24V
-            r'(DC\s*\d+\s*V)',  # DC 24V
-            r'(AC\s*\d+\s*V)',  # AC 230V
-        ]
-
-        for pattern in voltage_patterns:
-            match = re.search(pattern, technical_data, re.IGNORECASE)
+        for pattern in _VOLTAGE_PATTERNS:
+            match = pattern.search(technical_data)
             if match:
                 voltage = match.group(1)
                 # Normalize format (remove spaces, uppercase)
@@ -331,46 +457,41 @@ class DiagramAutoLoader:
         Returns:
             IndustrialComponentType
         """
-        # Common designation prefixes
+        # Only a single letter followed by digits maps to a type; multi-letter
+        # codes such as "-KF1" are not classified by their first letter
         prefix = designation.lstrip('+-').rstrip('0123456789')
-
-        type_map = {
-            'K': IndustrialComponentType.CONTACTOR,
-            'Q': IndustrialComponentType.CIRCUIT_BREAKER,
-            'F': IndustrialComponentType.FUSE,
-            'S': IndustrialComponentType.PHOTOELECTRIC_SENSOR,
-            'B': IndustrialComponentType.PROXIMITY_SENSOR,  # Often used for proximity sensors
-            'M': IndustrialComponentType.MOTOR,
-            'A': IndustrialComponentType.PLC_INPUT,  # Often used for PLCs/controllers
-            'P': IndustrialComponentType.POWER_24VDC,
-            'T': IndustrialComponentType.OTHER,  # Transformer - no specific type available
-            'R': IndustrialComponentType.RELAY,
-            'L': IndustrialComponentType.INDICATOR_LIGHT,  # Light curtain - closest match
-            'E': IndustrialComponentType.EMERGENCY_STOP,
-            'X': IndustrialComponentType.TERMINAL_BLOCK,
-        }
-
-        return type_map.get(prefix, IndustrialComponentType.OTHER)
+        return _TYPE_BY_PREFIX.get(prefix, IndustrialComponentType.OTHER)
 
     @staticmethod
-    def _load_drawer(pdf_path: Path, auto_position: bool = True) -> WiringDiagram:
+    def _load_drawer(
+        pdf_path: Path,
+        auto_position: bool = True,
+        doc: Optional["fitz.Document"] = None
+    ) -> WiringDiagram:
         """Load a DRAWER format diagram with full analysis.
 
         Args:
             pdf_path: Path to DRAWER PDF
             auto_position: If True, automatically find component positions
+            doc: Already open document for pdf_path, reused for parsing and
+                visual wire analysis
 
         Returns:
             Fully populated WiringDiagram
         """
         # Parse DRAWER format
-        parser = DrawerParser(pdf_path)
+        parser = DrawerParser(pdf_path, doc)
         drawer_diagram = parser.parse()
 
+        # Title block classification is shared by component positioning and
+        # visual wire analysis, so each page's title is read once
+        page_titles: Dict[int, str] = {}
+
         # Convert to internal model (with auto-positioning)
         wiring_diagram = DrawerToModelConverter.convert(
             drawer_diagram,
-            auto_position=auto_position
+            auto_position=auto_position,
+            page_titles=page_titles
         )
 
         # Enhance with automatic analysis
@@ -378,7 +499,9 @@ class DiagramAutoLoader:
         DrawerToModelConverter.identify_sensors(wiring_diagram)
 
         # Analyze visual wires and cross-reference
-        DiagramAutoLoader._analyze_visual_wires(pdf_path, wiring_diagram, drawer_diagram)
+        DiagramAutoLoader._analyze_visual_wires(
+            pdf_path, wiring_diagram, drawer_diagram, doc, page_titles
+        )
 
         return wiring_diagram
 
@@ -386,7 +509,9 @@ class DiagramAutoLoader:
     def _analyze_visual_wires(
         pdf_path: Path,
         wiring_diagram: WiringDiagram,
-        drawer_diagram
+        drawer_diagram,
+        doc: Optional["fitz.Document"] = None,
+        page_titles: Optional[Dict[int, str]] = None
     ) -> None:
         """Analyze visual wire colors and cross-reference with connections.
 
@@ -396,19 +521,43 @@ class DiagramAutoLoader:
             pdf_path: Path to PDF
             wiring_diagram: WiringDiagram to enhance (modified in place)
             drawer_diagram: Original DRAWER diagram for reference
+            doc: Already open document for pdf_path; left open for the caller
+            page_titles: Page number -> title cache shared with component
+                positioning; pages not in it are classified and added
         """
-        doc = fitz.open(pdf_path)
+        owns_doc = doc is None
+        if owns_doc:
+            doc = fitz.open(pdf_path)
         detector = VisualWireDetector(doc)
+        if page_titles is None:
+            page_titles = {}
+
+        # Logical wires grouped by voltage once, so each visual wire is
+        # matched without rescanning the wire list
+        by_voltage, unknown_wires = DiagramAutoLoader._index_wires_by_voltage(
+            wiring_diagram.wires
+        )
 
         # Track wire statistics across pages
+        color_counts: Dict[str, int] = defaultdict(int)
         total_stats = {
             'total_wires': 0,
             'color_counts': {},
-            'traced_paths': 0
+            'traced_paths': 0,
+            'skipped_pages': 0
         }
 
         # Analyze schematic pages (typically before cable diagrams)
-        for page_num in range(min(25, len(doc))):
+        for page_num in range(min(_WIRE_SCAN_PAGES, len(doc))):
+            # Pages whose title block marks them as non-schematic (cable
+            # diagrams, parts lists, ...) are skipped before any analysis
+            title = page_titles.get(page_num)
+            if title is None:
+                title = page_titles[page_num] = classify_page(doc[page_num])
+            if should_skip_page_by_title(title):
+                total_stats['skipped_pages'] += 1
+                continue
+
             # Get basic wire detection
             visual_wires = detector.detect_wires(page_num)
 
@@ -421,16 +570,14 @@ class DiagramAutoLoader:
             total_stats['traced_paths'] += len(wire_paths)
 
             for color, count in stats['color_distribution'].items():
-                total_stats['color_counts'][color] = (
-                    total_stats['color_counts'].get(color, 0) + count
-                )
+                color_counts[color] += count
 
             # Cross-reference visual wires with logical connections
             for visual_wire in visual_wires:
                 matched_wire = DiagramAutoLoader._match_visual_to_logical(
                     visual_wire,
-                    wiring_diagram,
-                    page_num
+                    by_voltage,
+                    unknown_wires
                 )
 
                 if matched_wire:
@@ -446,47 +593,66 @@ class DiagramAutoLoader:
                             ModelWirePoint(visual_wire.end_x, visual_wire.end_y)
                         ]
 
-        doc.close()
+        if owns_doc:
+            doc.close()
 
-        # Store statistics in diagram metadata
+        # Store statistics in diagram metadata (as a plain dict, so a lookup
+        # of a missing color does not add it)
+        total_stats['color_counts'] = dict(color_counts)
         wiring_diagram.metadata['wire_detection_stats'] = total_stats
 
+    @staticmethod
+    def _index_wires_by_voltage(
+        wires: List[Wire]
+    ) -> Tuple[Dict[str, Deque[Tuple[int, Wire]]], Deque[Tuple[int, Wire]]]:
+        """Group logical wires for _match_visual_to_logical.
+
+        Args:
+            wires: Logical wires in diagram order
+
+        Returns:
+            Tuple of (voltage -> queue of (index, wire), queue of (index, wire)
+            with UNKNOWN voltage), each queue in diagram order
+        """
+        by_voltage: Dict[str, Deque[Tuple[int, Wire]]] = {}
+        unknown_wires: Deque[Tuple[int, Wire]] = deque()
+        for index, wire in enumerate(wires):
+            if wire.voltage_level == "UNKNOWN":
+                unknown_wires.append((index, wire))
+            else:
+                by_voltage.setdefault(wire.voltage_level, deque()).append((index, wire))
+        return by_voltage, unknown_wires
+
     @staticmethod
     def _match_visual_to_logical(
         visual_wire,
-        wiring_diagram: WiringDiagram,
-        page_num: int
-    ) -> Optional:
+        by_voltage: Dict[str, Deque[Tuple[int, Wire]]],
+        unknown_wires: Deque[Tuple[int, Wire]]
+    ) -> Optional[Wire]:
         """Match a visual wire to a logical connection.
 
-        Uses improved heuristics with extended color mapping.
+        Uses improved heuristics with extended color mapping. The match is
+        the first wire in diagram order whose voltage matches the visual
+        color or is UNKNOWN; it is removed from the queues so each logical
+        wire is matched at most once.
 
         Args:
             visual_wire: VisualWire detected from PDF
-            wiring_diagram: WiringDiagram with logical connections
-            page_num: Page number
+            by_voltage: Unmatched wires by voltage, from _index_wires_by_voltage
+            unknown_wires: Unmatched wires with UNKNOWN voltage
 
         Returns:
             Matched Wire object or None
         """
-        # Extended color to voltage mapping
-        color_to_voltage = {
-            "red": "24VDC",
-            "brown": "24VDC",
-            "orange": "24VDC",
-            "blue": "0V",
-            "green": "PE",
-            "yellow_green": "PE",
-            "black": "400VAC",
-        }
-
-        voltage = color_to_voltage.get(visual_wire.color.value)
+        voltage = _VISUAL_COLOR_TO_VOLTAGE.get(visual_wire.color.value)
 
         if voltage:
-            # Find wires with matching or unknown voltage
-            for wire in wiring_diagram.wires:
-                if wire.voltage_level == voltage or wire.voltage_level == "UNKNOWN":
-                    return wire
+            # Earliest of the matching-voltage and unknown-voltage heads
+            same_voltage = by_voltage.get(voltage)
+            if same_voltage and (not unknown_wires or same_voltage[0][0] < unknown_wires[0][0]):
+                return same_voltage.popleft()[1]
+            if unknown_wires:
+                return unknown_wires.popleft()[1]
 
         return None
 
@@ -531,17 +697,28 @@ class DiagramAutoLoader:
             routing_style
         )
 
+        # Wires per (from, to) pair in diagram order, built once instead of
+        # rescanning the wire list for every generated path. Paths are
+        # generated one per wire in the same order, so the n-th path for a
+        # pair belongs to the n-th wire between those components.
+        wires_by_endpoints: Dict[Tuple[str, str], Deque[Wire]] = {}
+        for wire in wiring_diagram.wires:
+            wires_by_endpoints.setdefault(
+                (wire.from_component_id, wire.to_component_id), deque()
+            ).append(wire)
+
         # Update wire objects with generated paths
         for wire_data in wire_paths:
             # Find corresponding wire
-            for wire in wiring_diagram.wires:
-                if (wire.from_component_id == wire_data['from_component_id'] and
-                    wire.to_component_id == wire_data['to_component_id']):
-                    # Convert WirePoint to ModelWirePoint
-                    wire.path = [
-                        ModelWirePoint(p.x, p.y) for p in wire_data['path']
-                    ]
-                    break
+            pending = wires_by_endpoints.get(
+                (wire_data['from_component_id'], wire_data['to_component_id'])
+            )
+            if pending:
+                wire = pending.popleft()
+                # Convert WirePoint to ModelWirePoint
+                wire.path = [
+                    ModelWirePoint(p.x, p.y) for p in wire_data['path']
+                ]
 
     @staticmethod
     def generate_wires_from_cable_connections(
@@ -562,15 +739,26 @@ class DiagramAutoLoader:
             List of Wire objects with paths
         """
         wires = []
-        generator = WirePathGenerator()
+        route = WirePathGenerator.path_function(routing_style)
+
+        # Component centers computed once, not per wire endpoint
+        centers = {
+            device: (
+                pos.get('x', 0) + pos.get('width', 0) / 2,
+                pos.get('y', 0) + pos.get('height', 0) / 2
+            )
+            for device, pos in component_positions.items()
+            if pos
+        }
+        extract_device = DiagramAutoLoader._extract_device_from_terminal
 
         for i, conn in enumerate(cable_connections):
             # Extract device tags from terminal references
-            src_device = DiagramAutoLoader._extract_device_from_terminal(conn.source)
-            tgt_device = DiagramAutoLoader._extract_device_from_terminal(conn.target)
+            src_device = extract_device(conn.source)
+            tgt_device = extract_device(conn.target)
 
-            src_pos = component_positions.get(src_device)
-            tgt_pos = component_positions.get(tgt_device)
+            src_center = centers.get(src_device)
+            tgt_center = centers.get(tgt_device)
 
             # Create wire even without positions
             wire = Wire(
@@ -585,28 +773,8 @@ class DiagramAutoLoader:
             )
 
             # Generate path if positions available
-            if src_pos and tgt_pos:
-                src_x = src_pos.get('x', 0) + src_pos.get('width', 0) / 2
-                src_y = src_pos.get('y', 0) + src_pos.get('height', 0) / 2
-                tgt_x = tgt_pos.get('x', 0) + tgt_pos.get('width', 0) / 2
-                tgt_y = tgt_pos.get('y', 0) + tgt_pos.get('height', 0) / 2
-
-                if routing_style == "manhattan":
-                    path_points = generator.generate_manhattan_path(
-                        src_x, src_y, tgt_x, tgt_y
-                    )
-                elif routing_style == "l_path":
-                    path_points = generator.generate_l_path(
-                        src_x, src_y, tgt_x, tgt_y
-                    )
-                elif routing_style == "smooth":
-                    path_points = generator.generate_smooth_path(
-                        src_x, src_y, tgt_x, tgt_y
-                    )
-                else:
-                    path_points = generator.generate_straight_line(
-                        src_x, src_y, tgt_x, tgt_y
-                    )
+            if src_center and tgt_center:
+                path_points = route(*src_center, *tgt_center)
 
                 wire.path = [ModelWirePoint(p.x, p.y) for p in path_points]
 
@@ -624,15 +792,8 @@ class DiagramAutoLoader:
         Returns:
             Device tag (e.g., "-A1")
         """
-        # Match device tag pattern
-        match = re.match(r'([+-][A-Z0-9]+(?:-[A-Z0-9]+)?)', terminal_ref)
-        if match:
-            tag = match.group(1)
-            # Remove terminal block suffix if present
-            if '-X' in tag:
-                tag = tag.split('-X')[0]
-            return tag
-        return terminal_ref
+        # Cached: the same terminals recur across cable connections
+        return _device_from_terminal(terminal_ref)
 
     @staticmethod
     def _infer_voltage_from_color(wire_color: str) -> str:
@@ -649,20 +810,11 @@ class DiagramAutoLoader:
         if not wire_color:
             return 'UNKNOWN'
 
-        # Industrial color codes
-        color_map = {
-            'RD': '24VDC',    # Red
-            'BN': '24VDC',    # Brown
-            'OG': '24VDC',    # Orange
-            'BU': '0V',       # Blue
-            'BK': '400VAC',   # Black
-            'GN': 'PE',       # Green
-            'GNYE': 'PE',     # Green-Yellow
-            'YE': 'PE',       # Yellow
-            'WH': 'SIGNAL',   # White
-            'GY': 'SIGNAL',   # Gray
-        }
-        return color_map.get(wire_color.upper(), 'UNKNOWN')
+        # Codes are normally already upper case; only fold case on a miss
+        voltage = _WIRE_COLOR_MAP.get(wire_color)
+        if voltage is None:
+            voltage = _WIRE_COLOR_MAP.get(wire_color.upper(), 'UNKNOWN')
+        return voltage
 
     @staticmethod
     def create_summary(diagram: WiringDiagram) -> str:
@@ -674,22 +826,28 @@ class DiagramAutoLoader:
         Returns:
             Human-readable summary text
         """
-        from collections import defaultdict
-
-        summary = f"Loaded: {diagram.name}\n"
-        summary += "=" * 60 + "\n\n"
+        parts: List[str] = [f"Loaded: {diagram.name}\n", "=" * 60, "\n\n"]
 
-        # Count by voltage
-        by_voltage = defaultdict(int)
+        # Voltage, position and page statistics in one pass over components
+        by_voltage: Dict[str, int] = defaultdict(int)
+        page_counts: Dict[int, int] = defaultdict(int)
+        positioned = 0
+        multi_page = 0
         for comp in diagram.components:
             by_voltage[comp.voltage_rating] += 1
-
-        summary += "Components by voltage:\n"
+            if comp.x != 0.0 or comp.y != 0.0:
+                positioned += 1
+            if len(comp.page_positions) > 1:
+                multi_page += 1
+            for page_num in comp.get_pages():
+                page_counts[page_num] += 1
+
+        parts.append("Components by voltage:\n")
         for voltage in sorted(by_voltage.keys()):
             count = by_voltage[voltage]
-            summary += f"  {voltage:12s}: {count:3d} devices\n"
+            parts.append(f"  {voltage:12s}: {count:3d} devices\n")
 
-        summary += f"\nTotal connections: {len(diagram.wires)}\n"
+        parts.append(f"\nTotal connections: {len(diagram.wires)}\n")
 
         # Count by wire voltage
         wire_voltage = defaultdict(int)
@@ -697,54 +855,45 @@ class DiagramAutoLoader:
             wire_voltage[wire.voltage_level] += 1
 
         if wire_voltage:
-            summary += "\nConnections by voltage:\n"
+            parts.append("\nConnections by voltage:\n")
             for voltage in sorted(wire_voltage.keys()):
                 count = wire_voltage[voltage]
-                summary += f"  {voltage:12s}: {count:3d} wires\n"
+                parts.append(f"  {voltage:12s}: {count:3d} wires\n")
 
         # Power sources
         power_sources = diagram.get_power_sources()
         if power_sources:
-            summary += f"\nPower sources: {len(power_sources)}\n"
+            parts.append(f"\nPower sources: {len(power_sources)}\n")
             for ps in power_sources[:3]:
-                summary += f"  - {ps.designation} ({ps.voltage_rating})\n"
+                parts.append(f"  - {ps.designation} ({ps.voltage_rating})\n")
 
         # Sensors
         sensors = diagram.get_sensors()
         if sensors:
-            summary += f"\nSensors/Switches: {len(sensors)}\n"
+            parts.append(f"\nSensors/Switches: {len(sensors)}\n")
 
         # Position statistics
-        positioned = sum(1 for c in diagram.components if c.x != 0.0 or c.y != 0.0)
         if positioned > 0:
-            summary += f"\nComponents with positions: {positioned}/{len(diagram.components)}\n"
+            parts.append(f"\nComponents with positions: {positioned}/{len(diagram.components)}\n")
 
             # Multi-page statistics
-            multi_page = sum(
-                1 for c in diagram.components
-                if len(c.page_positions) > 1
-            )
             if multi_page > 0:
-                summary += f"Components on multiple pages: {multi_page}\n"
+                parts.append(f"Components on multiple pages: {multi_page}\n")
 
                 # Show page distribution
-                page_counts: Dict[int, int] = defaultdict(int)
-                for comp in diagram.components:
-                    for page_num in comp.get_pages():
-                        page_counts[page_num] += 1
-                summary += "Components per page:\n"
+                parts.append("Components per page:\n")
                 for page_num in sorted(page_counts.keys()):
-                    summary += f"  Page {page_num:2d}: {page_counts[page_num]:3d} components\n"
+                    parts.append(f"  Page {page_num:2d}: {page_counts[page_num]:3d} components\n")
 
         # Wire detection stats if available
         if 'wire_detection_stats' in diagram.metadata:
             stats = diagram.metadata['wire_detection_stats']
-            summary += "\nVisual Wire Detection:\n"
-            summary += f"  Total wire segments: {stats.get('total_wires', 0)}\n"
-            summary += f"  Traced paths: {stats.get('traced_paths', 0)}\n"
+            parts.append("\nVisual Wire Detection:\n")
+            parts.append(f"  Total wire segments: {stats.get('total_wires', 0)}\n")
+            parts.append(f"  Traced paths: {stats.get('traced_paths', 0)}\n")
             if stats.get('color_counts'):
-                summary += "  Color distribution:\n"
+                parts.append("  Color distribution:\n")
                 for color, count in sorted(stats['color_counts'].items()):
-                    summary += f"    {color}: {count}\n"
+                    parts.append(f"    {color}: {count}\n")
 
-        return summary
+        return "".join(parts)
@@ -104,6 +104,10 @@ SKIP_PAGE_TITLES_DE = [
     "Betriebsmittelkennzeichen",
 ]
 
+# Default "dict" extraction flags without TEXT_PRESERVE_IMAGES: title
+# detection only reads text blocks, so image blocks are not built
+_TITLE_TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
 
 def classify_page(page: fitz.Page) -> str:
     """Classify a PDF page by reading its title block.
@@ -140,7 +144,9 @@ def classify_page(page: fitz.Page) -> str:
         ph * 0.98     # Bottom edge (~779 for 795pt tall page)
     )
 
-    text_dict = page.get_text("dict", clip=title_block_region)
+    # Titles span several words, so this reads spans rather than words;
+    # image blocks are left out since only text is used
+    text_dict = page.get_text("dict", clip=title_block_region, flags=_TITLE_TEXT_FLAGS)
     title_candidates = []
 
     for block in text_dict.get("blocks", []):
@@ -289,7 +295,9 @@ class ComponentPositionFinder:
     def __init__(
         self,
         pdf_path: Path,
-        schematic_pages: Optional[Tuple[int, int]] = None
+        schematic_pages: Optional[Tuple[int, int]] = None,
+        doc: Optional[fitz.Document] = None,
+        page_titles: Optional[Dict[int, str]] = None
     ):
         """Initialize the position finder.
 
@@ -297,16 +305,27 @@ class ComponentPositionFinder:
             pdf_path: Path to the PDF file
             schematic_pages: Optional tuple of (start_page, end_page) to search.
                            If None, searches default schematic page range.
+            doc: Already open document for pdf_path; used instead of
+                reopening the file and left open by close()
+            page_titles: Page number -> title cache to read and fill in
+                place, so other passes over the same PDF can share the
+                title block classification
         """
         self.pdf_path = Path(pdf_path)
         self.doc: Optional[fitz.Document] = None
+        self._shared_doc = doc
         self.schematic_pages = schematic_pages or self.DEFAULT_SCHEMATIC_PAGE_RANGE
 
         # Cache for page classifications to avoid re-reading title blocks
-        self._page_classifications: Dict[int, str] = {}
+        self._page_classifications: Dict[int, str] = (
+            page_titles if page_titles is not None else {}
+        )
         self._page_skip_cache: Dict[int, bool] = {}
 
-        self._open_document()
+        if doc is not None:
+            self.doc = doc
+        else:
+            self._open_document()
 
     def _open_document(self) -> None:
         """Open the PDF document."""
@@ -315,9 +334,10 @@ class ComponentPositionFinder:
         self.doc = fitz.open(self.pdf_path)
 
     def close(self) -> None:
-        """Close the PDF document."""
+        """Close the PDF document, unless it was passed in by the caller."""
         if self.doc:
-            self.doc.close()
+            if self.doc is not self._shared_doc:
+                self.doc.close()
             self.doc = None
 
     def __enter__(self) -> "ComponentPositionFinder":
@@ -500,39 +520,32 @@ class ComponentPositionFinder:
                 continue
 
             page = self.doc[page_num]
-            text_dict = page.get_text("dict")
 
-            for block in text_dict.get("blocks", []):
-                if block.get("type") != 0:  # Only text blocks
-                    continue
+            # Words (x0, y0, x1, y1, text, block, line, word): contact
+            # references contain no spaces, so no span dicts are needed
+            for x0, y0, x1, y1, text, _, _, _ in page.get_text("words"):
+                # Check if this is a contact instance reference
+                match = self.CONTACT_INSTANCE_PATTERN.match(text)
+                if match:
+                    base_tag = match.group(1)
+                    suffix = f".{match.group(2)}"
+
+                    # Check if base tag matches our device
+                    if base_tag == device_tag:
+                        position = ComponentPosition(
+                            device_tag=text,  # Full reference (e.g., "-K1.1")
+                            x=(x0 + x1) / 2,
+                            y=(y0 + y1) / 2,
+                            width=x1 - x0,
+                            height=y1 - y0,
+                            page=page_num,
+                            confidence=1.0,
+                            match_type="contact_instance"
+                        )
 
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        text = span.get("text", "").strip()
-                        bbox = span.get("bbox", (0, 0, 0, 0))
-
-                        # Check if this is a contact instance reference
-                        match = self.CONTACT_INSTANCE_PATTERN.match(text)
-                        if match:
-                            base_tag = match.group(1)
-                            suffix = f".{match.group(2)}"
-
-                            # Check if base tag matches our device
-                            if base_tag == device_tag:
-                                position = ComponentPosition(
-                                    device_tag=text,  # Full reference (e.g., "-K1.1")
-                                    x=(bbox[0] + bbox[2]) / 2,
-                                    y=(bbox[1] + bbox[3]) / 2,
-                                    width=bbox[2] - bbox[0],
-                                    height=bbox[3] - bbox[1],
-                                    page=page_num,
-                                    confidence=1.0,
-                                    match_type="contact_instance"
-                                )
-
-                                if suffix not in contact_positions:
-                                    contact_positions[suffix] = []
-                                contact_positions[suffix].append(position)
+                        if suffix not in contact_positions:
+                            contact_positions[suffix] = []
+                        contact_positions[suffix].append(position)
 
         return contact_positions
 
@@ -681,44 +694,36 @@ class ComponentPositionFinder:
         page = self.doc[page_num]
         positions: Dict[str, List[ComponentPosition]] = {}
 
-        # Get text with positions using "dict" format
-        text_dict = page.get_text("dict")
-
-        for block in text_dict.get("blocks", []):
-            if block.get("type") != 0:  # Only text blocks
+        # Get text with positions as words (x0, y0, x1, y1, text, block,
+        # line, word). Device tags contain no spaces, and a flat tuple list
+        # is far cheaper to build than the nested "dict" output.
+        for x0, y0, x1, y1, text, _, _, _ in page.get_text("words"):
+            # Skip cross-references (TAG:PAGE/COORDINATE format)
+            if is_cross_reference(text):
                 continue
 
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    text = span.get("text", "").strip()
-                    bbox = span.get("bbox", (0, 0, 0, 0))
-
-                    # Skip cross-references (TAG:PAGE/COORDINATE format)
-                    if is_cross_reference(text):
-                        continue
-
-                    # Skip contact instances (handled by find_contact_positions)
-                    if self.CONTACT_INSTANCE_PATTERN.match(text):
-                        continue
-
-                    # Try to match this text to a device tag
-                    matched_tag = self._match_text_to_tag(text, tag_set, tag_variants)
-
-                    if matched_tag:
-                        position = ComponentPosition(
-                            device_tag=matched_tag,
-                            x=(bbox[0] + bbox[2]) / 2,  # Center X
-                            y=(bbox[1] + bbox[3]) / 2,  # Center Y
-                            width=bbox[2] - bbox[0],
-                            height=bbox[3] - bbox[1],
-                            page=page_num,
-                            confidence=self._calculate_confidence(text, matched_tag),
-                            match_type=self._determine_match_type(text, matched_tag)
-                        )
+            # Skip contact instances (handled by find_contact_positions)
+            if self.CONTACT_INSTANCE_PATTERN.match(text):
+                continue
 
-                        if matched_tag not in positions:
-                            positions[matched_tag] = []
-                        positions[matched_tag].append(position)
+            # Try to match this text to a device tag
+            matched_tag = self._match_text_to_tag(text, tag_set, tag_variants)
+
+            if matched_tag:
+                position = ComponentPosition(
+                    device_tag=matched_tag,
+                    x=(x0 + x1) / 2,  # Center X
+                    y=(y0 + y1) / 2,  # Center Y
+                    width=x1 - x0,
+                    height=y1 - y0,
+                    page=page_num,
+                    confidence=self._calculate_confidence(text, matched_tag),
+                    match_type=self._determine_match_type(text, matched_tag)
+                )
+
+                if matched_tag not in positions:
+                    positions[matched_tag] = []
+                positions[matched_tag].append(position)
 
         return positions
 
@@ -863,34 +868,25 @@ class ComponentPositionFinder:
                 continue
 
             page = self.doc[page_num]
-            text_dict = page.get_text("dict")
 
-            for block in text_dict.get("blocks", []):
-                if block.get("type") != 0:
+            for x0, y0, x1, y1, text, _, _, _ in page.get_text("words"):
+                # Skip cross-references
+                if is_cross_reference(text):
                     continue
 
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        text = span.get("text", "").strip()
-                        bbox = span.get("bbox", (0, 0, 0, 0))
-
-                        # Skip cross-references
-                        if is_cross_reference(text):
-                            continue
-
-                        # Check if text looks like a device tag
-                        if self.DEVICE_TAG_PATTERN.match(text):
-                            position = ComponentPosition(
-                                device_tag=text,
-                                x=(bbox[0] + bbox[2]) / 2,
-                                y=(bbox[1] + bbox[3]) / 2,
-                                width=bbox[2] - bbox[0],
-                                height=bbox[3] - bbox[1],
-                                page=page_num,
-                                confidence=1.0,
-                                match_type="discovered"
-                            )
-                            positions.append(position)
+                # Check if text looks like a device tag
+                if self.DEVICE_TAG_PATTERN.match(text):
+                    position = ComponentPosition(
+                        device_tag=text,
+                        x=(x0 + x1) / 2,
+                        y=(y0 + y1) / 2,
+                        width=x1 - x0,
+                        height=y1 - y0,
+                        page=page_num,
+                        confidence=1.0,
+                        match_type="discovered"
+                    )
+                    positions.append(position)
 
         return positions
 
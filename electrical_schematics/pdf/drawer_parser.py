@@ -135,14 +135,17 @@ class DrawerDiagram:
 class DrawerParser:
     """Parser for DRAWER-style electrical diagrams."""
 
-    def __init__(self, pdf_path: Path):
+    def __init__(self, pdf_path: Path, doc: Optional[fitz.Document] = None):
         """Initialize the parser.
 
         Args:
             pdf_path: Path to the PDF file
+            doc: Already open document for pdf_path; parse() uses it instead
+                of reopening the file and leaves it open for the caller
         """
         self.pdf_path = pdf_path
         self.doc: Optional[fitz.Document] = None
+        self._shared_doc = doc
 
     def parse(self) -> DrawerDiagram:
         """Parse the complete diagram.
@@ -150,18 +153,21 @@ class DrawerParser:
         Returns:
             Parsed DrawerDiagram object
         """
-        self.doc = fitz.open(self.pdf_path)
+        shared = self._shared_doc is not None
+        self.doc = self._shared_doc if shared else fitz.open(self.pdf_path)
 
         diagram = DrawerDiagram(pdf_path=self.pdf_path)
 
-        # Parse device tag list (typically pages 26-27)
-        diagram.devices = self._parse_device_tags()
+        try:
+            # Parse device tag list (typically pages 26-27)
+            diagram.devices = self._parse_device_tags()
 
-        # Parse cable connections (typically pages 28-40)
-        diagram.connections = self._parse_cable_connections()
-
-        self.doc.close()
-        self.doc = None
+            # Parse cable connections (typically pages 28-40)
+            diagram.connections = self._parse_cable_connections()
+        finally:
+            if not shared:
+                self.doc.close()
+            self.doc = None
 
         return diagram
 
@@ -24,13 +24,16 @@ class DrawerToModelConverter:
     @staticmethod
     def convert(
         drawer_diagram: DrawerDiagram,
-        auto_position: bool = True
+        auto_position: bool = True,
+        page_titles: Optional[Dict[int, str]] = None
     ) -> WiringDiagram:
         """Convert DRAWER diagram to WiringDiagram.
 
         Args:
             drawer_diagram: Parsed DRAWER diagram
             auto_position: If True, automatically find component positions in PDF
+            page_titles: Optional page number -> title cache shared with
+                other passes over the same PDF (filled in place)
 
         Returns:
             WiringDiagram suitable for simulation
@@ -55,7 +58,8 @@ class DrawerToModelConverter:
         if auto_position and drawer_diagram.pdf_path:
             DrawerToModelConverter.populate_component_positions(
                 wiring_diagram,
-                drawer_diagram.pdf_path
+                drawer_diagram.pdf_path,
+                page_titles=page_titles
             )
 
             # BUGFIX: Generate wire paths after component positions are known
@@ -195,7 +199,8 @@ class DrawerToModelConverter:
     def populate_component_positions(
         diagram: WiringDiagram,
         pdf_path: Path,
-        schematic_pages: Optional[Tuple[int, int]] = None
+        schematic_pages: Optional[Tuple[int, int]] = None,
+        page_titles: Optional[Dict[int, str]] = None
     ) -> Dict[str, bool]:
         """Populate component positions by finding device tags in PDF.
 
@@ -206,6 +211,8 @@ class DrawerToModelConverter:
             diagram: WiringDiagram with components to position
             pdf_path: Path to PDF file
             schematic_pages: Optional (start, end) page range to search
+            page_titles: Optional page number -> title cache shared with
+                other passes over the same PDF (filled in place)
 
         Returns:
             Dictionary mapping component IDs to success status (True if found)
@@ -224,7 +231,9 @@ class DrawerToModelConverter:
         results: Dict[str, bool] = {}
 
         try:
-            with ComponentPositionFinder(pdf_path, schematic_pages) as finder:
+            with ComponentPositionFinder(
+                pdf_path, schematic_pages, page_titles=page_titles
+            ) as finder:
                 position_result = finder.find_positions(device_tags)
 
                 # Update components with found positions
@@ -426,6 +435,9 @@ class DrawerToModelConverter:
                 # Circuit breakers on 400VAC are often at mains input
                 component.type = IndustrialComponentType.POWER_400VAC
 
+        # Types changed in place: refresh the diagram's role indexes
+        diagram.reindex()
+
     @staticmethod
     def identify_sensors(diagram: WiringDiagram) -> None:
         """Identify sensor/switch components and set their defaults.
@@ -17,7 +17,7 @@ class PartData:
     type_designation: str  # Part number
 
 
-def find_parts_list_pages(pdf_path: Path) -> List[int]:
+def find_parts_list_pages(pdf_path: Path, doc: Optional[fitz.Document] = None) -> List[int]:
     """Find all pages containing parts lists.
 
     Looks for "Parts list" marker anywhere on the page.
@@ -26,11 +26,14 @@ def find_parts_list_pages(pdf_path: Path) -> List[int]:
 
     Args:
         pdf_path: Path to PDF file
+        doc: Already open document for pdf_path; left open for the caller
 
     Returns:
         List of page numbers (0-indexed) containing parts lists, sorted by page number
     """
-    doc = fitz.open(pdf_path)
+    owns_doc = doc is None
+    if owns_doc:
+        doc = fitz.open(pdf_path)
 
     markers = [
         "Parts list",
@@ -70,7 +73,8 @@ def find_parts_list_pages(pdf_path: Path) -> List[int]:
         if device_tag_count >= 3:  # Lower threshold to catch pages with fewer components
             candidate_pages.append((page_num, device_tag_count))
 
-    doc.close()
+    if owns_doc:
+        doc.close()
 
     if not candidate_pages:
         return []
@@ -95,30 +99,34 @@ def find_parts_list_page(pdf_path: Path) -> Optional[int]:
     return pages[0] if pages else None
 
 
-def parse_parts_list(pdf_path: Path) -> List[PartData]:
+def parse_parts_list(pdf_path: Path, doc: Optional[fitz.Document] = None) -> List[PartData]:
     """Parse parts list from all parts list pages.
 
     Scans for all parts list pages and combines results.
 
     Args:
         pdf_path: Path to PDF file
+        doc: Already open document for pdf_path; left open for the caller
 
     Returns:
         List of part data from all parts list pages
     """
-    # Find ALL parts list pages
-    page_nums = find_parts_list_pages(pdf_path)
-    if not page_nums:
-        return []
-
-    doc = fitz.open(pdf_path)
-    all_parts = []
-
-    for page_num in page_nums:
-        page_parts = _parse_single_parts_page(doc, page_num)
-        all_parts.extend(page_parts)
+    owns_doc = doc is None
+    if owns_doc:
+        doc = fitz.open(pdf_path)
+
+    try:
+        # Find ALL parts list pages
+        page_nums = find_parts_list_pages(pdf_path, doc)
+        all_parts = []
+
+        for page_num in page_nums:
+            page_parts = _parse_single_parts_page(doc, page_num)
+            all_parts.extend(page_parts)
+    finally:
+        if owns_doc:
+            doc.close()
 
-    doc.close()
     return all_parts
 
 
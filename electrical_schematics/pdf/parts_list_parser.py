@@ -31,14 +31,17 @@ class PartsListComponent:
 class PartsListParser:
     """Parser for extracting component information from PDF parts lists."""
 
-    def __init__(self, pdf_path: Path):
+    def __init__(self, pdf_path: Path, doc: Optional[fitz.Document] = None):
         """Initialize parser.
 
         Args:
             pdf_path: Path to PDF file
+            doc: Already open document for pdf_path; used instead of
+                reopening the file and left open by close()
         """
         self.pdf_path = pdf_path
         self.doc = None
+        self._shared_doc = doc
 
     def find_parts_list_pages(self) -> List[int]:
         """Find pages containing parts lists.
@@ -49,7 +52,11 @@ class PartsListParser:
         Returns:
             List of page numbers containing parts lists
         """
-        self.doc = fitz.open(self.pdf_path)
+        if self.doc is None:
+            if self._shared_doc is not None:
+                self.doc = self._shared_doc
+            else:
+                self.doc = fitz.open(self.pdf_path)
         parts_pages = []
 
         markers = [
@@ -131,9 +138,7 @@ class PartsListParser:
             components = self._parse_parts_page(page_num)
             all_components.extend(components)
 
-        if self.doc:
-            self.doc.close()
-            self.doc = None
+        self.close()
 
         return all_components
 
@@ -293,7 +298,8 @@ class PartsListParser:
         return components
 
     def close(self):
-        """Close the PDF document."""
+        """Close the PDF document, unless it was passed in by the caller."""
         if self.doc:
-            self.doc.close()
+            if self.doc is not self._shared_doc:
+                self.doc.close()
             self.doc = None
@@ -13,7 +13,7 @@ import math
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple, Literal
+from typing import Callable, Dict, List, Optional, Set, Tuple, Literal
 
 import fitz  # PyMuPDF
 
@@ -831,6 +831,28 @@ class WirePathGenerator:
 
         return points
 
+    @classmethod
+    def path_function(
+        cls, routing_style: str
+    ) -> Callable[[float, float, float, float], List[WirePoint]]:
+        """Return the path generator for a routing style.
+
+        Resolve this once before generating many paths rather than
+        comparing the style for every wire.
+
+        Args:
+            routing_style: "manhattan", "l_path", "straight", or "smooth";
+                unknown styles give straight lines
+
+        Returns:
+            Function taking (src_x, src_y, tgt_x, tgt_y)
+        """
+        return {
+            "manhattan": cls.generate_manhattan_path,
+            "l_path": cls.generate_l_path,
+            "smooth": cls.generate_smooth_path,
+        }.get(routing_style, cls.generate_straight_line)
+
 
 class VisualWireDetector:
     """Detects wires on PDF pages using visual/geometric analysis.
@@ -873,29 +895,43 @@ class VisualWireDetector:
         self._path_tracer = WirePathTracer()
         self._line_classifier: Optional[LineClassifier] = None
 
+        # Page -> detected segments, so the per-page helpers (paths,
+        # statistics, color filters) share one get_drawings() pass
+        self._page_wires: Dict[int, List[VisualWire]] = {}
+
     def detect_wires(self, page_num: int) -> List[VisualWire]:
         """Detect wires on a specific page.
 
+        Results are cached per page; see clear_cache().
+
         Args:
             page_num: Page number (0-indexed)
 
         Returns:
-            List of detected wires
+            List of detected wires (a new list on each call)
         """
         if page_num >= len(self.doc):
             return []
 
-        page = self.doc[page_num]
-        wires = []
+        wires = self._page_wires.get(page_num)
+        if wires is None:
+            page = self.doc[page_num]
+            wires = []
 
-        # Get drawing commands from page
-        drawings = page.get_drawings()
+            # Get drawing commands from page
+            drawings = page.get_drawings()
 
-        for drawing in drawings:
-            detected = self._process_drawing(drawing, page_num)
-            wires.extend(detected)
+            for drawing in drawings:
+                detected = self._process_drawing(drawing, page_num)
+                wires.extend(detected)
 
-        return wires
+            self._page_wires[page_num] = wires
+
+        return list(wires)
+
+    def clear_cache(self) -> None:
+        """Forget cached page detections (e.g. after changing thresholds)."""
+        self._page_wires.clear()
 
     def detect_wires_only(self, page_num: int) -> List[VisualWire]:
         """Detect only actual wires, filtering out borders, grids, etc.
@@ -1290,7 +1326,7 @@ def generate_wire_paths_from_connections(
             - voltage_level: str
             - path: List[WirePoint]
     """
-    generator = WirePathGenerator()
+    route = WirePathGenerator.path_function(routing_style)
     wires = []
 
     for conn in connections:
@@ -1309,15 +1345,7 @@ def generate_wire_paths_from_connections(
         tgt_x = tgt_pos.get('x', 0) + tgt_pos.get('width', 0) / 2
         tgt_y = tgt_pos.get('y', 0) + tgt_pos.get('height', 0) / 2
 
-        # Generate path based on style
-        if routing_style == "manhattan":
-            path = generator.generate_manhattan_path(src_x, src_y, tgt_x, tgt_y)
-        elif routing_style == "l_path":
-            path = generator.generate_l_path(src_x, src_y, tgt_x, tgt_y)
-        elif routing_style == "smooth":
-            path = generator.generate_smooth_path(src_x, src_y, tgt_x, tgt_y)
-        else:  # straight
-            path = generator.generate_straight_line(src_x, src_y, tgt_x, tgt_y)
+        path = route(src_x, src_y, tgt_x, tgt_y)
 
         wire = {
             'from_component_id': src_device,
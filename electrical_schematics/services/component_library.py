@@ -10,6 +10,12 @@ from typing import Optional, Dict, List, Any, Iterator, Callable, TYPE_CHECKING
 from electrical_schematics.models.library_part import LibraryPart
 from electrical_schematics.models.project_component import ProjectComponent
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if TYPE_CHECKING:
     from electrical_schematics.services.auto_enrichment import (
         AutoEnrichmentService,
@@ -624,8 +630,12 @@ class ComponentLibrary:
         # Ensure directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            # Same layout as json.dump(indent=2, ensure_ascii=False)
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
         self._modified = False
         logger.info(f"Saved library to {path}")
@@ -643,8 +653,11 @@ class ComponentLibrary:
             logger.info(f"Library file not found at {path}, starting with empty library")
             return
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
         version = data.get("version", "1.0")
         was_migrated = False
@@ -674,8 +687,7 @@ class ComponentLibrary:
         """
         # Load library parts
         self._parts.clear()
-        for part_data in data.get("library_parts", []):
-            part = LibraryPart.from_dict(part_data)
+        for part in LibraryPart.bulk_load(data.get("library_parts", [])):
             self._parts[part.manufacturer_part_number] = part
 
         # Load project components
@@ -0,0 +1,374 @@
+"""Tests for automatic diagram loading and analysis."""
+
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
+
+import fitz
+import pytest
+
+from electrical_schematics.models import IndustrialComponent, IndustrialComponentType, WiringDiagram
+from electrical_schematics.models.wire import Wire
+from electrical_schematics.pdf import auto_loader, component_position_finder
+from electrical_schematics.pdf.auto_loader import DiagramAutoLoader
+from electrical_schematics.pdf.component_position_finder import (
+    ComponentPosition,
+    PositionFinderResult,
+)
+from electrical_schematics.pdf.drawer_parser import CableConnection
+from electrical_schematics.pdf.visual_wire_detector import WireColor
+
+
+def _make_pdf(path: Path, page_count: int, texts: Dict[int, str]) -> Path:
+    """Write a PDF with page_count pages, putting texts[i] on page i."""
+    doc = fitz.open()
+    for page_num in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 72), texts.get(page_num, f"Page {page_num + 1}"))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_detect_drawer_format_short_document(tmp_path: Path) -> None:
+    """Test a short document with both indicators is detected."""
+    pdf = _make_pdf(tmp_path / "short.pdf", 3, {0: "Device tag", 2: "Cable diagram"})
+
+    assert DiagramAutoLoader.detect_format(pdf) == "drawer"
+
+
+def test_detect_drawer_format_on_distant_pages(tmp_path: Path) -> None:
+    """Test indicators found on pages far apart are combined."""
+    pdf = _make_pdf(tmp_path / "long.pdf", 12, {1: "Betriebsmittelkennzeichen", 10: "Kabelplan"})
+
+    assert DiagramAutoLoader.detect_format(pdf) == "drawer"
+
+
+def test_detect_manual_format_with_one_indicator(tmp_path: Path) -> None:
+    """Test a document missing the cable diagram is not DRAWER format."""
+    pdf = _make_pdf(tmp_path / "partial.pdf", 12, {3: "Device tag"})
+
+    assert DiagramAutoLoader.detect_format(pdf) == "manual"
+
+
+def test_detect_format_only_scans_first_pages(tmp_path: Path) -> None:
+    """Test indicators beyond the scanned page range are ignored."""
+    pdf = _make_pdf(tmp_path / "late.pdf", 32, {0: "Device tag", 31: "Cable diagram"})
+
+    assert DiagramAutoLoader.detect_format(pdf) == "manual"
+
+
+def test_detect_drawer_format_single_page_mixed_languages(tmp_path: Path) -> None:
+    """Test both indicators on one page, in different languages, are found."""
+    pdf = _make_pdf(tmp_path / "mixed.pdf", 1, {0: "Kabelplan / Device tag"})
+
+    assert DiagramAutoLoader.detect_format(pdf) == "drawer"
+
+
+def test_detect_drawer_format_cable_diagram_first(tmp_path: Path) -> None:
+    """Test a device tag page after the cable diagram page is still found."""
+    pdf = _make_pdf(
+        tmp_path / "reversed.pdf", 4, {0: "Kabelplan", 1: "Cable diagram", 3: "Device tag"}
+    )
+
+    assert DiagramAutoLoader.detect_format(pdf) == "drawer"
+
+
+def test_detect_format_leaves_open_document_open(tmp_path: Path) -> None:
+    """Test a caller-owned document is scanned and not closed."""
+    pdf = _make_pdf(tmp_path / "shared.pdf", 12, {0: "Device tag", 9: "Cable diagram"})
+
+    with fitz.open(pdf) as doc:
+        assert DiagramAutoLoader.detect_format(doc) == "drawer"
+        assert not doc.is_closed
+        assert len(doc) == 12
+
+
+def test_load_diagram_without_parts_list_is_manual(tmp_path: Path) -> None:
+    """Test a plain PDF falls through to an empty diagram for annotation."""
+    pdf = _make_pdf(tmp_path / "plain.pdf", 2, {})
+
+    diagram, format_type = DiagramAutoLoader.load_diagram(pdf, auto_position=False)
+
+    assert format_type == "manual"
+    assert diagram.components == []
+    assert diagram.pdf_path == pdf
+
+
+def test_extract_voltage() -> None:
+    """Test AC/DC ratings are preferred and normalized."""
+    extract = DiagramAutoLoader._extract_voltage
+
+    assert extract("Coil 24 V dc, 3 poles") == "24VDC"
+    assert extract("230V supply, control 24VDC") == "24VDC"
+    assert extract("DC 24V") == "24V"
+    assert extract("no rating") == ""
+    assert extract("") == ""
+
+
+def test_extract_device_from_terminal() -> None:
+    """Test device tags are cut from terminal references."""
+    extract = DiagramAutoLoader._extract_device_from_terminal
+
+    assert extract("-A1-X5:3") == "-A1"
+    assert extract("+K2:13") == "+K2"
+    assert extract("X1:4") == "X1:4"
+    assert extract("+DG-M1:2") == "+DG-M1"
+    assert extract("+X12-X3:1") == "+X12"
+    assert extract("-A1-") == "-A1"
+    assert extract("-a1") == "-a1"
+    assert extract("-X1-X2:5") == ""
+
+
+def test_infer_component_type() -> None:
+    """Test single-letter prefixes map to types and other tags do not."""
+    infer = DiagramAutoLoader._infer_component_type
+
+    assert infer("-K1") == IndustrialComponentType.CONTACTOR
+    assert infer("+X12") == IndustrialComponentType.TERMINAL_BLOCK
+    assert infer("M3") == IndustrialComponentType.MOTOR
+    assert infer("-KF1") == IndustrialComponentType.OTHER
+    assert infer("-Z1") == IndustrialComponentType.OTHER
+    assert infer("") == IndustrialComponentType.OTHER
+
+
+def test_match_visual_to_logical_consumes_wires_in_order() -> None:
+    """Test visual wires match the earliest unmatched wire of their voltage."""
+    wires = [
+        Wire(id="W1", voltage_level="0V"),
+        Wire(id="W2", voltage_level="UNKNOWN"),
+        Wire(id="W3", voltage_level="24VDC"),
+        Wire(id="W4", voltage_level="24VDC"),
+    ]
+    by_voltage, unknown_wires = DiagramAutoLoader._index_wires_by_voltage(wires)
+    red = SimpleNamespace(color=WireColor.RED)
+
+    matched = [
+        DiagramAutoLoader._match_visual_to_logical(red, by_voltage, unknown_wires)
+        for _ in range(4)
+    ]
+
+    assert [w.id if w else None for w in matched] == ["W2", "W3", "W4", None]
+    assert DiagramAutoLoader._match_visual_to_logical(
+        SimpleNamespace(color=WireColor.BLUE), by_voltage, unknown_wires
+    ) is wires[0]
+    assert DiagramAutoLoader._match_visual_to_logical(
+        SimpleNamespace(color=WireColor.WHITE), by_voltage, unknown_wires
+    ) is None
+
+
+def test_infer_voltage_from_color() -> None:
+    """Test wire color codes map to voltages regardless of case."""
+    infer = DiagramAutoLoader._infer_voltage_from_color
+
+    assert infer("RD") == "24VDC"
+    assert infer("gnye") == "PE"
+    assert infer("PK") == "UNKNOWN"
+    assert infer("") == "UNKNOWN"
+
+
+def test_generate_wires_from_cable_connections_uses_centers() -> None:
+    """Test wires run between component centers and missing positions get no path."""
+    connections = [
+        CableConnection("W1", "", "-A1-X5:3", "-K1:A1", wire_color="RD"),
+        CableConnection("W2", "", "-A1:1", "-M9:1", wire_color="BU"),
+    ]
+    positions = {
+        "-A1": {"x": 0, "y": 0, "width": 20, "height": 10},
+        "-K1": {"x": 100, "y": 50},
+    }
+
+    wires = DiagramAutoLoader.generate_wires_from_cable_connections(
+        connections, positions, routing_style="straight"
+    )
+
+    assert [(w.from_component_id, w.to_component_id) for w in wires] == [
+        ("-A1", "-K1"), ("-A1", "-M9")
+    ]
+    assert [(p.x, p.y) for p in wires[0].path] == [(10, 5), (100, 50)]
+    assert wires[0].voltage_level == "24VDC"
+    assert not wires[1].path
+
+
+def test_generate_wire_paths_fills_parallel_wires() -> None:
+    """Test each of several wires between the same components gets a path."""
+    diagram = WiringDiagram(name="test")
+    diagram.components = [
+        IndustrialComponent(id="K1", designation="K1", type=IndustrialComponentType.RELAY,
+                            x=0, y=0, width=20, height=20),
+        IndustrialComponent(id="K2", designation="K2", type=IndustrialComponentType.RELAY,
+                            x=200, y=0, width=20, height=20),
+    ]
+    diagram.wires = [
+        Wire(id="W1", from_component_id="K1", to_component_id="K2"),
+        Wire(id="W2", from_component_id="K1", to_component_id="K2"),
+    ]
+
+    DiagramAutoLoader.generate_wire_paths(diagram, routing_style="straight")
+
+    assert [(p.x, p.y) for p in diagram.wires[0].path] == [(10, 10), (210, 10)]
+    assert [(p.x, p.y) for p in diagram.wires[1].path] == [(10, 10), (210, 10)]
+    assert diagram.wires[0].path is not diagram.wires[1].path
+
+
+def _make_wire_pdf(path: Path, page_count: int) -> Path:
+    """Write a PDF whose page i has i + 1 long red horizontal lines."""
+    doc = fitz.open()
+    for page_num in range(page_count):
+        page = doc.new_page()
+        for line in range(page_num + 1):
+            y = 100 + 20 * line
+            page.draw_line((100, y), (400, y), color=(1, 0, 0), width=1)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_analyze_visual_wires_collects_statistics(tmp_path: Path) -> None:
+    """Test wire statistics are summed over pages and wires are matched."""
+    pdf = _make_wire_pdf(tmp_path / "wires.pdf", 10)
+
+    diagram = WiringDiagram(name="wires")
+    diagram.wires = [Wire(id="W1", voltage_level="UNKNOWN")]
+    with fitz.open(pdf) as doc:
+        DiagramAutoLoader._analyze_visual_wires(pdf, diagram, None, doc)
+
+    stats = diagram.metadata["wire_detection_stats"]
+    assert stats["total_wires"] == sum(range(1, 11))
+    assert type(stats["color_counts"]) is dict
+    assert sum(stats["color_counts"].values()) == sum(range(1, 11))
+    assert diagram.wires[0].voltage_level == "24VDC"
+    assert [(p.x, p.y) for p in diagram.wires[0].path] == [(100, 100), (400, 100)]
+
+
+def test_analyze_visual_wires_skips_cable_diagram_pages(tmp_path: Path) -> None:
+    """Test pages titled as cable diagrams are not analyzed for wires."""
+    pdf = _make_wire_pdf(tmp_path / "titled.pdf", 3)
+    doc = fitz.open(pdf)
+    doc[1].insert_text((72, 800), "Cable diagram")
+    doc.saveIncr()
+
+    diagram = WiringDiagram(name="titled")
+    DiagramAutoLoader._analyze_visual_wires(pdf, diagram, None, doc)
+    doc.close()
+
+    stats = diagram.metadata["wire_detection_stats"]
+    assert stats["skipped_pages"] == 1
+    assert stats["total_wires"] == 1 + 3
+
+
+def test_analyze_visual_wires_reuses_page_titles(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test titles already classified by another pass are not read again."""
+    pdf = _make_wire_pdf(tmp_path / "shared.pdf", 3)
+    read = []
+
+    def classify(page: fitz.Page) -> str:
+        read.append(page.number)
+        return ""
+
+    monkeypatch.setattr(auto_loader, "classify_page", classify)
+    page_titles = {0: "", 1: "Cable diagram"}
+
+    diagram = WiringDiagram(name="shared")
+    with fitz.open(pdf) as doc:
+        DiagramAutoLoader._analyze_visual_wires(pdf, diagram, None, doc, page_titles)
+
+    assert read == [2]
+    assert page_titles[2] == ""
+    assert diagram.metadata["wire_detection_stats"]["skipped_pages"] == 1
+
+
+def test_create_summary_component_statistics() -> None:
+    """Test voltage, position and page counts in the summary."""
+    k1 = IndustrialComponent(id="K1", designation="K1", type=IndustrialComponentType.RELAY,
+                             voltage_rating="24VDC", x=10, y=10)
+    k1.add_page_position(2, 10, 10, 20, 20)
+    k1.add_page_position(5, 30, 30, 20, 20)
+    m1 = IndustrialComponent(id="M1", designation="M1", type=IndustrialComponentType.MOTOR,
+                             voltage_rating="400VAC")
+    m1.add_page_position(5, 0, 0, 20, 20)
+    diagram = WiringDiagram(name="summary", components=[k1, m1])
+
+    summary = DiagramAutoLoader.create_summary(diagram)
+
+    assert summary.startswith("Loaded: summary\n" + "=" * 60 + "\n\nComponents by voltage:\n")
+    assert "  24VDC       :   1 devices\n" in summary
+    assert "  400VAC      :   1 devices\n" in summary
+    assert "Components with positions: 1/2\n" in summary
+    assert "Components on multiple pages: 1\n" in summary
+    assert "  Page  2:   1 components\n" in summary
+    assert "  Page  5:   2 components\n" in summary
+
+
+def test_populate_component_positions_uses_best_ambiguous_match(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test multi-page matches are all stored and the best one is primary."""
+    result = PositionFinderResult(
+        positions={"-K1": ComponentPosition("-K1", 10, 20, 50, 40, page=1)},
+        ambiguous_matches={
+            "-K1": [ComponentPosition("-K1", 15, 25, 50, 40, page=3, confidence=0.5)],
+            "-M1": [
+                ComponentPosition("-M1", 100, 100, 10, 10, page=2, confidence=0.6),
+                ComponentPosition("-M1", 200, 200, 10, 10, page=4, confidence=0.9),
+                ComponentPosition("-M1", 300, 300, 10, 10, page=5, confidence=0.9),
+            ],
+        },
+    )
+
+    class FakeFinder:
+        def __init__(self, pdf_path: Path, doc: object = None) -> None:
+            finder_docs.append(doc)
+
+        def __enter__(self) -> "FakeFinder":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            pass
+
+        def find_positions(self, device_tags: list, search_all_pages: bool) -> PositionFinderResult:
+            return result
+
+    finder_docs: list = []
+    monkeypatch.setattr(component_position_finder, "ComponentPositionFinder", FakeFinder)
+    components = [
+        IndustrialComponent(id=tag, designation=tag, type=IndustrialComponentType.OTHER)
+        for tag in ("-K1", "-M1", "-S1")
+    ]
+    diagram = WiringDiagram(name="positions", components=components)
+
+    shared_doc = object()
+    results = DiagramAutoLoader._populate_component_positions(
+        diagram, tmp_path / "unused.pdf", shared_doc
+    )
+
+    assert finder_docs == [shared_doc]
+    assert results == {"-K1": True, "-M1": True, "-S1": False}
+    k1, m1, s1 = components
+    assert (k1.x, k1.y, k1.page) == (10, 20, 1)
+    assert sorted(k1.page_positions) == [1, 3]
+    # Ties keep the first of the most confident matches
+    assert (m1.x, m1.y, m1.page) == (200, 200, 4)
+    assert (m1.width, m1.height) == (40.0, 30.0)
+    assert sorted(m1.page_positions) == [2, 4, 5]
+    assert not s1.page_positions
+
+
+def test_load_from_parts_list_failure_logs_traceback_at_debug(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture, tmp_path: Path
+) -> None:
+    """Test a parts list failure returns None and logs the stack at DEBUG."""
+    def fail(pdf_path: Path, doc: object = None) -> None:
+        raise RuntimeError("broken parts list")
+
+    monkeypatch.setattr(auto_loader, "parse_parts_list", fail)
+
+    with caplog.at_level(logging.DEBUG, logger=auto_loader.__name__):
+        assert DiagramAutoLoader._load_from_parts_list(tmp_path / "broken.pdf") is None
+
+    record, = caplog.records
+    assert record.levelno == logging.DEBUG
+    assert record.exc_info[1].args == ("broken parts list",)
@@ -451,6 +451,30 @@ class TestComponentLibrary:
             assert component is not None
             assert component.manufacturer_part_number == "3RT2026"
 
+    def test_save_matches_stdlib_json(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the orjson and stdlib writers produce the same file."""
+        import electrical_schematics.services.component_library as component_library
+
+        if not component_library.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        with TemporaryDirectory() as tmpdir:
+            library = ComponentLibrary(Path(tmpdir) / "library.json")
+            library.add_part(LibraryPart(
+                manufacturer_part_number="3RT2026",
+                manufacturer="Müller",
+                unit_price=12.5,
+                parameters={"Spannung": "24 V"},
+            ))
+
+            fast_path = Path(tmpdir) / "fast.json"
+            library.save(fast_path)
+            monkeypatch.setattr(component_library, "ORJSON_AVAILABLE", False)
+            stdlib_path = Path(tmpdir) / "stdlib.json"
+            library.save(stdlib_path)
+
+            assert fast_path.read_bytes() == stdlib_path.read_bytes()
+
     def test_load_nonexistent_file(self) -> None:
         """Test loading from a non-existent file."""
         with TemporaryDirectory() as tmpdir:
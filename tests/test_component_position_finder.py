@@ -1,5 +1,6 @@
 """Tests for component position finder module."""
 
+import fitz
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch, PropertyMock
@@ -30,6 +31,7 @@ def _make_mock_finder(**kwargs):
     finder.schematic_pages = kwargs.get("schematic_pages", (0, 25))
     finder._page_classifications = kwargs.get("_page_classifications", {})
     finder._page_skip_cache = kwargs.get("_page_skip_cache", {})
+    finder._shared_doc = kwargs.get("_shared_doc")
     return finder
 
 
@@ -570,6 +572,57 @@ class TestEdgeCases:
         # Calling close again should not raise
         finder.close()
 
+    def test_close_leaves_shared_document_open(self) -> None:
+        """Test a document passed in by the caller is not closed."""
+        mock_doc = MagicMock()
+        finder = ComponentPositionFinder(Path("/fake/path.pdf"), doc=mock_doc)
+
+        assert finder.doc is mock_doc
+        with finder:
+            pass
+
+        mock_doc.close.assert_not_called()
+        assert finder.doc is None
+
+
+class TestWordExtraction:
+    """Tests for word-based text extraction on generated PDFs."""
+
+    @pytest.fixture
+    def schematic_pdf(self, tmp_path: Path) -> Path:
+        """Write a one-page schematic with a tag, contacts and a title."""
+        path = tmp_path / "schematic.pdf"
+        doc = fitz.open()
+        page = doc.new_page(width=1193, height=795)
+        page.insert_text((100, 200), "-K1 Contactor")
+        page.insert_text((300, 400), "-K1.1 -K1.2")
+        page.insert_text((700, 765), "Cable diagram")
+        doc.save(path)
+        doc.close()
+        return path
+
+    def test_tag_bbox_covers_word_only(self, schematic_pdf: Path) -> None:
+        """Test a tag followed by other text on the same span is found alone."""
+        with ComponentPositionFinder(schematic_pdf, schematic_pages=(0, 1)) as finder:
+            positions = finder._extract_positions_from_page(0, {"-K1"}, {})
+
+        k1, = positions["-K1"]
+        assert k1.confidence == 1.0
+        assert k1.x < 130
+
+    def test_contact_instances_in_one_span(self, schematic_pdf: Path) -> None:
+        """Test contact references sharing a span are found separately."""
+        with ComponentPositionFinder(schematic_pdf, schematic_pages=(0, 1)) as finder:
+            finder._page_skip_cache[0] = False
+            contacts = finder.find_contact_positions("-K1")
+
+        assert sorted(contacts) == [".1", ".2"]
+
+    def test_classify_page_keeps_multi_word_title(self, schematic_pdf: Path) -> None:
+        """Test the title block title is read as a whole phrase."""
+        with fitz.open(schematic_pdf) as doc:
+            assert classify_page(doc[0]) == "Cable diagram"
+
 
 class TestFindPositions:
     """Tests for the main find_positions method."""
@@ -592,25 +645,19 @@ class TestFindPositions:
             if page_num == 0:
                 # Page with device tag text
                 def get_text_side_effect(fmt=None, **kwargs):
+                    if fmt == "words":
+                        return [
+                            (100, 200, 130, 215, "-K1", 0, 0, 0),
+                            (200, 300, 230, 315, "-K2", 0, 0, 1),
+                        ]
                     if fmt == "dict":
-                        return {
-                            "blocks": [{
-                                "type": 0,
-                                "lines": [{
-                                    "spans": [{
-                                        "text": "-K1",
-                                        "bbox": (100, 200, 130, 215)
-                                    }, {
-                                        "text": "-K2",
-                                        "bbox": (200, 300, 230, 315)
-                                    }]
-                                }]
-                            }]
-                        }
+                        return {"blocks": []}
                     return "Schematic page with components"
                 mock_page.get_text.side_effect = get_text_side_effect
             else:
                 def get_text_empty(fmt=None, **kwargs):
+                    if fmt == "words":
+                        return []
                     if fmt == "dict":
                         return {"blocks": []}
                     return "Empty page"
@@ -659,22 +706,16 @@ class TestFindPositions:
             if page_num in (0, 2):
                 # Both pages have -K1
                 def get_text_with_k1(fmt=None, **kwargs):
+                    if fmt == "words":
+                        return [(100, 200, 130, 215, "-K1", 0, 0, 0)]
                     if fmt == "dict":
-                        return {
-                            "blocks": [{
-                                "type": 0,
-                                "lines": [{
-                                    "spans": [{
-                                        "text": "-K1",
-                                        "bbox": (100, 200, 130, 215)
-                                    }]
-                                }]
-                            }]
-                        }
+                        return {"blocks": []}
                     return "Schematic page"
                 mock_page.get_text.side_effect = get_text_with_k1
             else:
                 def get_text_empty(fmt=None, **kwargs):
+                    if fmt == "words":
+                        return []
                     if fmt == "dict":
                         return {"blocks": []}
                     return "Empty page"
@@ -1,13 +1,18 @@
 """Tests for industrial component models."""
 
-import pytest
 from electrical_schematics.models import (
+    ContactBlock,
+    ContactType,
+    CoilTerminals,
     IndustrialComponent,
     IndustrialComponentType,
+    LibraryPart,
     SensorState,
     WiringDiagram,
     Wire,
-    PagePosition
+    WirePoint,
+    PagePosition,
+    TerminalPosition
 )
 
 
@@ -254,3 +259,269 @@ def test_page_position_default_confidence() -> None:
     )
 
     assert pos.confidence == 1.0
+
+
+def test_diagram_component_lookup_tracks_list_changes() -> None:
+    """Test id/designation lookups follow appends, reassignment and renames."""
+    diagram = WiringDiagram(name="test")
+    k1 = IndustrialComponent(id="c1", type=IndustrialComponentType.RELAY, designation="-K1")
+    k2 = IndustrialComponent(id="c2", type=IndustrialComponentType.RELAY, designation="-K2")
+
+    diagram.add_component(k1)
+    diagram.components.append(k2)
+
+    assert diagram.get_component("c2") is k2
+    assert diagram.get_component_by_designation("-K1") is k1
+
+    diagram.components = [k2]
+    assert diagram.get_component("c1") is None
+
+    k2.designation = "-K20"
+    assert diagram.get_component_by_designation("-K20") is k2
+    assert diagram.get_component_by_designation("-K2") is None
+
+    k3 = IndustrialComponent(id="c3", type=IndustrialComponentType.RELAY, designation="-K3")
+    diagram.components[0] = k3
+    assert diagram.get_component("c3") is k3
+    assert diagram.get_component_by_designation("-K3") is k3
+
+
+def test_diagram_lookup_keeps_first_duplicate() -> None:
+    """Test duplicate designations resolve to the first component."""
+    first = IndustrialComponent(id="a", type=IndustrialComponentType.RELAY, designation="-K1")
+    second = IndustrialComponent(id="b", type=IndustrialComponentType.RELAY, designation="-K1")
+    diagram = WiringDiagram(name="test", components=[first, second])
+
+    assert diagram.get_component_by_designation("-K1") is first
+
+
+def test_diagram_wires_for_component() -> None:
+    """Test wires are found from either endpoint."""
+    diagram = WiringDiagram(name="test")
+    w1 = Wire(id="W1", from_component_id="K1", to_component_id="K2")
+    w2 = Wire(id="W2", from_component_id="K2", to_component_id="K3")
+
+    diagram.add_wire(w1)
+    diagram.wires.append(w2)
+
+    assert list(diagram.get_wires_for_component("K2")) == [w1, w2]
+    assert list(diagram.get_wires_for_component("K3")) == [w2]
+    assert list(diagram.get_wires_for_component("K9")) == []
+
+
+def test_diagram_wire_changes_keep_component_index() -> None:
+    """Test adding wires only touches the incidence index."""
+    k1 = IndustrialComponent(id="K1", type=IndustrialComponentType.RELAY, designation="-K1")
+    diagram = WiringDiagram(name="test", components=[k1])
+    by_id = diagram._by_id
+
+    diagram.wires.append(Wire(id="W1", from_component_id="K1", to_component_id="K2"))
+    diagram.add_wire(Wire(id="W2", from_component_id="K1", to_component_id="K3"))
+
+    assert diagram.get_component("K1") is k1
+    assert diagram._by_id is by_id
+    assert [w.id for w in diagram.get_wires_for_component("K1")] == ["W1", "W2"]
+
+
+def test_display_description_cleanup_and_refresh() -> None:
+    """Test display description strips page/duplicate noise and follows edits."""
+    component = IndustrialComponent(
+        id="K1",
+        type=IndustrialComponentType.CONTACTOR,
+        designation="-K1",
+        description="Motor contactor -K1 -K1  Page 12"
+    )
+
+    assert component.page == 11
+    assert component.get_display_description() == "Motor contactor -K1"
+    assert component.get_display_description(10) == "Motor c..."
+
+    component.description = "Spindle contactor"
+    assert component.get_display_description() == "Spindle contactor"
+
+
+def test_contacts_by_type_follow_contact_changes() -> None:
+    """Test per-type contact lists track added, replaced and retyped contacts."""
+    relay = IndustrialComponent(id="K1", type=IndustrialComponentType.RELAY, designation="-K1")
+    assert relay.get_contact_string() == "1NO"
+
+    relay.add_contact("21", "22", ContactType.NC)
+    assert [c.terminal_from for c in relay.get_nc_contacts()] == ["21"]
+    assert relay.get_contact_string() == "1NO + 1NC"
+
+    relay.contact_blocks = [ContactBlock("31", "32", ContactType.NC)]
+    assert relay.get_no_contacts() == []
+    assert relay.get_contact_string() == "1NC"
+
+    relay.contact_blocks[0].contact_type = ContactType.NO
+    assert relay.get_nc_contacts() == []
+    assert relay.get_contact_string() == "1NO"
+
+
+def test_contact_state_follows_coil_by_type() -> None:
+    """Test NO/changeover contacts follow the coil and NC contacts invert it."""
+    relay = IndustrialComponent(
+        id="K1", type=IndustrialComponentType.RELAY, designation="-K1", contact_blocks=[
+            ContactBlock("13", "14", ContactType.NO),
+            ContactBlock("21", "22", ContactType.NC),
+            ContactBlock("11", "12", ContactType.CHANGEOVER),
+        ]
+    )
+
+    relay.energize_coil()
+    assert [c.is_closed for c in relay.contact_blocks] == [True, False, True]
+
+    relay.de_energize_coil()
+    assert [c.is_closed for c in relay.contact_blocks] == [False, True, False]
+    assert relay.contact_blocks[1].get_state_for_coil(False) is True
+
+
+def test_diagram_update_contact_states_matches_components() -> None:
+    """Test the diagram-wide update agrees with per-component updates."""
+    relays = [
+        IndustrialComponent(id=f"K{i}", type=IndustrialComponentType.RELAY, designation=f"-K{i}")
+        for i in range(150)
+    ]
+    for i, relay in enumerate(relays):
+        relay.add_contact("21", "22", ContactType.NC)
+        relay.coil_energized = i % 3 == 0
+    diagram = WiringDiagram(name="bank", components=relays)
+
+    diagram.update_contact_states()
+
+    for relay in relays:
+        expected = [c.get_state_for_coil(relay.coil_energized) for c in relay.contact_blocks]
+        assert [c.is_closed for c in relay.contact_blocks] == expected
+
+    # Contacts added later are picked up on the next update
+    extra = relays[0].add_contact("31", "32", ContactType.NC)
+    diagram.update_contact_states()
+    assert extra.is_closed is False
+
+
+def test_model_records_use_slots() -> None:
+    """Test the high-volume model records carry no per-instance dict."""
+    records = [
+        ContactBlock("13", "14", ContactType.NO),
+        CoilTerminals(),
+        PagePosition(page=1, x=0.0, y=0.0, width=1.0, height=1.0),
+        IndustrialComponent(id="K1", type=IndustrialComponentType.RELAY, designation="-K1"),
+        WiringDiagram(name="test"),
+        LibraryPart(manufacturer_part_number="3RT2026"),
+        Wire(id="W1"),
+        WirePoint(x=0.0, y=0.0),
+        TerminalPosition(position=1),
+    ]
+
+    for record in records:
+        assert not hasattr(record, "__dict__")
+
+
+def test_add_page_position_tracks_best_confidence() -> None:
+    """Test the primary position follows the best confidence incrementally."""
+    component = IndustrialComponent(
+        id="K1",
+        type=IndustrialComponentType.CONTACTOR,
+        designation="-K1"
+    )
+
+    component.add_page_position(page=2, x=10.0, y=10.0, width=5.0, height=5.0, confidence=0.9)
+    component.add_page_position(page=4, x=40.0, y=40.0, width=5.0, height=5.0, confidence=0.5)
+    assert component.page == 2
+
+    # Re-adding the best page with a lower score lets the next match win
+    component.add_page_position(page=2, x=10.0, y=10.0, width=5.0, height=5.0, confidence=0.1)
+    component.add_page_position(page=6, x=60.0, y=60.0, width=5.0, height=5.0, confidence=0.6)
+    assert component.page == 6
+    assert component.x == 60.0
+
+
+def test_page_bitmask_matches_page_positions() -> None:
+    """Test get_pages/is_on_page agree with page_positions for any insertion order."""
+    component = IndustrialComponent(
+        id="K1",
+        type=IndustrialComponentType.CONTACTOR,
+        designation="-K1",
+        page_positions={70: PagePosition(page=70, x=1.0, y=1.0, width=5.0, height=5.0)}
+    )
+
+    for page in (12, 3, 12, 0):
+        component.add_page_position(page=page, x=1.0, y=1.0, width=5.0, height=5.0)
+
+    assert component.get_pages() == [0, 3, 12, 70]
+    assert component.is_on_page(70)
+    assert component.is_on_page(0)
+    assert not component.is_on_page(4)
+    assert not component.is_on_page(-1)
+
+
+def test_lookup_keys_are_interned() -> None:
+    """Test equal designations, IDs and part numbers share one string object."""
+    first = IndustrialComponent(id="".join(["K", "1"]), type=IndustrialComponentType.RELAY,
+                                designation="".join(["-K", "1"]))
+    second = IndustrialComponent(id="".join(["K", "1"]), type=IndustrialComponentType.RELAY,
+                                 designation="".join(["-K", "1"]))
+    part1 = LibraryPart(manufacturer_part_number=" 3rt2026 ")
+    part2 = LibraryPart(manufacturer_part_number="3RT2026")
+
+    assert first.id is second.id
+    assert first.designation is second.designation
+    assert part1.manufacturer_part_number is part2.manufacturer_part_number
+
+
+def test_contact_designation_cache_follows_edits() -> None:
+    """Test cached contact designations are reused and refreshed on edits."""
+    contact = ContactBlock("13", "14", ContactType.NO)
+
+    first = contact.get_designation("K1")
+    assert first == "K1:13-14"
+    assert contact.get_designation("K1") is first
+    assert contact.get_designation() == "13-14"
+
+    contact.terminal_to = "18"
+    assert contact.get_designation("K1") == "K1:13-18"
+
+    contact.label = "K1:aux"
+    assert contact.get_designation("K1") == "K1:aux"
+
+
+def test_terminal_labels_follow_contact_and_coil_edits() -> None:
+    """Test terminal labels reflect added contacts and in-place coil edits."""
+    relay = IndustrialComponent(id="K1", type=IndustrialComponentType.RELAY, designation="-K1")
+
+    assert relay.get_terminal_labels() == frozenset({"13", "14", "A1", "A2"})
+
+    relay.add_contact("21", "22", ContactType.NC)
+    assert relay.get_terminal_labels() == frozenset({"13", "14", "21", "22", "A1", "A2"})
+
+    assert relay.coil_terminals is not None
+    relay.coil_terminals.positive = "B1"
+    assert "B1" in relay.get_terminal_labels()
+    assert "A1" not in relay.get_terminal_labels()
+
+
+def test_diagram_role_lists_track_components() -> None:
+    """Test power source and sensor lists follow added and appended components."""
+    ps = IndustrialComponent(id="PS1", type=IndustrialComponentType.POWER_24VDC, designation="-G1")
+    s1 = IndustrialComponent(id="S1", type=IndustrialComponentType.LIMIT_SWITCH, designation="-S1")
+    k1 = IndustrialComponent(id="K1", type=IndustrialComponentType.RELAY, designation="-K1")
+    diagram = WiringDiagram(name="test", components=[k1])
+
+    diagram.add_component(ps)
+    diagram.components.append(s1)
+
+    assert diagram.get_power_sources() == [ps]
+    assert diagram.get_sensors() == [s1]
+
+    k1.type = IndustrialComponentType.PUSH_BUTTON
+    diagram.reindex()
+    assert diagram.get_sensors() == [k1, s1]
+
+
+def test_contact_state_follows_contact_type_change() -> None:
+    """Test reassigning contact_type changes how the contact follows the coil."""
+    contact = ContactBlock("13", "14", ContactType.NO)
+    assert contact.get_state_for_coil(True) is True
+
+    contact.contact_type = ContactType.NC
+    assert contact.get_state_for_coil(True) is False
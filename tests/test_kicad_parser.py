@@ -0,0 +1,141 @@
+"""Tests for the KiCad schematic parser."""
+
+from pathlib import Path
+
+import pytest
+
+from electrical_schematics.models import ComponentType
+from electrical_schematics.parsers.kicad_parser import KiCadParser, parse_sexpr
+
+SAMPLE = '''(kicad_sch (version 20230121) (generator eeschema)
+  (lib_symbols
+    (symbol "Device:R" (property "Reference" "R" (at 0 0 0)))
+  )
+  (symbol (lib_id "Device:R") (at 100.33 50.8 90) (unit 1)
+    (property "Reference" "R1" (at 0 0 0))
+    (property "Value" "10k" (at 0 0 0))
+  )
+  (symbol (lib_id "Device:C") (at 20 30) (unit 1)
+    (property "Reference" "C1" (at 0 0 0))
+    (property "Value" "100n \\"X7R\\"" (at 0 0 0))
+  )
+  (symbol (lib_id "power:GND") (at 0 0 0) (unit 1)
+    (property "Reference" "#PWR01" (at 0 0 0))
+    (property "Value" "GND" (at 0 0 0))
+  )
+)
+'''
+
+
+def test_parse_sexpr_nested() -> None:
+    """Test atoms, strings and nested lists are built in order."""
+    tree = parse_sexpr('(a "b c" (d 1 2) ())')
+
+    assert tree == ["a", "b c", ["d", "1", "2"], []]
+
+
+def test_parse_sexpr_unescapes_strings() -> None:
+    """Test escaped quotes inside strings do not end the token."""
+    assert parse_sexpr(r'(p "say \"hi\"")') == ["p", 'say "hi"']
+
+
+def test_parse_sexpr_deep_nesting() -> None:
+    """Test nesting beyond the recursion limit parses."""
+    depth = 5000
+    tree = parse_sexpr("(" * depth + ")" * depth)
+
+    for _ in range(depth - 1):
+        tree = tree[0]
+    assert tree == []
+
+
+@pytest.mark.parametrize("text", ["(a (b)", "(a))", ""])
+def test_parse_sexpr_rejects_malformed(text: str) -> None:
+    """Test unbalanced or empty input raises ValueError."""
+    with pytest.raises(ValueError):
+        parse_sexpr(text)
+
+
+def test_parse_extracts_placed_symbols(tmp_path: Path) -> None:
+    """Test placed symbols become components and library symbols are skipped."""
+    path = tmp_path / "board.kicad_sch"
+    path.write_text(SAMPLE, encoding="utf-8")
+
+    schematic = KiCadParser().parse(path)
+
+    assert schematic.name == "board"
+    assert len(schematic.components) == 3
+    r1 = schematic.get_component("R1")
+    assert r1.type == ComponentType.RESISTOR
+    assert r1.value == "10k"
+    assert (r1.x, r1.y, r1.rotation) == (100.33, 50.8, 90.0)
+    c1 = schematic.get_component("C1")
+    assert c1.type == ComponentType.CAPACITOR
+    assert c1.value == '100n "X7R"'
+    assert schematic.components[2].type == ComponentType.GROUND
+
+
+MULTI_UNIT = '''(kicad_sch (version 20230121) (generator eeschema)
+  (symbol (lib_id "Amplifier_Operational:LM358") (at 10 10 0) (unit 1)
+    (property "Reference" "U1" (at 0 0 0))
+  )
+  (symbol (lib_id "Amplifier_Operational:LM358") (at 40 10 0) (unit 2)
+    (property "Reference" "U1" (at 0 0 0))
+  )
+  (symbol (lib_id "Device:LED") (at 70 10 0) (unit 1)
+    (property "Reference" "LED1" (at 0 0 0))
+  )
+  (symbol (lib_id "Connector:TestPoint") (at 90 10 0) (unit 1)
+    (property "Reference" "TP1" (at 0 0 0))
+  )
+  (symbol (lib_id "Device:FerriteBead") (at 110 10 0) (unit 1)
+    (property "Reference" "FB1" (at 0 0 0))
+  )
+)
+'''
+
+
+def test_parse_multi_unit_symbols_and_prefixes(tmp_path: Path) -> None:
+    """Test units of one part get distinct ids and multi-letter prefixes classify."""
+    path = tmp_path / "amp.kicad_sch"
+    path.write_text(MULTI_UNIT, encoding="utf-8")
+
+    schematic = KiCadParser().parse(path)
+
+    assert [c.id for c in schematic.components] == ["U1A", "U1B", "LED1", "TP1", "FB1"]
+    assert schematic.get_component("U1B").reference == "U1"
+    assert schematic.get_component("U1B").x == 40.0
+    assert schematic.get_component("LED1").type == ComponentType.DIODE
+    assert schematic.get_component("TP1").type == ComponentType.CONNECTOR
+    assert schematic.get_component("FB1").type == ComponentType.INDUCTOR
+
+
+def test_parse_rejects_non_kicad(tmp_path: Path) -> None:
+    """Test a file that is not a kicad_sch expression raises ValueError."""
+    path = tmp_path / "other.kicad_sch"
+    path.write_text("(not_kicad)", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        KiCadParser().parse(path)
+
+
+def test_parse_missing_file(tmp_path: Path) -> None:
+    """Test a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        KiCadParser().parse(tmp_path / "missing.kicad_sch")
+
+
+def test_parse_sexpr_accepts_bytes() -> None:
+    """Test UTF-8 bytes parse the same as text, including non-ASCII strings."""
+    text = '(property "Value" "4.7kΩ")'
+
+    assert parse_sexpr(text.encode("utf-8")) == parse_sexpr(text) == ["property", "Value", "4.7kΩ"]
+
+
+def test_parse_empty_file(tmp_path: Path) -> None:
+    """Test an empty file raises ValueError rather than an mmap error."""
+    path = tmp_path / "empty.kicad_sch"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError):
+        KiCadParser().parse(path)
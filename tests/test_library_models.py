@@ -1,5 +1,7 @@
 """Tests for the new library data models (LibraryPart and ProjectComponent)."""
 
+import json
+
 import pytest
 from datetime import datetime
 
@@ -138,6 +140,10 @@ class TestLibraryPart:
         assert part1 != part3
         assert hash(part1) == hash(part2)
 
+        part3.manufacturer_part_number = part1.manufacturer_part_number
+        assert part3 == part1
+        assert hash(part3) == hash(part1)
+
     def test_get_display_name(self) -> None:
         """Test display name generation."""
         part1 = LibraryPart(
@@ -163,6 +169,76 @@ class TestLibraryPart:
         assert "Siemens" in str_repr
         assert "Contactor AC-3" in str_repr
 
+    def test_from_dict_uses_defaults_for_missing_fields(self) -> None:
+        """Test sparse dictionaries fill in defaults and parse timestamps."""
+        part = LibraryPart.from_dict({
+            "manufacturer_part_number": "3rt2026",
+            "created_at": "2024-01-02T03:04:05",
+            "unknown_field": "ignored",
+        })
+
+        assert part.manufacturer_part_number == "3RT2026"
+        assert part.manufacturer == ""
+        assert part.parameters == {}
+        assert part.created_at == datetime(2024, 1, 2, 3, 4, 5)
+        assert isinstance(part.updated_at, datetime)
+
+        with pytest.raises(KeyError):
+            LibraryPart.from_dict({"manufacturer": "Siemens"})
+
+    def test_to_dict_follows_edits(self) -> None:
+        """Test serialization reflects direct field edits and DigiKey updates."""
+        part = LibraryPart(manufacturer_part_number="3RT2026-1DB40-1AAO")
+
+        first = part.to_dict()
+        first["manufacturer"] = "mutated by caller"
+        assert part.to_dict()["manufacturer"] == ""
+
+        part.notes = "spare in cabinet 2"
+        part.tags.append("contactor")
+        assert part.to_dict()["notes"] == "spare in cabinet 2"
+        assert part.to_dict()["tags"] == ["contactor"]
+
+        part.update_from_digikey({"manufacturer": "Siemens", "unit_price": "12.5"})
+        data = part.to_dict()
+
+        assert data["manufacturer"] == "Siemens"
+        assert data["unit_price"] == 12.5
+        assert data["updated_at"] == part.updated_at.isoformat()
+
+    def test_new_part_timestamps_are_set(self) -> None:
+        """Test timestamps default to datetimes and loaded parts share one."""
+        part = LibraryPart(manufacturer_part_number="3RT2026-1DB40-1AAO")
+        assert isinstance(part.created_at, datetime)
+        assert part.created_at <= part.updated_at
+
+        loaded = LibraryPart.from_dict({"manufacturer_part_number": "3RT2026-1DB40-1AAO"})
+        assert loaded.created_at is loaded.updated_at
+
+    def test_bulk_load_shares_timestamp(self) -> None:
+        """Test parts loaded in one batch share a single fallback timestamp."""
+        parts = LibraryPart.bulk_load([
+            {"manufacturer_part_number": "PART1"},
+            {"manufacturer_part_number": "PART2", "created_at": "2024-01-02T03:04:05"},
+        ])
+
+        assert [p.manufacturer_part_number for p in parts] == ["PART1", "PART2"]
+        assert parts[0].created_at is parts[0].updated_at
+        assert parts[1].updated_at is parts[0].updated_at
+        assert parts[1].created_at == datetime(2024, 1, 2, 3, 4, 5)
+
+    def test_bulk_load_parses_repeated_timestamps_once(self) -> None:
+        """Test identical timestamp strings resolve to one shared datetime."""
+        stamp = "2024-01-02T03:04:05"
+        parts = LibraryPart.bulk_load([
+            {"manufacturer_part_number": "PART1", "created_at": stamp, "updated_at": stamp},
+            {"manufacturer_part_number": "PART2", "created_at": stamp, "updated_at": stamp},
+        ])
+
+        assert parts[0].created_at == datetime(2024, 1, 2, 3, 4, 5)
+        assert parts[0].created_at is parts[0].updated_at
+        assert parts[1].created_at is parts[0].created_at
+
 
 class TestProjectComponent:
     """Tests for the ProjectComponent model."""
@@ -284,6 +360,38 @@ class TestProjectComponent:
 
         assert pages == [3, 5, 10]  # Sorted
 
+    def test_get_all_pages_follows_position_changes(self) -> None:
+        """Test cached pages track add_position, list edits and the primary page."""
+        component = ProjectComponent.from_dict({
+            "project_id": "test.pdf",
+            "device_tag": "-K1",
+            "manufacturer_part_number": "PART",
+            "additional_positions": [{"page": 7, "x": 1.0, "y": 1.0}],
+        })
+        assert component.get_all_pages() == [7]
+
+        component.add_position(page=2, x=1.0, y=1.0)
+        assert component.get_all_pages() == [2, 7]
+
+        component.additional_positions.pop()
+        component.page, component.x = 4, 10.0
+        assert component.get_all_pages() == [4, 7]
+
+        component.additional_positions = []
+        assert component.get_all_pages() == [4]
+
+    def test_get_position_for_page_returns_first_match(self) -> None:
+        """Test indexed page lookup keeps the first position on a page."""
+        component = ProjectComponent(
+            project_id="test.pdf", device_tag="-K1", manufacturer_part_number="PART"
+        )
+        component.add_position(page=2, x=10.0, y=10.0)
+        component.add_position(page=2, x=20.0, y=20.0)
+        component.additional_positions.insert(0, {"page": 2, "x": 5.0, "y": 5.0})
+
+        assert component.get_position_for_page(2)["x"] == 5.0
+        assert component.get_position_for_page(9) is None
+
     def test_get_position_for_page(self) -> None:
         """Test getting position for a specific page."""
         component = ProjectComponent(
@@ -310,6 +418,25 @@ class TestProjectComponent:
         pos99 = component.get_position_for_page(99)
         assert pos99 is None
 
+    def test_get_position_for_page_follows_primary_changes(self) -> None:
+        """Test the primary position reflects moves and caller edits don't leak."""
+        component = ProjectComponent(
+            project_id="test.pdf",
+            device_tag="-K1",
+            manufacturer_part_number="PART",
+            page=5,
+            x=100.0,
+            y=200.0,
+        )
+
+        first = component.get_position_for_page(5)
+        first["x"] = 0.0
+        assert component.get_position_for_page(5)["x"] == 100.0
+
+        component.x = 120.0
+
+        assert component.get_position_for_page(5)["x"] == 120.0
+
     def test_assign_terminal(self) -> None:
         """Test terminal assignment."""
         component = ProjectComponent(
@@ -358,6 +485,107 @@ class TestProjectComponent:
         assert component2.terminal_assignments == component.terminal_assignments
         assert len(component2.additional_positions) == 1
 
+    def test_from_dict_matches_constructor(self) -> None:
+        """Test the fast from_dict path restores every field."""
+        component = ProjectComponent(
+            project_id="DRAWER.pdf",
+            device_tag="-K1",
+            manufacturer_part_number="3RT2026-1DB40-1AAO",
+            designation="Main Contactor",
+            voltage_level="24VDC",
+        )
+        component.assign_terminal("A1", "+24V")
+
+        restored = ProjectComponent.from_dict(component.to_dict())
+
+        assert restored.to_dict() == component.to_dict()
+
+    def test_containers_are_per_component(self) -> None:
+        """Test each component gets its own writable assignments and wires."""
+        first = ProjectComponent(project_id="P", device_tag="-K1", manufacturer_part_number="A")
+        second = ProjectComponent(project_id="P", device_tag="-K2", manufacturer_part_number="A")
+
+        first.terminal_assignments["A1"] = "+24V"
+        first.connected_wires.append("W1")
+
+        assert first.terminal_assignments == {"A1": "+24V"}
+        assert first.connected_wires == ["W1"]
+        assert second.terminal_assignments == {}
+        assert second.connected_wires == []
+
+    def test_to_json_matches_to_dict(self) -> None:
+        """Test the JSON shortcut writes the to_dict layout and round-trips."""
+        component = ProjectComponent(
+            project_id="DRAWER.pdf",
+            device_tag="-K1",
+            manufacturer_part_number="3RT2026-1DB40-1AAO",
+        )
+        component.add_position(page=10, x=150.0, y=250.0)
+        hash(component)  # Populate private caches; they must not be written
+
+        assert json.loads(component.to_json()) == component.to_dict()
+        restored = ProjectComponent.from_json(component.to_json())
+        assert restored.to_dict() == component.to_dict()
+
+    def test_new_component_timestamps_are_set(self) -> None:
+        """Test timestamps default to datetimes on creation."""
+        component = ProjectComponent(
+            project_id="DRAWER.pdf", device_tag="-K1", manufacturer_part_number="P1"
+        )
+
+        assert isinstance(component.created_at, datetime)
+        assert component.created_at <= component.updated_at
+
+    def test_shared_strings_are_interned(self) -> None:
+        """Test project ids and part numbers are interned on both creation paths."""
+        built = ProjectComponent(
+            project_id="".join(["DRAWER", ".pdf"]),
+            device_tag="-K1",
+            manufacturer_part_number="3rt2026",
+        )
+        loaded = ProjectComponent.from_dict({
+            "project_id": "".join(["DRAWER", ".pdf"]),
+            "device_tag": "-K2",
+            "manufacturer_part_number": "".join(["3RT", "2026"]),
+        })
+
+        assert built.project_id is loaded.project_id
+        assert built.manufacturer_part_number is loaded.manufacturer_part_number
+
+    def test_from_dict_sparse_data(self) -> None:
+        """Test from_dict fills defaults and requires key fields."""
+        data = {"project_id": "DRAWER.pdf", "device_tag": "-K1", "manufacturer_part_number": "P1"}
+
+        first = ProjectComponent.from_dict(data)
+        second = ProjectComponent.from_dict(data)
+
+        assert first.width == 40.0
+        assert first.initial_state == "unknown"
+        assert first.terminal_assignments == {}
+        assert first.terminal_assignments is not second.terminal_assignments
+        assert first.created_at is first.updated_at
+
+        with pytest.raises(KeyError):
+            ProjectComponent.from_dict({"project_id": "DRAWER.pdf", "device_tag": "-K1"})
+
+    def test_from_dict_normalizes_and_validates(self) -> None:
+        """Test from_dict normalizes fields and rejects empty required ones."""
+        component = ProjectComponent.from_dict({
+            "project_id": "DRAWER.pdf",
+            "device_tag": " -K1 ",
+            "manufacturer_part_number": "3rt2026",
+        })
+
+        assert component.device_tag == "-K1"
+        assert component.manufacturer_part_number == "3RT2026"
+
+        with pytest.raises(ValueError):
+            ProjectComponent.from_dict({
+                "project_id": "DRAWER.pdf",
+                "device_tag": "",
+                "manufacturer_part_number": "3RT2026",
+            })
+
     def test_get_unique_id(self) -> None:
         """Test unique ID generation."""
         component = ProjectComponent(
@@ -390,6 +618,19 @@ class TestProjectComponent:
         assert comp1 != comp3  # Different project
         assert hash(comp1) == hash(comp2)
 
+    def test_hash_matches_between_creation_paths(self) -> None:
+        """Test constructed and loaded components hash and compare alike."""
+        built = ProjectComponent(
+            project_id="DRAWER.pdf", device_tag=" -K1 ", manufacturer_part_number="P1"
+        )
+        loaded = ProjectComponent.from_dict(built.to_dict())
+
+        assert hash(built) == hash(loaded) == hash(("DRAWER.pdf", "-K1"))
+        assert {built: 1}[loaded] == 1
+
+        loaded.device_tag = "-K2"
+        assert hash(loaded) == hash(("DRAWER.pdf", "-K2"))
+
     def test_str_representation(self) -> None:
         """Test string representation."""
         component = ProjectComponent(
@@ -0,0 +1,62 @@
+"""Tests for the msgspec wire structs of project components and terminal strips."""
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+from electrical_schematics.models import ProjectComponent, TerminalStrip, TerminalStripType
+from electrical_schematics.models.structs import (
+    decode_project_components,
+    decode_terminal_strips,
+    encode_project_components,
+    encode_terminal_strips,
+)
+
+
+def test_project_components_round_trip() -> None:
+    """Test encoded components decode to identical field values."""
+    component = ProjectComponent(
+        project_id="DRAWER.pdf",
+        device_tag="-K1",
+        manufacturer_part_number="3RT2026-1DB40-1AAO",
+        designation="Main Contactor",
+    )
+    component.assign_terminal("A1", "+24V")
+    component.add_position(page=3, x=10.0, y=20.0)
+
+    restored = decode_project_components(encode_project_components([component]))
+
+    assert len(restored) == 1
+    assert restored[0].to_dict() == component.to_dict()
+
+
+def test_terminal_strips_round_trip() -> None:
+    """Test encoded strips keep enums, terminals and timestamps."""
+    strip = TerminalStrip(
+        designation="X10",
+        terminal_type=TerminalStripType.MULTI_LEVEL,
+        position_count=2,
+        level_count=3,
+        has_disconnect=True
+    )
+
+    restored = decode_terminal_strips(encode_terminal_strips([strip]))[0]
+
+    assert restored == strip
+    assert restored.terminal_type is TerminalStripType.MULTI_LEVEL
+    assert [t.terminal_number for t in restored.terminals] == [
+        t.terminal_number for t in strip.terminals
+    ]
+
+
+def test_encoded_component_matches_to_dict() -> None:
+    """Test the struct encoding carries the same keys as to_dict."""
+    import json
+
+    component = ProjectComponent(
+        project_id="DRAWER.pdf", device_tag="-K1", manufacturer_part_number="P1"
+    )
+
+    encoded = json.loads(encode_project_components([component]))[0]
+
+    assert encoded == component.to_dict()
@@ -1,5 +1,8 @@
 """Tests for data models."""
 
+import subprocess
+import sys
+
 import pytest
 from electrical_schematics.models import Component, ComponentType, Connection, Pin, Schematic
 
@@ -29,6 +32,22 @@ def test_connection_creation() -> None:
     assert conn.net_name == "VCC"
 
 
+def test_schematic_records_use_slots() -> None:
+    """Test component, pin and connection records carry no per-instance dict."""
+    pin1 = Pin(component_id="R1", pin_number="1")
+    pin2 = Pin(component_id="C1", pin_number="1")
+    records = [
+        Component(id="R1", type=ComponentType.RESISTOR),
+        pin1,
+        Connection(id="net1", from_pin=pin1, to_pin=pin2),
+    ]
+
+    for record in records:
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.unknown_field = True
+
+
 def test_schematic_get_component() -> None:
     """Test getting a component from a schematic."""
     schematic = Schematic(name="test")
@@ -41,3 +60,59 @@ def test_schematic_get_component() -> None:
 
     not_found = schematic.get_component("R2")
     assert not_found is None
+
+
+def test_schematic_connections_for_component() -> None:
+    """Test connections are found from either endpoint and follow edits."""
+    schematic = Schematic(name="test")
+    r1 = Component(id="R1", type=ComponentType.RESISTOR)
+    schematic.add_component(r1)
+    conn1 = Connection(id="n1", from_pin=Pin("R1", "1"), to_pin=Pin("C1", "1"))
+    conn2 = Connection(id="n2", from_pin=Pin("C1", "2"), to_pin=Pin("D1", "1"))
+
+    schematic.add_connection(conn1)
+    schematic.connections.append(conn2)
+
+    assert schematic.get_connections_for_component("C1") == [conn1, conn2]
+    assert schematic.get_connections_for_component("D1") == [conn2]
+    assert schematic.get_connections_for_component("X9") == []
+
+    grouped = schematic.get_all_connections_by_component()
+    assert grouped == {"R1": [conn1], "C1": [conn1, conn2], "D1": [conn2]}
+    grouped["C1"].clear()
+    assert schematic.get_connections_for_component("C1") == [conn1, conn2]
+
+    conn2.to_pin = Pin("E1", "1")
+    assert schematic.get_connections_for_component("E1") == [conn2]
+    assert schematic.get_connections_for_component("D1") == []
+
+    r1.id = "R10"
+    assert schematic.get_component("R10") is r1
+    assert schematic.get_component("R1") is None
+
+    c1 = Component(id="C1", type=ComponentType.CAPACITOR)
+    schematic.components[0] = c1
+    assert schematic.get_component("C1") is c1
+
+
+def test_models_package_imports_lazily() -> None:
+    """Test importing one model does not load the other model modules."""
+    code = (
+        "import sys\n"
+        "from electrical_schematics.models import Wire\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('electrical_schematics.models.'))\n"
+        "print(','.join(loaded))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "electrical_schematics.models.wire"
+
+
+def test_models_package_unknown_attribute() -> None:
+    """Test unknown names still raise AttributeError."""
+    import electrical_schematics.models as models
+
+    with pytest.raises(AttributeError):
+        _ = models.NotAModel
@@ -1,5 +1,8 @@
 """Unit tests for terminal strip functionality."""
 
+import json
+import re
+
 import pytest
 from datetime import datetime
 
@@ -9,7 +12,10 @@ from electrical_schematics.models.terminal_strip import (
     TerminalColor,
     TerminalPosition
 )
-from electrical_schematics.gui.terminal_strip_icon import TerminalStripIconGenerator
+from electrical_schematics.gui.terminal_strip_icon import (
+    TerminalStripIconGenerator,
+    generate_preview_grid
+)
 
 
 class TestTerminalPosition:
@@ -188,6 +194,44 @@ class TestTerminalStrip:
         assert terminal.position == 2
         assert terminal.level == 2
 
+    def test_generated_terminals_share_numbers_not_objects(self):
+        """Test identical strips share number strings but own their terminals."""
+        first = TerminalStrip(designation="X1", terminal_type=TerminalStripType.FEED_THROUGH,
+                              position_count=12)
+        second = TerminalStrip(designation="X2", terminal_type=TerminalStripType.FEED_THROUGH,
+                               position_count=12)
+
+        assert first.terminals[11].terminal_number is second.terminals[11].terminal_number
+        assert first.terminals[0] is not second.terminals[0]
+
+        first.terminals[0].has_led = True
+        assert second.terminals[0].has_led is False
+
+    def test_terminal_lookup_follows_terminal_changes(self):
+        """Test terminal lookups see appended, replaced and renumbered terminals."""
+        strip = TerminalStrip(
+            designation="X1",
+            terminal_type=TerminalStripType.FEED_THROUGH,
+            position_count=2
+        )
+        assert strip.get_terminal(3) is None
+
+        extra = TerminalPosition(position=3, terminal_number="PE")
+        strip.terminals.append(extra)
+        assert strip.get_terminal(3) is extra
+        assert strip.get_terminal_by_number("PE") is extra
+
+        extra.terminal_number = "N"
+        assert strip.get_terminal_by_number("N") is extra
+        assert strip.get_terminal_by_number("PE") is None
+
+        extra.position = 4
+        assert strip.get_terminal(3) is None
+        assert strip.get_terminal(4) is extra
+
+        strip.terminals = []
+        assert strip.get_terminal(1) is None
+
     def test_get_display_name(self):
         """Test display name generation."""
         strip = TerminalStrip(
@@ -297,6 +341,74 @@ class TestTerminalStrip:
         assert restored.position_count == original.position_count
         assert restored.level_count == original.level_count
         assert len(restored.terminals) == len(original.terminals)
+        assert restored == original
+        assert restored.terminals[0].terminal_number == "1.1"
+
+    def test_to_dict_follows_terminal_edits(self):
+        """Test to_dict reflects terminal edits and returns fresh dicts."""
+        strip = TerminalStrip(
+            designation="X1",
+            terminal_type=TerminalStripType.FEED_THROUGH,
+            position_count=2
+        )
+
+        first = strip.to_dict()
+        first["terminals"][0]["terminal_number"] = "edited by caller"
+        assert strip.to_dict()["terminals"][0]["terminal_number"] == "1"
+
+        strip.terminals[0].has_led = True
+        strip.terminals[1].terminal_number = "N"
+        terminals = strip.to_dict()["terminals"]
+        assert terminals[0]["has_led"] is True
+        assert terminals[1]["terminal_number"] == "N"
+
+        strip.terminals.append(TerminalPosition(position=3))
+        assert len(strip.to_dict()["terminals"]) == 3
+
+        strip.created_at = datetime(2024, 1, 2, 3, 4, 5)
+        assert strip.to_dict()["created_at"] == "2024-01-02T03:04:05"
+
+    def test_to_json_matches_to_dict(self):
+        """Test the JSON shortcut writes the to_dict layout and round-trips."""
+        strip = TerminalStrip(
+            designation="X2",
+            terminal_type=TerminalStripType.LED_INDICATOR,
+            position_count=3,
+            color=TerminalColor.BLUE
+        )
+        strip.to_dict()  # Populate private caches; they must not be written
+
+        assert json.loads(strip.to_json()) == strip.to_dict()
+        assert TerminalStrip.from_json(strip.to_json()) == strip
+
+    def test_from_dict_rejects_unknown_enum_values(self):
+        """Test unknown type and color values still raise ValueError."""
+        data = {"designation": "X1", "terminal_type": "feed_through", "position_count": 2}
+
+        assert TerminalStrip.from_dict({**data, "color": "blue"}).color == TerminalColor.BLUE
+        with pytest.raises(ValueError):
+            TerminalStrip.from_dict({**data, "terminal_type": "bogus"})
+        with pytest.raises(ValueError):
+            TerminalStrip.from_dict({**data, "color": "purple"})
+
+    def test_from_dict_fills_missing_terminals(self):
+        """Test sparse dictionaries still get generated terminals and type features."""
+        strip = TerminalStrip.from_dict({
+            "designation": "F1",
+            "terminal_type": "led_indicator",
+            "position_count": 3,
+            "terminals": [],
+        })
+
+        assert [t.terminal_number for t in strip.terminals] == ["1", "2", "3"]
+        assert strip.has_led
+        assert strip.led_voltage == "24VDC"
+        assert strip == TerminalStrip(
+            designation="F1",
+            terminal_type=TerminalStripType.LED_INDICATOR,
+            position_count=3,
+            created_at=strip.created_at,
+        )
 
     def test_string_representation(self):
         """Test string representation."""
@@ -423,6 +535,48 @@ class TestTerminalStripIconGenerator:
         svg = TerminalStripIconGenerator.generate_svg(strip)
         assert 'id="led-indicators"' in svg
 
+    def test_multi_level_led_indicators_align_with_positions(self):
+        """Test LEDs on multi-level strips are drawn at their position's center."""
+        strip = TerminalStrip(
+            designation="X41",
+            terminal_type=TerminalStripType.LED_INDICATOR,
+            position_count=2,
+            level_count=2,
+            has_led=True
+        )
+
+        svg = TerminalStripIconGenerator.generate_svg(strip)
+        led_group = svg.split('id="led-indicators"')[1].split('</g>')[0]
+        led_xs = [float(x) for x in re.findall(r'cx="([\d.]+)"', led_group)]
+        # LEDs sit 5 units right of each position center (10, 30)
+        assert led_xs == [15.0, 35.0]
+
+    def test_led_indicators_only_for_led_terminals(self):
+        """Test only terminals flagged with an LED get an indicator."""
+        terminals = [
+            TerminalPosition(position=1, has_led=True, led_color="green"),
+            TerminalPosition(position=2),
+            TerminalPosition(position=3, has_led=True),
+        ]
+        strip = TerminalStrip(
+            designation="X42",
+            terminal_type=TerminalStripType.FEED_THROUGH,
+            position_count=3,
+            has_led=True,
+            terminals=terminals
+        )
+
+        svg = TerminalStripIconGenerator.generate_svg(strip)
+        led_group = svg.split('id="led-indicators"')[1].split('</g>')[0]
+        assert re.findall(r'cx="([\d.]+)"', led_group) == ["15", "55"]
+        assert 'fill="green"' in led_group
+
+        # LEDs switched on after construction are drawn too
+        strip.terminals[1].has_led = True
+        svg = TerminalStripIconGenerator.generate_svg(strip)
+        led_group = svg.split('id="led-indicators"')[1].split('</g>')[0]
+        assert re.findall(r'cx="([\d.]+)"', led_group) == ["15", "35", "55"]
+
     def test_svg_fuse_indicators(self):
         """Test fuse indicators in SVG."""
         strip = TerminalStrip(
@@ -474,6 +628,29 @@ class TestTerminalStripIconGenerator:
         assert '<svg' in svg
         assert '</svg>' in svg
 
+    def test_generate_for_library_reuses_cached_svg(self):
+        """Test identical strips share a cached library icon."""
+        strip_a = TerminalStrip(
+            designation="X7",
+            terminal_type=TerminalStripType.FEED_THROUGH,
+            position_count=3
+        )
+        strip_b = TerminalStrip(
+            designation="X7",
+            terminal_type=TerminalStripType.FEED_THROUGH,
+            position_count=3
+        )
+
+        svg_a = TerminalStripIconGenerator.generate_for_library(strip_a)
+        svg_b = TerminalStripIconGenerator.generate_for_library(strip_b)
+        assert svg_a is svg_b
+
+        # Changing the strip must not return the stale icon
+        strip_b.designation = "X8"
+        svg_changed = TerminalStripIconGenerator.generate_for_library(strip_b)
+        assert "X8" in svg_changed
+        assert "X8" not in svg_a
+
     def test_generate_for_schematic(self):
         """Test schematic placement generation."""
         strip = TerminalStrip(
@@ -486,6 +663,25 @@ class TestTerminalStripIconGenerator:
         assert '<svg' in svg
         assert '</svg>' in svg
 
+    def test_generate_preview_grid(self):
+        """Test preview grid has one item per strip with its icon."""
+        strips = [
+            TerminalStrip(
+                designation=f"X{i}",
+                terminal_type=TerminalStripType.FEED_THROUGH,
+                position_count=i
+            )
+            for i in range(1, 4)
+        ]
+
+        html = generate_preview_grid(strips)
+
+        assert html.count('<div class="item">') == 3
+        assert html.count('<svg') == 3
+        for strip in strips:
+            assert f"<h3>{strip.get_display_name()}</h3>" in html
+        assert html.endswith('</div></body></html>')
+
 
 class TestTerminalStripLibrary:
     """Test terminal strip library integration."""
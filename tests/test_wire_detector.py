@@ -1,9 +1,13 @@
 """Tests for visual wire detector and wire path generation."""
 
+from unittest.mock import MagicMock
+
+import fitz
 
 from electrical_schematics.pdf.visual_wire_detector import (
     ColorClassifier,
     VisualWire,
+    VisualWireDetector,
     WireColor,
     WirePath,
     WirePathGenerator,
@@ -389,13 +393,22 @@ class TestWirePathGenerator:
         # Should still return valid path
         assert len(path) == 2
 
+    def test_path_function_by_style(self) -> None:
+        """Test routing styles resolve to their generators."""
+        assert WirePathGenerator.path_function("l_path") == WirePathGenerator.generate_l_path
+        assert WirePathGenerator.path_function("smooth") == WirePathGenerator.generate_smooth_path
+        straight = WirePathGenerator.generate_straight_line
+        assert WirePathGenerator.path_function("unknown") == straight
+        path = WirePathGenerator.path_function("manhattan")(0, 0, 100, 10)
+        assert path == WirePathGenerator.generate_manhattan_path(0, 0, 100, 10)
+
 
 class TestLineClassifier:
     """Tests for LineClassifier (wire discrimination)."""
 
     def test_border_detection_top(self) -> None:
         """Test detection of top border line."""
-        from electrical_schematics.pdf.visual_wire_detector import LineClassifier, LineType
+        from electrical_schematics.pdf.visual_wire_detector import LineClassifier
 
         classifier = LineClassifier(page_width=600, page_height=800)
 
@@ -510,6 +523,48 @@ class TestVisualWireDetectorWithClassification:
         pass
 
 
+class TestVisualWireDetectorCache:
+    """Tests for per-page caching of detected segments."""
+
+    def _make_detector(self) -> VisualWireDetector:
+        """Create a detector over a one-page mock document with one red line."""
+        page = MagicMock()
+        page.get_drawings.return_value = [{
+            "items": [("l", fitz.Point(100, 100), fitz.Point(300, 100))],
+            "color": (1.0, 0.0, 0.0),
+            "width": 1.0,
+        }]
+        doc = MagicMock()
+        doc.__len__.return_value = 1
+        doc.__getitem__.return_value = page
+        return VisualWireDetector(doc)
+
+    def test_page_drawings_read_once(self) -> None:
+        """Test wires, paths and statistics share one get_drawings() call."""
+        detector = self._make_detector()
+        page = detector.doc[0]
+
+        wires = detector.detect_wires(0)
+        paths = detector.detect_and_trace_paths(0)
+        stats = detector.get_wire_statistics(0)
+
+        assert len(wires) == 1
+        assert len(paths) == 1
+        assert stats["total_count"] == 1
+        assert page.get_drawings.call_count == 1
+
+    def test_cached_wires_are_copied(self) -> None:
+        """Test callers cannot change the cached list, and clear_cache rereads."""
+        detector = self._make_detector()
+
+        detector.detect_wires(0).clear()
+        assert len(detector.detect_wires(0)) == 1
+
+        detector.clear_cache()
+        detector.detect_wires(0)
+        assert detector.doc[0].get_drawings.call_count == 2
+
+
 class TestWirePath:
     """Tests for WirePath dataclass."""
 
@@ -0,0 +1,245 @@
+"""Tests for the wire drawing tool."""
+
+import pytest
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from electrical_schematics.gui.wire_tool import WireDrawingTool
+from electrical_schematics.models import IndustrialComponent, IndustrialComponentType
+
+
+def _make_component(comp_id: str) -> IndustrialComponent:
+    """Create a minimal relay component."""
+    return IndustrialComponent(
+        id=comp_id,
+        designation=comp_id,
+        type=IndustrialComponentType.RELAY
+    )
+
+
+@pytest.fixture
+def tool() -> WireDrawingTool:
+    """Create a wire tool with the default terminal radius."""
+    return WireDrawingTool()
+
+
+def test_find_terminal_at_hit(tool: WireDrawingTool) -> None:
+    """Test a click within the radius finds the terminal."""
+    k1 = _make_component("K1")
+    terminal_positions = {"K1": [QPointF(100, 100), QPointF(100, 200)]}
+
+    component, idx = tool._find_terminal_at(QPointF(110, 195), [k1], terminal_positions)
+
+    assert component is k1
+    assert idx == 1
+
+
+def test_find_terminal_at_miss(tool: WireDrawingTool) -> None:
+    """Test a click outside the radius finds nothing."""
+    k1 = _make_component("K1")
+    terminal_positions = {"K1": [QPointF(100, 100)]}
+
+    component, idx = tool._find_terminal_at(QPointF(100, 121), [k1], terminal_positions)
+
+    assert component is None
+    assert idx is None
+
+
+def test_find_terminal_at_prefers_nearest(tool: WireDrawingTool) -> None:
+    """Test the nearest terminal wins when several are in range."""
+    k1 = _make_component("K1")
+    k2 = _make_component("K2")
+    terminal_positions = {
+        "K1": [QPointF(100, 100)],
+        "K2": [QPointF(115, 100)],
+    }
+
+    component, idx = tool._find_terminal_at(
+        QPointF(112, 100), [k1, k2], terminal_positions
+    )
+
+    assert component is k2
+    assert idx == 0
+
+
+def test_find_terminal_at_ignores_unknown_components(tool: WireDrawingTool) -> None:
+    """Test terminals of components not in the component list are skipped."""
+    k1 = _make_component("K1")
+    terminal_positions = {
+        "K1": [QPointF(100, 100)],
+        "K9": [QPointF(105, 100)],
+    }
+
+    component, idx = tool._find_terminal_at(QPointF(105, 100), [k1], terminal_positions)
+
+    assert component is k1
+    assert idx == 0
+
+
+def test_find_terminal_at_rebuilds_for_new_positions(tool: WireDrawingTool) -> None:
+    """Test a new terminal positions dict is re-indexed."""
+    k1 = _make_component("K1")
+
+    tool._find_terminal_at(QPointF(0, 0), [k1], {"K1": [QPointF(0, 0)]})
+    component, idx = tool._find_terminal_at(
+        QPointF(500, 500), [k1], {"K1": [QPointF(500, 500)]}
+    )
+
+    assert component is k1
+    assert idx == 0
+
+
+def test_find_terminal_at_negative_coordinates(tool: WireDrawingTool) -> None:
+    """Test terminals just across the origin are found."""
+    k1 = _make_component("K1")
+    terminal_positions = {"K1": [QPointF(-5, -5)]}
+
+    component, idx = tool._find_terminal_at(QPointF(5, 5), [k1], terminal_positions)
+
+    assert component is k1
+    assert idx == 0
+
+
+def test_terminal_radius_updates_hit_range(tool: WireDrawingTool) -> None:
+    """Test changing the radius takes effect on the next hit test."""
+    k1 = _make_component("K1")
+    terminal_positions = {"K1": [QPointF(100, 100)]}
+
+    tool.terminal_radius = 5.0
+    assert tool._find_terminal_at(QPointF(110, 100), [k1], terminal_positions) == (None, None)
+
+    tool.terminal_radius = 10.0
+    assert tool._find_terminal_at(QPointF(110, 100), [k1], terminal_positions) == (k1, 0)
+
+
+def test_find_terminal_at_dense_neighbourhood(tool: WireDrawingTool) -> None:
+    """Test hit testing among many nearby terminals picks the nearest."""
+    components = [_make_component(f"K{i}") for i in range(100)]
+    terminal_positions = {
+        comp.id: [QPointF(100 + (i % 10) * 3, 100 + (i // 10) * 3)]
+        for i, comp in enumerate(components)
+    }
+
+    component, idx = tool._find_terminal_at(QPointF(113.2, 121.1), components, terminal_positions)
+
+    # Nearest grid point is (112, 121) -> i = 4 + 7 * 10
+    assert component is components[74]
+    assert idx == 0
+
+
+def test_complete_wire_builds_path_through_waypoints(tool: WireDrawingTool) -> None:
+    """Test a completed wire runs start terminal -> waypoints -> end terminal."""
+    k1 = _make_component("K1")
+    k2 = _make_component("K2")
+    terminal_positions = {
+        "K1": [QPointF(0, 0)],
+        "K2": [QPointF(300, 300)],
+    }
+    completed = []
+    tool.wire_completed.connect(completed.append)
+
+    assert tool.handle_click(QPointF(0, 0), [k1, k2], terminal_positions)
+    tool.handle_click(QPointF(150, 0), [k1, k2], terminal_positions)
+    tool.handle_click(QPointF(150, 300), [k1, k2], terminal_positions)
+    tool.handle_click(QPointF(300, 300), [k1, k2], terminal_positions)
+
+    assert len(completed) == 1
+    wire = completed[0]
+    assert [(p.x, p.y) for p in wire.path] == [(0, 0), (150, 0), (150, 300), (300, 300)]
+    assert wire.from_component_id == "K1"
+    assert wire.to_component_id == "K2"
+    assert not tool.is_drawing()
+
+
+def test_completed_wires_get_unique_ids(tool: WireDrawingTool) -> None:
+    """Test wires with identical path lengths still get distinct IDs."""
+    k1 = _make_component("K1")
+    k2 = _make_component("K2")
+    terminal_positions = {
+        "K1": [QPointF(0, 0)],
+        "K2": [QPointF(300, 300)],
+    }
+    completed = []
+    tool.wire_completed.connect(completed.append)
+
+    for _ in range(2):
+        tool.handle_click(QPointF(0, 0), [k1, k2], terminal_positions)
+        tool.handle_click(QPointF(300, 300), [k1, k2], terminal_positions)
+
+    assert len(completed) == 2
+    assert completed[0].id != completed[1].id
+
+
+def test_status_messages_are_coalesced(qapp, tool: WireDrawingTool) -> None:
+    """Test a burst of waypoint clicks emits only the latest status."""
+    k1 = _make_component("K1")
+    terminal_positions = {"K1": [QPointF(0, 0)]}
+    messages = []
+    tool.state_changed.connect(messages.append)
+
+    tool.handle_click(QPointF(0, 0), [k1], terminal_positions)
+    for i in range(1, 4):
+        tool.handle_click(QPointF(100 * i, 0), [k1], terminal_positions)
+    assert messages == []
+
+    qapp.processEvents()
+
+    assert len(messages) == 1
+    assert messages[0].startswith("Added waypoint 3")
+
+
+def test_render_preview_scales_to_screen(qapp, tool: WireDrawingTool) -> None:
+    """Test the preview is drawn in PDF space scaled by the zoom level."""
+    k1 = _make_component("K1")
+    terminal_positions = {"K1": [QPointF(0, 0)]}
+    tool.handle_click(QPointF(0, 0), [k1], terminal_positions)
+    tool.handle_click(QPointF(10, 10), [k1], terminal_positions)
+    tool.handle_mouse_move(QPointF(40, 10))
+
+    image = QImage(200, 100, QImage.Format_ARGB32)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    tool.render_preview(painter, 1.0)
+    painter.end()
+
+    # Waypoint (10, 10) and cursor (40, 10) map to (20, 20) and (80, 20)
+    assert any(image.pixelColor(x, 20).alpha() > 0 for x in range(40, 60))
+    assert image.pixelColor(20, 20).alpha() > 0
+    assert image.pixelColor(50, 60) == QColor(Qt.transparent)
+
+
+def test_render_preview_starts_at_terminal(qapp, tool: WireDrawingTool) -> None:
+    """Test the preview path includes the start terminal when positions are given."""
+    k1 = _make_component("K1")
+    terminal_positions = {"K1": [QPointF(10, 40)]}
+    tool.handle_click(QPointF(10, 40), [k1], terminal_positions)
+    tool.handle_mouse_move(QPointF(40, 40))
+
+    image = QImage(200, 100, QImage.Format_ARGB32)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    tool.render_preview(painter, 1.0, terminal_positions)
+    painter.end()
+
+    # Terminal (10, 40) to cursor (40, 40) spans x = 20..80 at y = 80
+    assert any(image.pixelColor(x, 80).alpha() > 0 for x in range(24, 32))
+    assert image.pixelColor(120, 80) == QColor(Qt.transparent)
+
+
+def test_render_preview_reuses_polygon_buffer(qapp, tool: WireDrawingTool) -> None:
+    """Test repeated repaints refill the same preview polygon."""
+    k1 = _make_component("K1")
+    terminal_positions = {"K1": [QPointF(0, 0)]}
+    tool.handle_click(QPointF(0, 0), [k1], terminal_positions)
+    tool.handle_click(QPointF(10, 10), [k1], terminal_positions)
+    buffer = tool._preview_poly
+
+    image = QImage(100, 100, QImage.Format_ARGB32)
+    painter = QPainter(image)
+    for x in (20, 30):
+        tool.handle_mouse_move(QPointF(x, 10))
+        tool.render_preview(painter, 1.0, terminal_positions)
+    painter.end()
+
+    assert tool._preview_poly is buffer
+    assert [(p.x(), p.y()) for p in buffer] == [(0, 0), (10, 10), (30, 10)]